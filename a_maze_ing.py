@@ -6,40 +6,39 @@
 # Updated: 2026/01/28 09:44:42
 
 import sys
-# from maze_generator import MazeGenerator
-# from maze_renderer import MazeRenderer
-from ascii_renderer import AsciiRenderer
+from maze_config import MazeConfig
+from profiler import Profiler
 
 """
 Entry point of the A-Maze-Ing program.
 
 This module parses command-line arguments and launches the
 appropriate maze renderer based on the configuration file.
+The config file is parsed once and the renderer modules are only
+imported when their display mode is used, to keep startup short.
 """
 
 
-def check_display(config_file: str) -> str:
+def get_profiler(args: list[str]) -> Profiler:
     """
-    Read the configuration file and extract the display mode.
+    Remove the --profile[=MODE] flag from the arguments.
 
     Args:
-        config_file (str): Path to the configuration file.
+        args (list[str]): Command-line arguments, modified in place.
 
     Returns:
-        str: the whole string wrote by the user.
+        Profiler: Enabled if the flag was given, the PROFILE config key
+        can still enable it otherwise.
     """
-    try:
-        with open(config_file, "r") as f:
-            content = f.readlines()
-    except Exception as e:
-        print(f"Error: {e}")
-    display = ""
-    for line in content:
-        line = line.upper()
-        if "DISPLAY" in line:
-            line = line.split("=")
-            display = line[1].upper().strip()
-    return display
+    for arg in args:
+        if arg == "--profile" or arg.startswith("--profile="):
+            args.remove(arg)
+            mode = arg.partition("=")[2] or "ON"
+            try:
+                return Profiler(mode)
+            except ValueError as e:
+                print(f"Error: {e}")
+    return Profiler()
 
 
 def main() -> None:
@@ -49,23 +48,27 @@ def main() -> None:
     This function selects the appropriate renderer based on the
     configuration file and starts the maze display.
     """
-    if len(sys.argv) == 1:
-        print(1)
-        # renderer = MazeRenderer()
-    elif len(sys.argv) == 2:
-        config_file: str = sys.argv[1]
-        display = check_display(config_file)
-        if display == "MLX":
-            print("mlx")
-            # renderer = MazeRenderer(config_file)
-        else:
-            ascii_d = AsciiRenderer(config_file)
-            ascii_d.main()
-
-    else:
-        print("Usage: python3 a_maze_ing.py config_file(optional)")
+    args = sys.argv[1:]
+    profiler = get_profiler(args)
+    if len(args) > 1:
+        print("Usage: python3 a_maze_ing.py config_file(optional) "
+              "[--profile[=ON|CPROFILE|TRACEMALLOC|ALL]]")
         return
 
+    with profiler.phase("config"):
+        config = MazeConfig.load(args[0] if args else None)
+    if config.display == "MLX":
+        try:
+            from maze_renderer import MazeRenderer
+        except ImportError as e:
+            print(f"Error: {e}\nSwitching to ASCII display")
+        else:
+            MazeRenderer(config, profiler)
+            return
+    from ascii_renderer import AsciiRenderer
+    ascii_d = AsciiRenderer(config, profiler)
+    ascii_d.main()
+
 
 if __name__ == "__main__":
     main()
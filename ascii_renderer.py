@@ -5,7 +5,14 @@
 # Created: 2026/01/23 16:09:10
 # Updated: 2026/01/28 16:09:10
 
+from __future__ import annotations
+from typing import TYPE_CHECKING
+from maze_config import MazeConfig
 from maze_generator import MazeGenerator
+from profiler import Profiler
+
+if TYPE_CHECKING:
+    from maze_pool import MazePool
 
 
 class AsciiRenderer:
@@ -13,21 +20,29 @@ class AsciiRenderer:
     Render a maze in the terminal using ASCII characters.
     """
 
-    def __init__(self, config: str) -> None:
+    def __init__(self, config: str | MazeConfig,
+                 profiler: Profiler | None = None) -> None:
         """
         Initialize the ASCII renderer.
 
         Args:
-            config (str): Name of the configuration file.
+            config (str | MazeConfig): Parsed settings or name of the
+                configuration file.
+            profiler (Profiler | None): Times the phases of the run,
+                enabled by --profile or the PROFILE config key.
         """
         self.name: str = ""
-        self.config: str = config
+        self.config: str | MazeConfig = config
         self.maze_height: int = 0
         self.maze_width: int = 0
         self.maze: str = ""
         self.entry: tuple = ()
         self.exit: tuple = ()
         self.path: str = ""
+        self.pool: MazePool | None = None
+        self.profiler: Profiler = (
+                profiler if profiler is not None else Profiler()
+                )
 
     @staticmethod
     def show_menu() -> None:
@@ -63,10 +78,44 @@ class AsciiRenderer:
         Generate a maze and display it.
 
         This method creates a maze using MazeGenerator and renders it
-        in ASCII format.
+        in ASCII format until the user quits.
+        """
+        self.load_maze(self.next_maze())
+        self.display_ascii()
+
+    def next_maze(self) -> MazeGenerator:
+        """
+        Generate the next maze to display.
+
+        The first maze is generated right away, the next ones are taken
+        from the pool generating them ahead of time.
+
+        Returns:
+            MazeGenerator: The generated maze, already exported.
+        """
+        if self.pool is None:
+            maze = MazeGenerator(self.config, profiler=self.profiler)
+            maze.generate_maze()
+            if maze.pool_depth:
+                from maze_pool import MazePool
+                self.pool = MazePool(self.config, maze.seed,
+                                     maze.pool_depth, maze.pool_worker)
+        else:
+            with self.profiler.phase("next_maze"):
+                maze = self.pool.get()
+                maze.export_to_txt()
+        return maze
+
+    def load_maze(self, maze: MazeGenerator) -> None:
+        """
+        Keep only what the display needs from a generated maze.
+
+        The previous maze is released, so that regenerating all day
+        does not make the memory grow.
+
+        Args:
+            maze (MazeGenerator): The maze to display.
         """
-        maze = MazeGenerator(self.config)
-        maze.generate_maze()
         self.name = maze.output_file
         self.maze_height = maze.rows
         self.maze_width = maze.cols
@@ -74,7 +123,6 @@ class AsciiRenderer:
         self.entry = maze.entry
         self.exit = maze.exit
         self.path = maze.path
-        self.display_ascii()
 
     def coordinates_path(self) -> list[tuple[int, int]]:
         """
@@ -147,6 +195,9 @@ class AsciiRenderer:
     def display_ascii(self) -> None:
         """
         Display the maze and handle user interactions.
+
+        Regenerating a maze stays in the same loop instead of calling
+        main() again, so the call stack does not grow.
         """
         show_path = False
         wall_colors = ["\033[27m", "\033[33m", "\033[32m", "\033[36m"]
@@ -158,10 +209,11 @@ class AsciiRenderer:
         print("Scroll up for configuration and errors feedback")
         while True:
             wall_color = wall_colors[acc_color % 4]
-            if show_path:
-                self.display_maze(True, wall_color)
-            else:
-                self.display_maze(False, wall_color)
+            with self.profiler.phase("render"):
+                if show_path:
+                    self.display_maze(True, wall_color)
+                else:
+                    self.display_maze(False, wall_color)
 
             # commands available and catch if not
             self.show_menu()
@@ -172,8 +224,12 @@ class AsciiRenderer:
                     choice, wrong = self.get_choice()
                 print("\033[2J")
             if choice == '1':
-                self.main()
-                break
+                self.load_maze(self.next_maze())
+                show_path = False
+                acc_color = 0
+                print("\033[2J")
+                print("\033[H")
+                print("Scroll up for configuration and errors feedback")
             elif choice == '2':
                 print("\033[2J")
                 print("\033[H")
@@ -184,4 +240,8 @@ class AsciiRenderer:
                 acc_color += 1
             elif choice == '4':
                 print("Bye! Thanks for playing ~")
+                if self.pool is not None:
+                    self.pool.close()
+                if self.profiler.enabled:
+                    print(f"Profile written to {self.profiler.write()}")
                 break
@@ -0,0 +1,87 @@
+#!/usr/bin/env python3
+# File: benchmarks/batch.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/20 11:48:06
+# Updated: 2026/02/20 11:48:06
+
+"""
+Mazes per second of the batch engine against a MazeGenerator loop.
+
+The loop builds, carves, solves and exports one MazeGenerator per seed,
+as a script generating many mazes would; the batch engine carves, solves
+and exports the same number of mazes of the same size in one batch per
+algorithm. Both write their files into a temporary directory.
+
+Usage: python3 benchmarks/batch.py [--size 15x10] [--count N]
+           [--loop N] [--algorithm WILSON]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from maze_batch import ALGORITHMS, MazeBatch  # noqa: E402
+from maze_config import MazeConfig  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+
+
+def loop_rate(width: int, height: int, algorithm: str, count: int,
+              directory: str) -> float:
+    """Mazes per second of a MazeGenerator per seed."""
+    config = MazeConfig.from_settings({
+        "WIDTH": str(width), "HEIGHT": str(height),
+        "EXIT": f"{width - 1},{height - 1}", "ALGORITHM": algorithm,
+        "OUTPUT_FILE": os.path.join(directory, "maze.txt"),
+        })
+    start = time.perf_counter()
+    for seed in range(count):
+        maze = MazeGenerator(config, verbose=False)
+        maze.seed = seed
+        maze.generate_maze()
+    return count / (time.perf_counter() - start)
+
+
+def batch_rate(width: int, height: int, algorithm: str, count: int,
+               directory: str) -> float:
+    """Mazes per second of one batch, export included."""
+    start = time.perf_counter()
+    batch = MazeBatch(count, width, height)
+    batch.generate(algorithm, seed=0)
+    batch.export(os.path.join(directory, "mazes.txt"))
+    return count / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Time the loop and every batch algorithm."""
+    parser = argparse.ArgumentParser(description="Batch engine throughput")
+    parser.add_argument("--size", default="15x10",
+                        help="maze size as WIDTHxHEIGHT")
+    parser.add_argument("--count", type=int, default=20000,
+                        help="mazes per batch")
+    parser.add_argument("--loop", type=int, default=500,
+                        help="mazes of the MazeGenerator loop")
+    parser.add_argument("--algorithm", default="WILSON",
+                        help="algorithm of the MazeGenerator loop")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.split("x"))
+    with tempfile.TemporaryDirectory() as directory:
+        reference = loop_rate(width, height, args.algorithm, args.loop,
+                              directory)
+        print(f"{'MazeGenerator ' + args.algorithm:>28}: "
+              f"{reference:9.0f} mazes/s")
+        for algorithm in ALGORITHMS:
+            rate = batch_rate(width, height, algorithm, args.count,
+                              directory)
+            print(f"{'batch ' + algorithm:>28}: {rate:9.0f} mazes/s "
+                  f"(x{rate / reference:.0f})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+# File: benchmarks/bench_division.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/21 15:40:18
+# Updated: 2026/02/21 15:40:18
+
+"""
+Carving time of ALGORITHM=DIVISION against the number of workers.
+
+A large seeded maze is carved with each number of workers; only the
+division is timed, not the creation of the cells nor the BFS. Every
+count must give the same maze, and the maze must be perfect: as many
+passages as valid cells minus one, every valid cell reached.
+
+Usage: python3 benchmarks/bench_division.py [--size 1000x1000] [--seed N]
+                 [--workers 1 2 4]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from division import recursive_division  # noqa: E402
+from maze_config import MazeConfig  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+
+
+def is_perfect(maze: MazeGenerator) -> bool:
+    """Check that the passages form a spanning tree of the valid cells."""
+    passages = sum(1 for row in maze.grid for cell in row
+                   for wall in (cell.walls["E"], cell.walls["S"])
+                   if not wall)
+    assert maze.entry_cell is not None
+    seen = {maze.entry_cell}
+    stack = [maze.entry_cell]
+    while stack:
+        cell = stack.pop()
+        for direction, wall in cell.walls.items():
+            neighbor = cell.get_neighbor(direction)
+            if not wall and neighbor is not None and neighbor not in seen:
+                seen.add(neighbor)
+                stack.append(neighbor)
+    return passages == maze.valid_cells - 1 and len(seen) == maze.valid_cells
+
+
+def main() -> None:
+    """Carve the maze with every worker count and compare."""
+    parser = argparse.ArgumentParser(description="DIVISION workers")
+    parser.add_argument("--size", default="1000x1000",
+                        help="maze size as WIDTHxHEIGHT")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--workers", nargs="+", type=int,
+                        default=[1, 2, os.cpu_count() or 1],
+                        help="DIVISION_WORKERS values to compare")
+    args = parser.parse_args()
+
+    width, height = args.size.split("x")
+    mazes: List[str] = []
+    reference = 0.0
+    for workers in dict.fromkeys(args.workers):
+        config = MazeConfig.from_settings({
+            "WIDTH": width, "HEIGHT": height, "SEED": str(args.seed),
+            "ALGORITHM": "DIVISION", "DIVISION_WORKERS": str(workers),
+            "EXIT": f"{int(width) - 1},{int(height) - 1}",
+            })
+        maze = MazeGenerator(config, verbose=False)
+        start = time.perf_counter()
+        recursive_division(maze)
+        elapsed = time.perf_counter() - start
+        reference = reference or elapsed
+        mazes.append(maze.hex_repr)
+        print(f"{workers:>3} workers: {elapsed:7.2f}s "
+              f"(x{reference / elapsed:.2f})")
+    if not is_perfect(maze):
+        print("Error: the maze is not perfect")
+        sys.exit(1)
+    if len(set(mazes)) > 1:
+        print("Error: the maze depends on the number of workers")
+        sys.exit(1)
+    print("OK: same perfect maze for every worker count")
+
+
+if __name__ == "__main__":
+    main()
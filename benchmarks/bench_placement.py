@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+# File: benchmarks/bench_placement.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/24 15:03:27
+# Updated: 2026/02/24 15:03:27
+
+"""
+Automatic entry and exit against the true diameter of the maze.
+
+On small mazes the diameter is found by a BFS from every cell. The
+automatic pair must reach it on perfect mazes, on the whole maze and
+on the border; on mazes with loops the distance found is reported as
+a part of it. Pairs drawn with AUTO_DISTANCE must be far enough apart.
+On a large maze the placement is timed against the generation and
+against one solve, the cost of each try when placing by hand.
+
+Usage: python3 benchmarks/bench_placement.py [--mazes N] [--size 30x20]
+                 [--large 300x300]
+"""
+
+import argparse
+import os
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from maze_config import MazeConfig  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+from placement import candidates, place_entry_exit, sweep  # noqa: E402
+
+
+def make(size: str, seed: int, perfect: bool,
+         extra: Dict[str, str]) -> MazeGenerator:
+    """Generate a maze with both points automatic."""
+    width, height = (int(v) for v in size.split("x"))
+    settings = {"WIDTH": str(width), "HEIGHT": str(height),
+                "SEED": str(seed), "PERFECT": str(perfect),
+                "ENTRY": "AUTO", "EXIT": "AUTO"}
+    settings.update(extra)
+    maze = MazeGenerator(MazeConfig.from_settings(settings), verbose=False)
+    maze.generate_maze(export=False)
+    return maze
+
+
+def brute_diameter(maze: MazeGenerator) -> int:
+    """Longest distance between two candidates, a BFS from each."""
+    walls = bytearray(maze.wall_bits(cell)
+                      for row in maze.grid for cell in row)
+    cells = candidates(maze)
+    best = 0
+    for cell in cells:
+        distance = sweep(walls, maze.cols, cell)
+        best = max(best, max(distance[c] for c in cells))
+    return best
+
+
+def main() -> None:
+    """Compare the pairs with the diameters and time the placement."""
+    parser = argparse.ArgumentParser(description="Automatic entry/exit")
+    parser.add_argument("--mazes", type=int, default=40)
+    parser.add_argument("--size", default="30x20",
+                        help="small maze size as WIDTHxHEIGHT")
+    parser.add_argument("--large", default="300x300",
+                        help="timed maze size as WIDTHxHEIGHT")
+    args = parser.parse_args()
+
+    failed = False
+    ratios: List[float] = []
+    for seed in range(args.mazes):
+        for perfect in (True, False):
+            for extra in ({}, {"AUTO_BORDER": "True"}):
+                maze = make(args.size, seed, perfect, extra)
+                found = len(maze.path)
+                best = brute_diameter(maze)
+                if perfect and found != best:
+                    print(f"Error: seed {seed} {extra} found {found} "
+                          f"steps, diameter {best}")
+                    failed = True
+                if not perfect:
+                    ratios.append(found / best)
+            half = best // 2
+            maze = make(args.size, seed, perfect,
+                        {"AUTO_DISTANCE": str(half)})
+            if len(maze.path) < half:
+                print(f"Error: seed {seed} pair {len(maze.path)} steps "
+                      f"apart, {half} asked")
+                failed = True
+    print(f"perfect: {args.mazes * 2} diameters checked, with loops: "
+          f"{min(ratios):.0%} of the diameter at worst, "
+          f"{sum(ratios) / len(ratios):.1%} on average")
+
+    for perfect in (True, False):
+        start = time.perf_counter()
+        maze = make(args.large, 0, perfect, {"ALGORITHM": "DIVISION"})
+        total = time.perf_counter() - start
+        start = time.perf_counter()
+        place_entry_exit(maze)
+        placed = time.perf_counter() - start
+        start = time.perf_counter()
+        maze.bfs()
+        solve = time.perf_counter() - start
+        print(f"{args.large} DIVISION perfect={perfect}: generation "
+              f"{total * 1000:7.1f}ms, placement {placed * 1000:6.1f}ms, "
+              f"one solve {solve * 1000:6.1f}ms, path {len(maze.path)}")
+    if failed:
+        sys.exit(1)
+    print("OK: automatic pairs reach the diameter of perfect mazes")
+
+
+if __name__ == "__main__":
+    main()
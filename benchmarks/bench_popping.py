@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+# File: benchmarks/bench_popping.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/19 10:03:48
+# Updated: 2026/02/19 10:03:48
+
+"""
+Generation time of the POPPING algorithm on large grids.
+
+POPPING redraws the arrows of every round as whole arrays and finds
+their cycles by pointer jumping over the cells drawn last, so its time
+follows the cycles popped rather than the rounds times the grid.
+Mazes of every size are generated for a few seeds; WILSON, which pops
+the same cycles one walk at a time, is timed on the sizes up to
+--wilson-max cells, beyond which it takes minutes.
+
+Usage: python3 benchmarks/bench_popping.py [--sizes 500x500 ...]
+           [--seeds N] [--wilson-max CELLS]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import List, Tuple
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from maze_config import MazeConfig  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+
+SIZES: List[str] = ["100x100", "200x200", "500x500", "600x400"]
+
+
+def generate(size: str, algorithm: str, seed: int) -> Tuple[float, int]:
+    """Generation time in seconds and popping rounds of one maze."""
+    width, height = size.split("x")
+    maze = MazeGenerator(MazeConfig.from_settings({
+        "WIDTH": width, "HEIGHT": height, "ALGORITHM": algorithm,
+        }), verbose=False)
+    maze.seed = seed
+    start = time.perf_counter()
+    metrics = maze.generate_maze(export=False, metrics=True)
+    elapsed = time.perf_counter() - start
+    assert metrics is not None
+    return elapsed, metrics.counters.get("popping_rounds", 0)
+
+
+def main() -> None:
+    """Time every size and print a line each."""
+    parser = argparse.ArgumentParser(description="POPPING generation")
+    parser.add_argument("--sizes", nargs="+", default=SIZES,
+                        help="maze sizes as WIDTHxHEIGHT")
+    parser.add_argument("--seeds", type=int, default=3)
+    parser.add_argument("--wilson-max", type=int, default=40000,
+                        help="largest maze, in cells, timed with WILSON")
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        width, height = (int(v) for v in size.split("x"))
+        runs = [generate(size, "POPPING", seed)
+                for seed in range(args.seeds)]
+        times = [elapsed for elapsed, _ in runs]
+        line = (f"{size:>9}: POPPING mean {statistics.mean(times):6.2f}s "
+                f"max {max(times):6.2f}s, "
+                f"{statistics.mean(r for _, r in runs):6.0f} rounds")
+        if width * height <= args.wilson_max:
+            wilson = statistics.mean(generate(size, "WILSON", seed)[0]
+                                     for seed in range(args.seeds))
+            line += (f", WILSON {wilson:6.2f}s "
+                     f"(x{wilson / statistics.mean(times):.0f})")
+        print(line, flush=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+# File: benchmarks/bench_region.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/22 15:02:44
+# Updated: 2026/02/22 15:02:44
+
+"""
+Cost of a region regeneration against the size of the maze.
+
+A region of the same size is carved again in mazes of growing size,
+and its time is compared with the generation of the whole maze: it
+must not grow with the maze. After every regeneration the patched
+output file must equal a full export, and the spliced path the path
+of a full BFS.
+
+Usage: python3 benchmarks/bench_region.py [--sizes 100x100 ...]
+                 [--region 30x30] [--algorithm DIVISION] [--repeat N]
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from typing import List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from maze_config import MazeConfig  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+
+SIZES: List[str] = ["100x100", "300x300", "600x600"]
+
+
+def main() -> None:
+    """Time the regenerations and check the file and the path."""
+    parser = argparse.ArgumentParser(description="Region regeneration")
+    parser.add_argument("--sizes", nargs="+", default=SIZES,
+                        help="maze sizes as WIDTHxHEIGHT")
+    parser.add_argument("--region", default="30x30",
+                        help="region size as WIDTHxHEIGHT")
+    parser.add_argument("--algorithm", default="DIVISION",
+                        help="algorithm of the mazes")
+    parser.add_argument("--repeat", type=int, default=10,
+                        help="regions carved per maze")
+    args = parser.parse_args()
+
+    rw, rh = (int(v) for v in args.region.split("x"))
+    failed = False
+    with tempfile.TemporaryDirectory() as directory:
+        output = os.path.join(directory, "maze.txt")
+        for size in args.sizes:
+            width, height = (int(v) for v in size.split("x"))
+            config = MazeConfig.from_settings({
+                "WIDTH": str(width), "HEIGHT": str(height), "SEED": "0",
+                "EXIT": f"{width - 1},{height - 1}",
+                "ALGORITHM": args.algorithm, "OUTPUT_FILE": output,
+                })
+            maze = MazeGenerator(config, verbose=False)
+            start = time.perf_counter()
+            maze.generate_maze()
+            full = time.perf_counter() - start
+
+            elapsed = 0.0
+            for k in range(args.repeat):
+                # regions spread along the diagonal
+                x = (width - rw) * k // max(args.repeat - 1, 1)
+                y = (height - rh) * k // max(args.repeat - 1, 1)
+                start = time.perf_counter()
+                maze.regenerate_region(x, y, rw, rh)
+                elapsed += time.perf_counter() - start
+                spliced = maze.path
+                maze.shortest_path(maze.bfs())
+                with open(output) as f:
+                    text = f.read()
+                ex, ey = maze.entry
+                xx, xy = maze.exit
+                expected = (f"{maze.hex_repr}\n{ex},{ey}\n{xx},{xy}\n"
+                            f"{maze.path}\n")
+                if spliced != maze.path or text != expected:
+                    print(f"Error: {size} region {x},{y} differs from a "
+                          f"full solve and export")
+                    failed = True
+            print(f"{size:>10}: full {full * 1000:8.1f}ms, "
+                  f"region {rw}x{rh} {elapsed * 1000 / args.repeat:6.1f}ms")
+    if failed:
+        sys.exit(1)
+    print("OK: patched files and spliced paths match a full solve")
+
+
+if __name__ == "__main__":
+    main()
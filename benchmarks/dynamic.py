@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# File: benchmarks/dynamic.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/23 14:26:40
+# Updated: 2026/02/23 14:26:40
+
+"""
+Single-wall edits repaired by the dynamic solver against a full BFS.
+
+A large maze is carved by recursive division straight into a wall
+array, without cells, and some walls are opened to make it imperfect.
+Random walls are then opened and closed one at a time; the repair of
+each edit is timed and compared with the full BFS the maze needed at
+the start. At the end the distances must equal those of a new BFS.
+
+Usage: python3 benchmarks/dynamic.py [--size 2000x2000] [--edits N]
+           [--loops N] [--seed N]
+"""
+
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from division import divide, reconnect, walled_grid  # noqa: E402
+from dynamic_solver import BITS, OPPOSITE, DynamicSolver  # noqa: E402
+from maze_config import MazeConfig  # noqa: E402
+
+
+def random_wall(walls: bytearray, cols: int, rows: int, closed: bool,
+                rng: random.Random) -> tuple:
+    """A random inner wall between two valid cells, closed or open."""
+    while True:
+        cell = rng.randrange(cols * rows)
+        d = rng.randrange(2) + 1
+        y, x = divmod(cell, cols)
+        if (d == 1 and x == cols - 1) or (d == 2 and y == rows - 1):
+            continue
+        other = cell + (1 if d == 1 else cols)
+        if walls[cell] == 15 or walls[other] == 15:
+            continue
+        if bool(walls[cell] & BITS[d]) == closed:
+            return cell, d
+
+
+def main() -> None:
+    """Build the maze, time the edits and check the distances."""
+    parser = argparse.ArgumentParser(description="Dynamic solver")
+    parser.add_argument("--size", default="2000x2000",
+                        help="maze size as WIDTHxHEIGHT")
+    parser.add_argument("--edits", type=int, default=200,
+                        help="walls opened, then as many closed")
+    parser.add_argument("--loops", type=int, default=1000,
+                        help="walls opened to make the maze imperfect")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    cols, rows = (int(v) for v in args.size.split("x"))
+    rng = random.Random(args.seed)
+    blocked = frozenset(y * cols + x
+                        for x, y in MazeConfig.get_42_cells(cols, rows))
+    start = time.perf_counter()
+    walls = walled_grid(cols, rows, blocked)
+    root = (0, 0, cols, rows, rng.getrandbits(64))
+    _, _, _ = divide(walls, cols, rows, [root], blocked)
+    reconnect(walls, cols, root[:4], blocked, rng)
+    for _ in range(args.loops):
+        cell, d = random_wall(walls, cols, rows, True, rng)
+        walls[cell] &= ~BITS[d]
+        walls[cell + (1 if d == 1 else cols)] &= ~BITS[OPPOSITE[d]]
+    print(f"maze {args.size} carved in {time.perf_counter() - start:.1f}s")
+
+    start = time.perf_counter()
+    solver = DynamicSolver(cols, rows, walls, 0, cols * rows - 1)
+    full = time.perf_counter() - start
+    print(f"full BFS: {full * 1000:9.1f}ms, path of {len(solver.path)}")
+
+    times: Dict[str, List[float]] = {"open": [], "close": []}
+    cells: Dict[str, List[int]] = {"open": [], "close": []}
+    for kind in ("open", "close"):
+        for _ in range(args.edits):
+            cell, d = random_wall(walls, cols, rows, kind == "open", rng)
+            start = time.perf_counter()
+            if kind == "open":
+                solver.open_wall(cell, d)
+            else:
+                solver.close_wall(cell, d)
+            solver.path
+            times[kind].append((time.perf_counter() - start) * 1000)
+            cells[kind].append(solver.visited)
+    for kind in ("open", "close"):
+        ordered = sorted(times[kind])
+        mean = statistics.mean(ordered)
+        print(f"{kind:>5} wall: mean {mean:7.3f}ms, "
+              f"p50 {ordered[len(ordered) // 2]:7.3f}ms, "
+              f"max {ordered[-1]:8.1f}ms, "
+              f"{statistics.mean(cells[kind]):9.0f} cells "
+              f"(x{full * 1000 / mean:.0f} faster than a full BFS)")
+
+    fresh = DynamicSolver(cols, rows, bytearray(walls), 0, cols * rows - 1)
+    if fresh.distance != solver.distance \
+            or len(fresh.path) != len(solver.path):
+        print("Error: the repaired distances differ from a full BFS")
+        sys.exit(1)
+    print("OK: repaired distances match a full BFS")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+# File: benchmarks/fake_mlx.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/11 09:48:36
+# Updated: 2026/02/11 09:48:36
+
+"""
+Headless stand-in for the MLX bindings.
+
+Images are bytearrays with the BGRA layout of MLX and every window
+keeps its own framebuffer, so that what MazeRenderer displays can be
+checked without a display. Call install() before importing the
+renderer to make `from mlx import Mlx` load this class.
+"""
+
+import sys
+from types import ModuleType
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+
+class FakeImage:
+    """In-memory MLX image."""
+
+    def __init__(self, width: int, height: int) -> None:
+        """
+        Allocate a black image.
+
+        Args:
+            width (int): Width in pixels.
+            height (int): Height in pixels.
+        """
+        self.width: int = width
+        self.height: int = height
+        self.size_line: int = width * 4
+        self.buffer: bytearray = bytearray(self.size_line * height)
+
+
+class FakeWindow:
+    """In-memory MLX window with its framebuffer and hooks."""
+
+    def __init__(self, width: int, height: int, title: str) -> None:
+        """
+        Allocate a black window.
+
+        Args:
+            width (int): Width in pixels.
+            height (int): Height in pixels.
+            title (str): Title of the window.
+        """
+        self.width: int = width
+        self.height: int = height
+        self.title: str = title
+        self.framebuffer: bytearray = bytearray(width * height * 4)
+        self.strings: List[Tuple[int, int, int, str]] = []
+        self.hooks: Dict[Any, Tuple[Callable, Any]] = {}
+
+
+class Mlx:
+    """
+    Fake of the MLX class, implementing the calls used by MazeRenderer.
+
+    Counters of the uploads are kept to compare drawing strategies.
+    """
+
+    SCREEN_SIZE: Tuple[int, int] = (1920, 1080)
+
+    def __init__(self) -> None:
+        """Initialize the counters."""
+        self.windows: List[FakeWindow] = []
+        self.images: List[FakeImage] = []
+        self.puts: int = 0
+        self.put_pixels: int = 0
+        self.loop_hook: Optional[Tuple[Callable, Any]] = None
+        self.running: bool = False
+
+    def mlx_init(self) -> int:
+        """Return a fake connection."""
+        return 1
+
+    def mlx_get_screen_size(self, ptr: Any) -> Tuple[int, int, int]:
+        """Return the configured screen size."""
+        return (0, *self.SCREEN_SIZE)
+
+    def mlx_new_window(self, ptr: Any, width: int, height: int,
+                       title: str) -> FakeWindow:
+        """Create a window."""
+        window = FakeWindow(width, height, title)
+        self.windows.append(window)
+        return window
+
+    def mlx_destroy_window(self, ptr: Any, window: FakeWindow) -> None:
+        """Destroy a window."""
+        self.windows.remove(window)
+
+    def mlx_clear_window(self, ptr: Any, window: FakeWindow) -> None:
+        """Paint a window black and forget its strings."""
+        window.framebuffer[:] = bytes(len(window.framebuffer))
+        window.strings.clear()
+
+    def mlx_new_image(self, ptr: Any, width: int, height: int) -> FakeImage:
+        """Create an image."""
+        image = FakeImage(width, height)
+        self.images.append(image)
+        return image
+
+    def mlx_destroy_image(self, ptr: Any, image: FakeImage) -> None:
+        """Destroy an image."""
+        self.images.remove(image)
+
+    def mlx_get_data_addr(self, image: FakeImage
+                          ) -> Tuple[memoryview, int, int, int]:
+        """Return the buffer, bits per pixel, line size and endian."""
+        return memoryview(image.buffer), 32, image.size_line, 0
+
+    def mlx_put_image_to_window(self, ptr: Any, window: FakeWindow,
+                                image: FakeImage, x: int, y: int) -> None:
+        """Copy an image into the framebuffer of a window, clipped."""
+        self.puts += 1
+        left, right = max(0, x), min(window.width, x + image.width)
+        top, bottom = max(0, y), min(window.height, y + image.height)
+        if left >= right or top >= bottom:
+            return
+        self.put_pixels += (right - left) * (bottom - top)
+        row_len = (right - left) * 4
+        line = window.width * 4
+        for row in range(top, bottom):
+            src = (row - y) * image.size_line + (left - x) * 4
+            dst = row * line + left * 4
+            window.framebuffer[dst:dst + row_len] = \
+                image.buffer[src:src + row_len]
+
+    def mlx_string_put(self, ptr: Any, window: FakeWindow, x: int, y: int,
+                       color: int, text: str) -> None:
+        """Record a string drawn in a window."""
+        window.strings.append((x, y, color, text))
+
+    def mlx_mouse_hook(self, window: FakeWindow, func: Callable,
+                       param: Any) -> None:
+        """Register the mouse callback of a window."""
+        window.hooks["mouse"] = (func, param)
+
+    def mlx_key_hook(self, window: FakeWindow, func: Callable,
+                     param: Any) -> None:
+        """Register the key callback of a window."""
+        window.hooks["key"] = (func, param)
+
+    def mlx_hook(self, window: FakeWindow, event: int, mask: int,
+                 func: Callable, param: Any) -> None:
+        """Register a callback for an X event of a window."""
+        window.hooks[event] = (func, param)
+
+    def mlx_loop_hook(self, ptr: Any, func: Callable, param: Any) -> None:
+        """Register the idle callback."""
+        self.loop_hook = (func, param)
+
+    def mlx_loop(self, ptr: Any) -> None:
+        """Return at once: events are sent with press() and idle()."""
+        self.running = True
+
+    def mlx_loop_exit(self, ptr: Any) -> None:
+        """Stop the loop."""
+        self.running = False
+
+    def press(self, keynum: int) -> None:
+        """Send a key press to the last window, like X would."""
+        func, param = self.windows[-1].hooks["key"]
+        func(keynum, param)
+
+    def idle(self, count: int = 1) -> None:
+        """Call the idle callback as the loop would between events."""
+        if self.loop_hook is None:
+            return
+        func, param = self.loop_hook
+        for _ in range(count):
+            func(param)
+
+
+def install() -> None:
+    """Make `from mlx import Mlx` load the fake."""
+    module = ModuleType("mlx")
+    module.Mlx = Mlx  # type: ignore[attr-defined]
+    sys.modules["mlx"] = module
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+# File: benchmarks/frames.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/11 10:31:12
+# Updated: 2026/02/11 10:31:12
+
+"""
+Frame-time benchmark of the MLX renderer, without a display.
+
+MazeRenderer runs on the fake MLX of fake_mlx.py. A scripted sequence
+of keys is sent through its key hook for mazes of several sizes, the
+latency of every key is measured and the window content after every
+key is hashed. The hashes can be stored as golden checksums and
+checked later, to make sure an optimization does not change a pixel.
+
+Usage: python3 benchmarks/frames.py [--sizes 30x20 ...] [--repeat N]
+           [--check | --update] [--golden file]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import fake_mlx  # noqa: E402
+
+fake_mlx.install()
+
+from maze_renderer import MazeRenderer  # noqa: E402
+
+KEYS: Dict[str, int] = {"s": 115, "c": 99, "r": 114}
+# solution and palette toggles, with a regeneration in the middle
+SCRIPT: str = "scscccsscscrscsc"
+SIZES: List[str] = ["10x10", "30x20", "60x40", "120x60"]
+GOLDEN: str = os.path.join(BENCH_DIR, "golden", "frames.json")
+SEED: int = 42
+
+
+def write_config(directory: str, width: int, height: int) -> str:
+    """
+    Write a seeded configuration for a maze size.
+
+    Args:
+        directory (str): Directory receiving the config and the maze.
+        width (int): Width of the maze.
+        height (int): Height of the maze.
+
+    Returns:
+        str: Path of the configuration file.
+    """
+    config = os.path.join(directory, f"config_{width}x{height}.txt")
+    with open(config, "w") as f:
+        f.write(f"WIDTH={width}\nHEIGHT={height}\n"
+                f"ENTRY=0,0\nEXIT={width - 1},{height - 1}\n"
+                f"OUTPUT_FILE={directory}/maze_{width}x{height}.txt\n"
+                f"PERFECT=True\nSEED={SEED}\n")
+    return config
+
+
+def percentile(values: List[float], p: float) -> float:
+    """Nearest-rank percentile of a list of values."""
+    ordered = sorted(values)
+    rank = max(0, min(len(ordered) - 1, round(p / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+def run_size(size: str, repeat: int) -> Tuple[Dict[str, float], List[str]]:
+    """
+    Open a renderer on a maze and play the key script.
+
+    Args:
+        size (str): Maze size as WIDTHxHEIGHT.
+        repeat (int): Number of times the script is played.
+
+    Returns:
+        tuple: Timing report and window checksum after every frame.
+    """
+    width, height = (int(v) for v in size.split("x"))
+    frames: List[float] = []
+    checksums: List[str] = []
+    with tempfile.TemporaryDirectory() as directory, \
+            contextlib.redirect_stdout(io.StringIO()):
+        config = write_config(directory, width, height)
+        start = time.perf_counter()
+        renderer = MazeRenderer(config)
+        first = time.perf_counter() - start
+        m = renderer.m
+        checksums.append(hashlib.sha1(m.windows[-1].framebuffer).hexdigest())
+        for _ in range(repeat):
+            for key in SCRIPT:
+                start = time.perf_counter()
+                m.press(KEYS[key])
+                frames.append(time.perf_counter() - start)
+                checksums.append(
+                        hashlib.sha1(m.windows[-1].framebuffer).hexdigest())
+        renderer.gere_close(None)
+
+    report = {
+            "first_frame_ms": first * 1000,
+            "frames": len(frames),
+            "p50_ms": percentile(frames, 50) * 1000,
+            "p90_ms": percentile(frames, 90) * 1000,
+            "p99_ms": percentile(frames, 99) * 1000,
+            "max_ms": max(frames) * 1000,
+            "puts": m.puts,
+            "put_pixels": m.put_pixels,
+            }
+    return report, checksums
+
+
+def main() -> None:
+    """Run the benchmark and check or store the golden checksums."""
+    parser = argparse.ArgumentParser(description="MLX renderer frame times")
+    parser.add_argument("--sizes", nargs="+", default=SIZES,
+                        help="maze sizes as WIDTHxHEIGHT")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="times the key script is played")
+    parser.add_argument("--golden", default=GOLDEN,
+                        help="file of golden checksums")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true",
+                      help="compare the frames with the golden checksums")
+    mode.add_argument("--update", action="store_true",
+                      help="store the frames as golden checksums")
+    args = parser.parse_args()
+
+    golden: Dict[str, List[str]] = {}
+    if os.path.exists(args.golden):
+        with open(args.golden) as f:
+            golden = json.load(f)
+
+    print(f"{'size':>8} {'first':>9} {'p50':>8} {'p90':>8} {'p99':>8} "
+          f"{'max':>8} {'puts':>6}")
+    failures: List[str] = []
+    for size in args.sizes:
+        report, checksums = run_size(size, args.repeat)
+        print(f"{size:>8} {report['first_frame_ms']:8.1f}ms "
+              f"{report['p50_ms']:6.2f}ms {report['p90_ms']:6.2f}ms "
+              f"{report['p99_ms']:6.2f}ms {report['max_ms']:6.2f}ms "
+              f"{report['puts']:>6}")
+        if args.update:
+            golden[size] = checksums
+        elif args.check:
+            expected = golden.get(size)
+            if expected is None:
+                failures.append(f"{size}: no golden checksums")
+            elif expected != checksums[:len(expected)]:
+                frame = next(k for k, (a, b)
+                             in enumerate(zip(expected, checksums)) if a != b)
+                failures.append(f"{size}: frame {frame} differs")
+
+    if args.update:
+        os.makedirs(os.path.dirname(args.golden), exist_ok=True)
+        with open(args.golden, "w") as f:
+            json.dump(golden, f, indent=1, sort_keys=True)
+        print(f"Golden checksums written to {args.golden}")
+    if failures:
+        print("\n".join(failures))
+        sys.exit(1)
+    if args.check:
+        print("OK: every frame matches the golden checksums")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+# File: benchmarks/hybrid.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/18 16:25:09
+# Updated: 2026/02/18 16:25:09
+
+"""
+Generation time of the HYBRID algorithm against plain Wilson.
+
+Mazes of every size are generated for many seeds with WILSON and with
+HYBRID at several fractions, and the mean, p90 and worst times are
+compared: the long first walks of Wilson's algorithm make its tail
+heavy. The uniformity check draws many 3x3 mazes and compares the
+frequency of each of the 192 spanning trees with a chi-square test.
+WILSON and HYBRID at fraction 1, plain Aldous-Broder, must pass; the
+chi-square of the other fractions measures the bias of the switch.
+
+Usage: python3 benchmarks/hybrid.py [--sizes 20x15 ...] [--seeds N]
+           [--fractions 0.25 ...] [--rng LEGACY] [--uniformity N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from maze_config import MazeConfig  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+
+SIZES: List[str] = ["20x15", "40x30", "80x60"]
+FRACTIONS: List[float] = [0.25, 0.5, 0.75]
+# spanning trees of the 3x3 grid
+TREES: int = 192
+# chi-square of 191 degrees of freedom at p = 0.001
+CHI2_LIMIT: float = 255.0
+
+
+def config(size: str, algorithm: str, fraction: float,
+           rng: str) -> MazeConfig:
+    """Settings of one case, the seed is set per maze."""
+    width, height = size.split("x")
+    return MazeConfig.from_settings({
+        "WIDTH": width, "HEIGHT": height, "ALGORITHM": algorithm,
+        "HYBRID_FRACTION": str(fraction), "RNG": rng,
+        })
+
+
+def time_case(settings: MazeConfig, seeds: int) -> List[float]:
+    """Generation time of every seed, in milliseconds."""
+    times: List[float] = []
+    for seed in range(seeds):
+        maze = MazeGenerator(settings, verbose=False)
+        maze.seed = seed
+        start = time.perf_counter()
+        maze.generate_maze(export=False)
+        times.append((time.perf_counter() - start) * 1000)
+    return times
+
+
+def chi_square(settings: MazeConfig, samples: int) -> float:
+    """Chi-square of the tree frequencies against a uniform draw."""
+    counts: Dict[str, int] = {}
+    for seed in range(samples):
+        maze = MazeGenerator(settings, verbose=False)
+        maze.seed = seed
+        maze.generate_maze(export=False)
+        counts[maze.hex_repr] = counts.get(maze.hex_repr, 0) + 1
+    expected = samples / TREES
+    missing = TREES - len(counts)
+    return (sum((n - expected) ** 2 for n in counts.values())
+            + missing * expected ** 2) / expected
+
+
+def main() -> None:
+    """Benchmark the cases and check the distribution."""
+    parser = argparse.ArgumentParser(description="HYBRID against WILSON")
+    parser.add_argument("--sizes", nargs="+", default=SIZES,
+                        help="maze sizes as WIDTHxHEIGHT")
+    parser.add_argument("--seeds", type=int, default=30,
+                        help="mazes per case")
+    parser.add_argument("--fractions", nargs="+", type=float,
+                        default=FRACTIONS,
+                        help="HYBRID_FRACTION values to compare")
+    parser.add_argument("--rng", default="LEGACY",
+                        help="random stream of the mazes")
+    parser.add_argument("--uniformity", type=int, default=20000,
+                        help="3x3 mazes drawn by the check, 0 to skip")
+    args = parser.parse_args()
+
+    print(f"{'case':>22} {'mean':>9} {'p90':>9} {'max':>9}")
+    for size in args.sizes:
+        cases = [("WILSON", 0.0)] + [("HYBRID", f) for f in args.fractions]
+        for algorithm, fraction in cases:
+            times = sorted(time_case(
+                config(size, algorithm, fraction, args.rng), args.seeds))
+            name = algorithm if algorithm == "WILSON" \
+                else f"{algorithm}-{fraction:g}"
+            p90 = times[int(len(times) * 0.9) - 1]
+            print(f"{size + ' ' + name:>22} {statistics.mean(times):7.1f}ms"
+                  f" {p90:7.1f}ms {times[-1]:7.1f}ms")
+
+    if not args.uniformity:
+        return
+    failed = False
+    fractions = sorted(set(args.fractions) | {1.0})
+    for algorithm, fraction in [("WILSON", 0.0)] + [
+            ("HYBRID", f) for f in fractions]:
+        chi2 = chi_square(config("3x3", algorithm, fraction, args.rng),
+                          args.uniformity)
+        uniform = chi2 < CHI2_LIMIT
+        if algorithm == "WILSON" or fraction == 1.0:
+            failed = failed or not uniform
+            verdict = "OK" if uniform else "FAIL"
+        else:
+            verdict = "uniform" if uniform else "biased"
+        print(f"uniformity {algorithm} {fraction:g}: chi2={chi2:.1f} "
+              f"({verdict}, limit {CHI2_LIMIT})")
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
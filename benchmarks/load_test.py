@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# File: benchmarks/load_test.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/16 14:02:37
+# Updated: 2026/02/16 14:02:37
+
+"""
+Load test of the maze server.
+
+Opens a number of keep-alive connections to a running maze_server.py
+and sends requests on each of them, then reports the latency
+percentiles, the throughput and the count of every status. Seeds
+differ per request, so every answer is a new maze.
+
+Usage: python3 benchmarks/load_test.py [--host 127.0.0.1] [--port 8042]
+           [--unix path] [--connections N] [--requests N]
+           [--size 30x20] [--format hex|binary] [--algorithm WILSON]
+"""
+
+import argparse
+import asyncio
+import json
+import statistics
+import time
+from typing import Dict, List, Optional, Tuple
+
+
+async def request(reader: asyncio.StreamReader,
+                  writer: asyncio.StreamWriter,
+                  target: str) -> Tuple[int, bytes]:
+    """
+    Send one GET request on an open connection.
+
+    Returns:
+        tuple: Status and body of the response.
+    """
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: localhost\r\n\r\n"
+                 .encode())
+    await writer.drain()
+    head = (await reader.readuntil(b"\r\n\r\n")).decode("latin-1")
+    status = int(head.split(" ", 2)[1])
+    length = 0
+    for line in head.split("\r\n")[1:]:
+        if line.lower().startswith("content-length:"):
+            length = int(line.split(":", 1)[1])
+    return status, await reader.readexactly(length)
+
+
+async def connect(host: str, port: int, unix: Optional[str]
+                  ) -> Tuple[asyncio.StreamReader, asyncio.StreamWriter]:
+    """Open a connection to the server."""
+    if unix is not None:
+        return await asyncio.open_unix_connection(unix)
+    return await asyncio.open_connection(host, port)
+
+
+async def client(args: argparse.Namespace, index: int,
+                 latencies: List[float], statuses: Dict[int, int]) -> None:
+    """Send the requests of one connection, one after the other."""
+    reader, writer = await connect(args.host, args.port, args.unix)
+    width, height = args.size.split("x")
+    try:
+        for k in range(args.requests):
+            seed = index * args.requests + k
+            target = (f"/maze?WIDTH={width}&HEIGHT={height}&SEED={seed}"
+                      f"&ALGORITHM={args.algorithm}&FORMAT={args.format}")
+            start = time.perf_counter()
+            status, _ = await request(reader, writer, target)
+            latencies.append((time.perf_counter() - start) * 1000)
+            statuses[status] = statuses.get(status, 0) + 1
+    finally:
+        writer.close()
+
+
+async def run(args: argparse.Namespace) -> Dict[str, object]:
+    """Run every connection at once and summarise the results."""
+    latencies: List[float] = []
+    statuses: Dict[int, int] = {}
+    start = time.perf_counter()
+    await asyncio.gather(*(client(args, i, latencies, statuses)
+                           for i in range(args.connections)))
+    elapsed = time.perf_counter() - start
+    latencies.sort()
+    # inclusive: within the sample, never above the max
+    centiles = statistics.quantiles(latencies, n=100, method="inclusive") \
+        if len(latencies) > 1 else latencies * 99
+    reader, writer = await connect(args.host, args.port, args.unix)
+    _, body = await request(reader, writer, "/stats")
+    writer.close()
+    return {
+            "requests": len(latencies),
+            "seconds": round(elapsed, 3),
+            "throughput": round(len(latencies) / elapsed, 1),
+            "p50_ms": round(centiles[49], 2),
+            "p90_ms": round(centiles[89], 2),
+            "p99_ms": round(centiles[98], 2),
+            "max_ms": round(latencies[-1], 2),
+            "statuses": {str(k): v for k, v in sorted(statuses.items())},
+            "server": json.loads(body),
+            }
+
+
+def main() -> None:
+    """Parse the options, load the server and print the report."""
+    parser = argparse.ArgumentParser(description="Maze server load test")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8042)
+    parser.add_argument("--unix", default=None,
+                        help="connect to a Unix socket instead")
+    parser.add_argument("--connections", type=int, default=16,
+                        help="keep-alive connections sending at once")
+    parser.add_argument("--requests", type=int, default=50,
+                        help="requests per connection")
+    parser.add_argument("--size", default="30x20",
+                        help="maze size as WIDTHxHEIGHT")
+    parser.add_argument("--format", default="hex", choices=["hex", "binary"])
+    parser.add_argument("--algorithm", default="WILSON",
+                        choices=["WILSON", "DFS", "HYBRID", "POPPING",
+                                 "DIVISION"])
+    parser.add_argument("--output", default=None,
+                        help="JSON file receiving the report")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print(f"{report['requests']} requests in {report['seconds']}s: "
+          f"{report['throughput']} req/s")
+    print(f"latency p50={report['p50_ms']}ms p90={report['p90_ms']}ms "
+          f"p99={report['p99_ms']}ms max={report['max_ms']}ms")
+    print(f"statuses: {report['statuses']}")
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+# File: benchmarks/soak.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/05 10:02:44
+# Updated: 2026/02/05 10:02:44
+
+"""
+Soak benchmark: regenerate mazes for a long time and check the memory.
+
+The ASCII renderer is driven with a scripted list of menu choices, and
+the MLX renderer, on the fake MLX of fake_mlx.py, with presses of the
+r key and idle calls that build its cached images; their output is
+thrown away. The resident set size is sampled along the way and must
+stay flat once the first WARMUP regenerations are done, so more are
+needed.
+
+Usage: python3 benchmarks/soak.py [config_file] [regenerations]
+           [ASCII|MLX|BOTH]
+"""
+
+import os
+import sys
+import time
+from typing import Iterator, List, Tuple
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+from ascii_renderer import AsciiRenderer  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+
+WARMUP: int = 100
+SAMPLES: int = 20
+# allowed growth after the warmup, in kB
+TOLERANCE_KB: int = 8 * 1024
+# r key of the MLX renderer
+KEY_REGENERATE: int = 114
+
+
+def get_rss_kb() -> int:
+    """Return the current resident set size of the process in kB."""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except OSError:
+        import resource
+        # peak value only, but still catches a steady growth
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+
+
+def sampled(count: int, regenerations: int) -> bool:
+    """Tell whether the memory is sampled after a number of mazes."""
+    step = max(1, (regenerations - WARMUP) // SAMPLES)
+    return count >= WARMUP and (count - WARMUP) % step == 0
+
+
+class SoakRenderer(AsciiRenderer):
+    """ASCII renderer reading its menu choices from a script."""
+
+    def __init__(self, config: str, regenerations: int) -> None:
+        """
+        Prepare the scripted session.
+
+        Args:
+            config (str): Name of the configuration file.
+            regenerations (int): Number of mazes to regenerate.
+        """
+        super().__init__(config)
+        self.regenerations: int = regenerations
+        self.choices: Iterator[str] = iter(["2", "3"]
+                                           + ["1"] * regenerations + ["4"])
+        self.count: int = 0
+        self.rss: List[int] = []
+
+    def get_choice(self) -> tuple[str, bool]:  # type: ignore[override]
+        """Return the next scripted choice."""
+        return next(self.choices), False
+
+    def load_maze(self, maze: MazeGenerator) -> None:
+        """Load the maze and sample the memory at regular intervals."""
+        super().load_maze(maze)
+        self.count += 1
+        if sampled(self.count, self.regenerations):
+            self.rss.append(get_rss_kb())
+
+
+def soak_ascii(config: str, regenerations: int) -> Tuple[int, List[int]]:
+    """
+    Regenerate mazes in the ASCII renderer.
+
+    Returns:
+        tuple: The regenerations done and the memory samples, in kB.
+    """
+    renderer = SoakRenderer(config, regenerations)
+    renderer.main()
+    return renderer.count - 1, renderer.rss
+
+
+def soak_mlx(config: str, regenerations: int) -> Tuple[int, List[int]]:
+    """
+    Regenerate mazes in the MLX renderer, on the fake MLX.
+
+    Returns:
+        tuple: The regenerations done and the memory samples, in kB.
+    """
+    import fake_mlx
+    fake_mlx.install()
+    from maze_renderer import MazeRenderer
+
+    renderer = MazeRenderer(config)
+    rss: List[int] = []
+    for count in range(1, regenerations + 1):
+        renderer.m.press(KEY_REGENERATE)
+        renderer.m.idle(2)
+        if sampled(count, regenerations):
+            rss.append(get_rss_kb())
+    renderer.gere_close(None)
+    return regenerations, rss
+
+
+def main() -> None:
+    """Run the soak benchmark and report the memory samples."""
+    config = sys.argv[1] if len(sys.argv) > 1 else "config.txt"
+    regenerations = int(sys.argv[2]) if len(sys.argv) > 2 else 10000
+    display = sys.argv[3].upper() if len(sys.argv) > 3 else "BOTH"
+    if regenerations <= WARMUP:
+        print(f"Error: the memory is only sampled after {WARMUP} "
+              f"regenerations, ask for more")
+        sys.exit(1)
+    if display not in ("ASCII", "MLX", "BOTH"):
+        print("Error: pick ASCII, MLX or BOTH")
+        sys.exit(1)
+
+    runs = [(name, run) for name, run in (("ASCII", soak_ascii),
+                                          ("MLX", soak_mlx))
+            if display in (name, "BOTH")]
+    failed = False
+    for name, run in runs:
+        start = time.perf_counter()
+        stdout = sys.stdout
+        with open(os.devnull, "w") as devnull:
+            sys.stdout = devnull
+            try:
+                count, rss = run(config, regenerations)
+            finally:
+                sys.stdout = stdout
+        elapsed = time.perf_counter() - start
+
+        growth = rss[-1] - rss[0]
+        print(f"{name} regenerations: {count} in {elapsed:.1f}s")
+        print(f"RSS after warmup: {rss[0]} kB")
+        print(f"RSS at the end: {rss[-1]} kB")
+        print(f"Growth: {growth} kB (allowed {TOLERANCE_KB} kB)")
+        if growth > TOLERANCE_KB:
+            print(f"Error: memory keeps growing while regenerating "
+                  f"in {name}")
+            failed = True
+    if failed:
+        sys.exit(1)
+    print("OK: memory is flat")
+
+
+if __name__ == "__main__":
+    main()
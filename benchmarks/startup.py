@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+# File: benchmarks/startup.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/14 09:55:21
+# Updated: 2026/02/14 09:55:21
+
+"""
+Startup latency benchmark of the entry point.
+
+The import of a_maze_ing is measured with `python -X importtime`, the
+slowest imports are listed, and the modules only needed by other
+display modes (MLX, NumPy, multiprocessing) must not be loaded. A short
+ASCII run, quitting at once, gives the wall-clock time of a whole run.
+
+Usage: python3 benchmarks/startup.py [--runs N] [--output file]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Tuple
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+# modules an ASCII run must not import
+LAZY: List[str] = ["mlx", "maze_renderer", "numpy", "multiprocessing",
+                   "cProfile", "tracemalloc"]
+TOP: int = 10
+
+
+def import_times() -> Tuple[int, Dict[str, int]]:
+    """
+    Import the entry point in a fresh interpreter.
+
+    Returns:
+        tuple: Cumulative import time of a_maze_ing in microseconds and
+        the cumulative time of every imported module.
+    """
+    result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", "import a_maze_ing"],
+            cwd=ROOT, capture_output=True, text=True, check=True
+            )
+    modules: Dict[str, int] = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        modules[name.strip()] = int(cumulative)
+    return modules.get("a_maze_ing", 0), modules
+
+
+def short_run(config: str) -> float:
+    """Run the program on a small maze and quit at once, in seconds."""
+    start = time.perf_counter()
+    subprocess.run(
+            [sys.executable, "a_maze_ing.py", config], cwd=ROOT,
+            input="4\n", capture_output=True, text=True, check=True
+            )
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    """Measure the startup and check that the lazy imports stay lazy."""
+    parser = argparse.ArgumentParser(description="Startup latency")
+    parser.add_argument("--runs", type=int, default=10,
+                        help="fresh interpreters per measure")
+    parser.add_argument("--output", default=None,
+                        help="JSON file receiving the results")
+    args = parser.parse_args()
+
+    totals: List[int] = []
+    modules: Dict[str, int] = {}
+    for _ in range(args.runs):
+        total, modules = import_times()
+        totals.append(total)
+
+    with tempfile.TemporaryDirectory() as directory:
+        config = os.path.join(directory, "config.txt")
+        with open(config, "w") as f:
+            f.write(f"WIDTH=20\nHEIGHT=10\nSEED=42\nPOOL_DEPTH=0\n"
+                    f"OUTPUT_FILE={directory}/maze.txt\n")
+        runs = [short_run(config) for _ in range(args.runs)]
+
+    import_ms = statistics.median(totals) / 1000
+    run_ms = statistics.median(runs) * 1000
+    slowest = sorted(((v, k) for k, v in modules.items()
+                      if k != "a_maze_ing"), reverse=True)[:TOP]
+    loaded = [name for name in LAZY
+              if any(m == name or m.startswith(name + ".") for m in modules)]
+
+    print(f"import a_maze_ing: {import_ms:.1f}ms (median of {args.runs})")
+    print(f"short ASCII run:   {run_ms:.1f}ms (median of {args.runs})")
+    print("slowest imports (cumulative):")
+    for value, name in slowest:
+        print(f"  {value / 1000:7.1f}ms  {name}")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({
+                "import_ms": import_ms,
+                "run_ms": run_ms,
+                "slowest": {name: value / 1000 for value, name in slowest},
+                "eager": loaded,
+                }, f, indent=1)
+    if loaded:
+        print(f"Error: imported at startup: {', '.join(loaded)}")
+        sys.exit(1)
+    print("OK: renderer and optional modules are imported lazily")
+
+
+if __name__ == "__main__":
+    main()
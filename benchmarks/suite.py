@@ -0,0 +1,310 @@
+#!/usr/bin/env python3
+# File: benchmarks/suite.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/12 09:17:40
+# Updated: 2026/02/12 09:17:40
+
+"""
+End-to-end benchmark suite with golden output checks.
+
+Every phase of a maze, from the MazeGenerator construction to both
+renderers, is timed over a matrix of sizes, algorithms and PERFECT
+settings. Times are the best of a few runs, the peak memory of each
+phase comes from one more run under tracemalloc.
+
+Results are written as JSON and can be compared with a baseline: a
+phase slower than the baseline by more than the threshold is reported
+as a regression. The mazes are seeded, and the exported file, the
+ASCII output and the MLX image of each case are hashed and checked
+against golden checksums, so faster code must give identical output.
+
+Usage: python3 benchmarks/suite.py [--sizes 20x10 ...] [--repeat N]
+           [--output file] [--baseline file] [--threshold 0.25]
+           [--check | --update]
+"""
+
+import argparse
+import contextlib
+import hashlib
+import io
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, List, Optional
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+sys.path.insert(0, BENCH_DIR)
+
+import fake_mlx  # noqa: E402
+
+fake_mlx.install()
+
+from ascii_renderer import AsciiRenderer  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+from maze_renderer import MazeRenderer  # noqa: E402
+
+SIZES: List[str] = ["20x10", "50x30", "100x60"]
+ALGORITHMS: List[str] = ["WILSON", "DFS"]
+PERFECT: List[bool] = [True, False]
+GOLDEN: str = os.path.join(BENCH_DIR, "golden", "mazes.json")
+SEED: int = 42
+# differences below this are noise, whatever the threshold
+MIN_DELTA_MS: float = 1.0
+
+
+class Recorder:
+    """Run the phases of a case and record their time or peak memory."""
+
+    def __init__(self, memory: bool = False) -> None:
+        """
+        Start an empty record.
+
+        Args:
+            memory (bool): Record the peak memory instead of the time.
+        """
+        self.memory: bool = memory
+        self.values: Dict[str, float] = {}
+
+    def measure(self, name: str, func: Callable[[], Any]) -> Any:
+        """
+        Run one phase.
+
+        Args:
+            name (str): Name of the phase.
+            func (callable): The phase, called without arguments.
+
+        Returns:
+            Any: The result of the phase.
+        """
+        if self.memory:
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+            result = func()
+            self.values[name] = (tracemalloc.get_traced_memory()[1]
+                                 - base) / 1024
+            return result
+        start = time.perf_counter()
+        result = func()
+        self.values[name] = (time.perf_counter() - start) * 1000
+        return result
+
+
+def write_config(directory: str, width: int, height: int, algorithm: str,
+                 perfect: bool) -> str:
+    """Write the seeded configuration of a case, without a pool."""
+    config = os.path.join(directory, "config.txt")
+    with open(config, "w") as f:
+        f.write(f"WIDTH={width}\nHEIGHT={height}\n"
+                f"ENTRY=0,0\nEXIT={width - 1},{height - 1}\n"
+                f"OUTPUT_FILE={directory}/maze.txt\n"
+                f"ALGORITHM={algorithm}\nPERFECT={perfect}\n"
+                f"SEED={SEED}\nPOOL_DEPTH=0\n")
+    return config
+
+
+def sha1(data: bytes) -> str:
+    """Hex digest of some output."""
+    return hashlib.sha1(data).hexdigest()
+
+
+def run_case(config: str, recorder: Recorder) -> Dict[str, str]:
+    """
+    Run every phase of one case, in the order generate_maze uses.
+
+    Args:
+        config (str): Configuration file of the case.
+        recorder (Recorder): Receives the measures.
+
+    Returns:
+        dict: Checksums of the maze file and of both renderers.
+    """
+    measure = recorder.measure
+    maze = measure("construct", lambda: MazeGenerator(config, verbose=False))
+    maze.rng.seed(maze.seed)
+    if maze.algorithm == "DFS":
+        measure("algorithm", maze._iter_DFS)
+    else:
+        measure("algorithm", maze.wilson)
+    if not maze.perfect:
+        measure("make_imperfect", maze.make_imperfect)
+    parent = measure("bfs", maze.bfs)
+    measure("shortest_path", lambda: maze.shortest_path(parent))
+    measure("hex_repr", lambda: maze.hex_repr)
+    measure("export_to_txt", maze.export_to_txt)
+    with open(maze.output_file, "rb") as f:
+        checksums = {"maze": sha1(f.read())}
+
+    ascii_renderer = AsciiRenderer(config)
+    ascii_renderer.load_maze(maze)
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        measure("ascii_render",
+                lambda: ascii_renderer.display_maze(True, "\033[33m"))
+    checksums["ascii"] = sha1(output.getvalue().encode())
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        renderer = measure("mlx_open", lambda: MazeRenderer(config))
+        measure("mlx_render", renderer.create_image)
+        measure("mlx_solution", lambda: renderer.mykey(115, None))
+        measure("mlx_palette", lambda: renderer.mykey(99, None))
+        renderer.gere_close(None)
+    checksums["mlx"] = sha1(renderer.m.windows[-1].framebuffer)
+    return checksums
+
+
+def run_matrix(sizes: List[str], repeat: int
+               ) -> Dict[str, Dict[str, Any]]:
+    """
+    Benchmark every case of the matrix.
+
+    Args:
+        sizes (List[str]): Maze sizes as WIDTHxHEIGHT.
+        repeat (int): Timed runs per case, the best one is kept.
+
+    Returns:
+        dict: Per case, time and peak memory of each phase and the
+        output checksums.
+    """
+    results: Dict[str, Dict[str, Any]] = {}
+    for size in sizes:
+        width, height = (int(v) for v in size.split("x"))
+        for algorithm in ALGORITHMS:
+            for perfect in PERFECT:
+                kind = "perfect" if perfect else "imperfect"
+                case = f"{size}-{algorithm}-{kind}"
+                with tempfile.TemporaryDirectory() as directory:
+                    config = write_config(directory, width, height,
+                                          algorithm, perfect)
+                    times: Dict[str, float] = {}
+                    for _ in range(repeat):
+                        recorder = Recorder()
+                        checksums = run_case(config, recorder)
+                        for name, value in recorder.values.items():
+                            times[name] = min(value,
+                                              times.get(name, value))
+                    recorder = Recorder(memory=True)
+                    tracemalloc.start()
+                    try:
+                        run_case(config, recorder)
+                    finally:
+                        tracemalloc.stop()
+                results[case] = {
+                        "time_ms": times,
+                        "peak_kb": recorder.values,
+                        "checksums": checksums,
+                        }
+                total = sum(times.values())
+                print(f"{case:>28} {total:9.1f}ms  " + " ".join(
+                    f"{name}={value:.1f}" for name, value in times.items()))
+    return results
+
+
+def compare(results: Dict[str, Dict[str, Any]],
+            baseline: Dict[str, Dict[str, Any]],
+            threshold: float) -> List[str]:
+    """
+    List the phases slower or bigger than the baseline.
+
+    Args:
+        results (dict): Cases of the current run.
+        baseline (dict): Cases of the baseline run.
+        threshold (float): Allowed relative increase, 0.2 for 20%.
+
+    Returns:
+        List[str]: One message per regression.
+    """
+    regressions: List[str] = []
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+        for metric, floor in (("time_ms", MIN_DELTA_MS), ("peak_kb", 64)):
+            for name, value in result[metric].items():
+                old: Optional[float] = baseline[case][metric].get(name)
+                if old is None:
+                    continue
+                if value > old * (1 + threshold) and value - old > floor:
+                    regressions.append(
+                            f"{case} {name}: {metric} {old:.1f} -> "
+                            f"{value:.1f} (+{(value / old - 1) * 100:.0f}%)"
+                            if old else f"{case} {name}: {metric} "
+                            f"{old:.1f} -> {value:.1f}")
+    return regressions
+
+
+def main() -> None:
+    """Run the suite, compare it with the baseline and the golden files."""
+    parser = argparse.ArgumentParser(description="A-maze-ing benchmarks")
+    parser.add_argument("--sizes", nargs="+", default=SIZES,
+                        help="maze sizes as WIDTHxHEIGHT")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="timed runs per case, the best is kept")
+    parser.add_argument("--output", default="benchmark_results.json",
+                        help="JSON file receiving the results")
+    parser.add_argument("--baseline", default=None,
+                        help="results of a previous run to compare with")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="allowed slowdown before a regression, "
+                        "0.25 for 25%%")
+    parser.add_argument("--golden", default=GOLDEN,
+                        help="file of golden checksums")
+    mode = parser.add_mutually_exclusive_group()
+    mode.add_argument("--check", action="store_true",
+                      help="compare the outputs with the golden checksums")
+    mode.add_argument("--update", action="store_true",
+                      help="store the outputs as golden checksums")
+    args = parser.parse_args()
+
+    results = run_matrix(args.sizes, args.repeat)
+    with open(args.output, "w") as f:
+        json.dump({
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "seed": SEED,
+            "cases": results,
+            }, f, indent=1)
+    print(f"Results written to {args.output}")
+
+    failures: List[str] = []
+    if args.baseline:
+        with open(args.baseline) as f:
+            baseline = json.load(f)["cases"]
+        failures += compare(results, baseline, args.threshold)
+
+    golden: Dict[str, Dict[str, str]] = {}
+    if os.path.exists(args.golden):
+        with open(args.golden) as f:
+            golden = json.load(f)
+    if args.update:
+        for case, result in results.items():
+            golden[case] = result["checksums"]
+        os.makedirs(os.path.dirname(args.golden), exist_ok=True)
+        with open(args.golden, "w") as f:
+            json.dump(golden, f, indent=1, sort_keys=True)
+        print(f"Golden checksums written to {args.golden}")
+    elif args.check:
+        for case, result in results.items():
+            expected = golden.get(case)
+            if expected is None:
+                failures.append(f"{case}: no golden checksums")
+                continue
+            for output, checksum in expected.items():
+                if result["checksums"].get(output) != checksum:
+                    failures.append(f"{case}: {output} output differs")
+
+    if failures:
+        print("\n".join(failures))
+        sys.exit(1)
+    if args.baseline:
+        print(f"OK: no regression above {args.threshold:.0%}")
+    if args.check:
+        print("OK: every output matches the golden checksums")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# File: benchmarks/uniformity.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/19 14:37:12
+# Updated: 2026/02/19 14:37:12
+
+"""
+Statistical check of the uniform maze algorithms.
+
+A perfect maze is a spanning tree of the grid, and a uniform algorithm
+draws each of them with the same probability. On small grids the trees
+are counted exactly with the matrix-tree theorem; many seeded mazes are
+drawn, every tree must be seen when enough are drawn, and the
+frequencies are compared with a uniform draw by a chi-square test at
+p = 0.001.
+
+Usage: python3 benchmarks/uniformity.py [--grids 3x3 ...] [--samples N]
+           [--algorithms WILSON POPPING HYBRID]
+"""
+
+import argparse
+import math
+import os
+import sys
+import time
+from fractions import Fraction
+from typing import Dict, List
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(
+    __file__))))
+
+from maze_config import MazeConfig  # noqa: E402
+from maze_generator import MazeGenerator  # noqa: E402
+
+GRIDS: List[str] = ["2x2", "2x3", "3x3", "3x4"]
+ALGORITHMS: List[str] = ["WILSON", "POPPING", "HYBRID"]
+# standard normal quantile of p = 0.001
+Z: float = 3.09
+
+
+def spanning_trees(width: int, height: int) -> int:
+    """Count the spanning trees of a grid with the matrix-tree theorem."""
+    n = width * height
+    laplacian = [[Fraction(0)] * n for _ in range(n)]
+    for y in range(height):
+        for x in range(width):
+            v = y * width + x
+            for nx, ny in ((x + 1, y), (x, y + 1)):
+                if nx < width and ny < height:
+                    u = ny * width + nx
+                    laplacian[v][v] += 1
+                    laplacian[u][u] += 1
+                    laplacian[v][u] -= 1
+                    laplacian[u][v] -= 1
+    # determinant of the laplacian without its last row and column
+    matrix = [row[:-1] for row in laplacian[:-1]]
+    det = Fraction(1)
+    for i in range(n - 1):
+        pivot = next(r for r in range(i, n - 1) if matrix[r][i] != 0)
+        if pivot != i:
+            matrix[i], matrix[pivot] = matrix[pivot], matrix[i]
+            det = -det
+        det *= matrix[i][i]
+        for r in range(i + 1, n - 1):
+            factor = matrix[r][i] / matrix[i][i]
+            for c in range(i, n - 1):
+                matrix[r][c] -= factor * matrix[i][c]
+    return int(det)
+
+
+def chi2_limit(df: int) -> float:
+    """Chi-square quantile at p = 0.001 (Wilson-Hilferty)."""
+    k = 2 / (9 * df)
+    return float(df * (1 - k + Z * k ** 0.5) ** 3)
+
+
+def draw(grid: str, algorithm: str, samples: int) -> Dict[str, int]:
+    """Count the mazes drawn for the seeds 0 to samples - 1."""
+    width, height = grid.split("x")
+    config = MazeConfig.from_settings({
+        "WIDTH": width, "HEIGHT": height, "ALGORITHM": algorithm,
+        })
+    counts: Dict[str, int] = {}
+    for seed in range(samples):
+        maze = MazeGenerator(config, verbose=False)
+        maze.seed = seed
+        maze.generate_maze(export=False)
+        counts[maze.hex_repr] = counts.get(maze.hex_repr, 0) + 1
+    return counts
+
+
+def main() -> None:
+    """Check every algorithm on every grid."""
+    parser = argparse.ArgumentParser(description="Uniformity of the mazes")
+    parser.add_argument("--grids", nargs="+", default=GRIDS,
+                        help="small grids as WIDTHxHEIGHT")
+    parser.add_argument("--samples", type=int, default=30000,
+                        help="mazes drawn per grid and algorithm")
+    parser.add_argument("--algorithms", nargs="+", default=ALGORITHMS,
+                        help="uniform algorithms to check")
+    args = parser.parse_args()
+
+    failures: List[str] = []
+    for grid in args.grids:
+        width, height = (int(v) for v in grid.split("x"))
+        trees = spanning_trees(width, height)
+        limit = chi2_limit(trees - 1)
+        for algorithm in args.algorithms:
+            start = time.perf_counter()
+            counts = draw(grid, algorithm, args.samples)
+            elapsed = time.perf_counter() - start
+            expected = args.samples / trees
+            chi2 = (sum((n - expected) ** 2 for n in counts.values())
+                    + (trees - len(counts)) * expected ** 2) / expected
+            # a missing tree is only an error when unlikely by chance
+            complete = len(counts) == trees \
+                or trees * math.exp(-expected) > 0.001
+            ok = complete and chi2 < limit
+            print(f"{grid} {algorithm:>8}: {len(counts)}/{trees} trees, "
+                  f"chi2={chi2:.1f} (limit {limit:.1f}) "
+                  f"in {elapsed:.1f}s {'OK' if ok else 'FAIL'}")
+            if not ok:
+                failures.append(f"{grid} {algorithm}")
+    if failures:
+        print(f"Error: not uniform: {', '.join(failures)}")
+        sys.exit(1)
+    print("OK: every algorithm draws the trees uniformly")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,345 @@
+#!/usr/bin/env python3
+# File: division.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/21 10:12:37
+# Updated: 2026/02/21 10:12:37
+
+"""
+Perfect mazes by recursive division, in parallel on large grids.
+
+The maze starts without inner walls. Each chamber is cut in two by a
+wall with a single gap, and both halves are cut in turn until they are
+one cell wide. A chamber draws its wall from its own seed, handed down
+by its parent, so the halves are independent: on large grids the
+chambers below a given depth are divided by a process pool, every
+worker writing into one wall array in shared memory, and the maze does
+not depend on the number of workers.
+
+The 42 cells are obstacles walled in before the division. Walls are
+never opened, so the obstacles can split the tree in pieces; they are
+joined back by opening random walls between them, with a union-find.
+Only the smallest chamber holding the 42 pattern and a ring of cells
+around it is searched: every other chamber hangs from it by a gap.
+"""
+
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+from typing import TYPE_CHECKING, Dict, FrozenSet, List, Tuple
+
+if TYPE_CHECKING:
+    from maze_generator import MazeGenerator
+
+# wall bits of a cell, as in the output file
+N, E, S, W = 1, 2, 4, 8
+# grids with fewer cells are divided in the calling process
+PARALLEL_CELLS: int = 250_000
+# chambers handed to every worker, to even out their sizes
+CHAMBERS_PER_WORKER: int = 4
+# chambers divided with their parent's random stream
+SMALL_CHAMBER: int = 1024
+
+# x, y, width and height of a chamber
+Rect = Tuple[int, int, int, int]
+# a chamber and the seed of its random stream
+Chamber = Tuple[int, int, int, int, int]
+# worker state, set once per process by attach
+_shared: Dict[str, object] = {}
+
+
+def walled_grid(cols: int, rows: int,
+                blocked: FrozenSet[int]) -> bytearray:
+    """
+    Walls of a grid without inner walls, the 42 cells walled in.
+
+    Returns:
+        bytearray: The wall bits of every cell, row by row.
+    """
+    walls = bytearray(cols * rows)
+    for x in range(cols):
+        walls[x] |= N
+        walls[(rows - 1) * cols + x] |= S
+    for y in range(rows):
+        walls[y * cols] |= W
+        walls[y * cols + cols - 1] |= E
+    for i in blocked:
+        walls[i] = N | E | S | W
+        y, x = divmod(i, cols)
+        if y > 0:
+            walls[i - cols] |= S
+        if y < rows - 1:
+            walls[i + cols] |= N
+        if x > 0:
+            walls[i - 1] |= E
+        if x < cols - 1:
+            walls[i + 1] |= W
+    return walls
+
+
+def bounding_box(cols: int, rows: int, blocked: FrozenSet[int]
+                 ) -> Rect | None:
+    """
+    Smallest rectangle holding the 42 cells and a ring of cells around.
+
+    The ring keeps the valid cells of any chamber holding the box
+    connected to each other without leaving the chamber.
+    """
+    if not blocked:
+        return None
+    xs = [i % cols for i in blocked]
+    ys = [i // cols for i in blocked]
+    x0, y0 = max(min(xs) - 1, 0), max(min(ys) - 1, 0)
+    x1, y1 = min(max(xs) + 1, cols - 1), min(max(ys) + 1, rows - 1)
+    return x0, y0, x1 - x0 + 1, y1 - y0 + 1
+
+
+def contains(outer: Rect, inner: Rect) -> bool:
+    """Whether a rectangle lies inside another one."""
+    return outer[0] <= inner[0] and outer[1] <= inner[1] \
+        and inner[0] + inner[2] <= outer[0] + outer[2] \
+        and inner[1] + inner[3] <= outer[1] + outer[3]
+
+
+def split(walls: bytearray | memoryview, cols: int, rect: Rect,
+          rng: random.Random, blocked: FrozenSet[int]
+          ) -> Tuple[List[Rect], bool]:
+    """
+    Cut a chamber in two by a wall with one gap.
+
+    The gap is drawn among the places with a valid cell on both sides.
+
+    Returns:
+        tuple: Both halves, and whether the gap had to open on a 42
+        cell for lack of such a place.
+    """
+    x, y, w, h = rect
+    horizontal = h > w or (h == w and rng.random() < 0.5)
+    if horizontal:
+        # wall under row wy, the gap at column gap
+        wy = y + rng.randrange(h - 1)
+        row = wy * cols
+        gaps = [cx for cx in range(x, x + w)
+                if row + cx not in blocked and row + cols + cx not in blocked]
+        gap = rng.choice(gaps) if gaps else x + rng.randrange(w)
+        for cx in range(x, x + w):
+            if cx != gap:
+                walls[row + cx] |= S
+                walls[row + cols + cx] |= N
+        return [(x, y, w, wy - y + 1), (x, wy + 1, w, y + h - wy - 1)], \
+            not gaps
+    # wall east of column wx, the gap at row gap
+    wx = x + rng.randrange(w - 1)
+    gaps = [cy for cy in range(y, y + h)
+            if cy * cols + wx not in blocked
+            and cy * cols + wx + 1 not in blocked]
+    gap = rng.choice(gaps) if gaps else y + rng.randrange(h)
+    for cy in range(y, y + h):
+        if cy != gap:
+            walls[cy * cols + wx] |= E
+            walls[cy * cols + wx + 1] |= W
+    return [(x, y, wx - x + 1, h), (wx + 1, y, x + w - wx - 1, h)], not gaps
+
+
+def divide(walls: bytearray | memoryview, cols: int, rows: int,
+           chambers: List[Chamber], blocked: FrozenSet[int],
+           depth: int | None = None
+           ) -> Tuple[List[Chamber], Rect | None, List[Rect]]:
+    """
+    Divide chambers down to corridors, or down to a depth.
+
+    Chambers of SMALL_CHAMBER cells or less are divided with a single
+    random stream, seeding one per chamber would cost more than the
+    division itself.
+
+    Args:
+        walls: Wall bits of every cell, written in place.
+        cols (int): Width of the maze.
+        rows (int): Height of the maze.
+        chambers (List[Chamber]): Chambers to divide.
+        blocked (FrozenSet[int]): Ids of the 42 cells.
+        depth (int | None): Divisions after which a chamber is left
+            undivided, None to divide down to corridors.
+
+    Returns:
+        tuple: The chambers left undivided, the smallest chamber seen
+        holding the box around the 42 pattern, and the chambers whose
+        gap had to open on a 42 cell.
+    """
+    box = bounding_box(cols, rows, blocked)
+    left: List[Chamber] = []
+    inner: Rect | None = None
+    forced: List[Rect] = []
+    stack = [(chamber, 0) for chamber in chambers]
+    while stack:
+        chamber, level = stack.pop()
+        if level == depth:
+            left.append(chamber)
+            continue
+        rng = random.Random(chamber[4])
+        rects = [chamber[:4]]
+        while rects:
+            rect = rects.pop()
+            if box is not None and contains(rect, box) and (
+                    inner is None or rect[2] * rect[3] < inner[2] * inner[3]):
+                inner = rect
+            if rect[2] < 2 or rect[3] < 2:
+                continue
+            halves, blocked_gap = split(walls, cols, rect, rng, blocked)
+            if blocked_gap:
+                forced.append(rect)
+            if rect[2] * rect[3] <= SMALL_CHAMBER:
+                rects.extend(halves)
+            else:
+                stack.extend(((*half, rng.getrandbits(64)), level + 1)
+                             for half in halves)
+    return left, inner, forced
+
+
+def attach(name: str, cols: int, rows: int,
+           blocked: FrozenSet[int]) -> None:
+    """Open the shared walls once per worker process."""
+    memory = shared_memory.SharedMemory(name)
+    _shared.update(memory=memory, cols=cols, rows=rows, blocked=blocked)
+
+
+def divide_shared(chamber: Chamber) -> Tuple[Rect | None, List[Rect]]:
+    """Divide one chamber of the shared walls, in a worker process."""
+    memory = _shared["memory"]
+    cols, rows = _shared["cols"], _shared["rows"]
+    blocked = _shared["blocked"]
+    assert isinstance(memory, shared_memory.SharedMemory)
+    assert isinstance(cols, int) and isinstance(rows, int)
+    assert isinstance(blocked, frozenset)
+    assert memory.buf is not None
+    _, inner, forced = divide(memory.buf, cols, rows, [chamber], blocked)
+    return inner, forced
+
+
+def divide_in_pool(walls: bytearray, cols: int, rows: int,
+                   chambers: List[Chamber], blocked: FrozenSet[int],
+                   workers: int) -> List[Tuple[Rect | None, List[Rect]]]:
+    """
+    Divide chambers in a process pool sharing the walls.
+
+    Returns:
+        list: What divide found in every chamber, the smallest chamber
+        holding the box around the 42 pattern and the forced gaps.
+    """
+    memory = shared_memory.SharedMemory(create=True, size=len(walls))
+    shared = memory.buf
+    assert shared is not None
+    try:
+        shared[:len(walls)] = walls
+        with ProcessPoolExecutor(workers, initializer=attach,
+                                 initargs=(memory.name, cols, rows, blocked)
+                                 ) as pool:
+            results = list(pool.map(divide_shared, chambers))
+        walls[:] = shared[:len(walls)]
+    finally:
+        memory.close()
+        memory.unlink()
+    return results
+
+
+def reconnect(walls: bytearray, cols: int, chamber: Rect,
+              blocked: FrozenSet[int], rng: random.Random) -> int:
+    """
+    Join the pieces of a chamber by opening random walls.
+
+    Walls between two pieces are opened in random order, skipping the
+    ones between cells already joined (Kruskal).
+
+    Returns:
+        int: The number of walls opened.
+    """
+    x0, y0, w, h = chamber
+    parent: Dict[int, int] = {}
+
+    def find(i: int) -> int:
+        root = i
+        while parent.setdefault(root, root) != root:
+            root = parent[root]
+        while parent[i] != root:
+            parent[i], i = root, parent[i]
+        return root
+
+    candidates: List[Tuple[int, int, int]] = []
+    for y in range(y0, y0 + h):
+        for x in range(x0, x0 + w):
+            i = y * cols + x
+            if i in blocked:
+                continue
+            for bit, j, inside in ((E, i + 1, x + 1 < x0 + w),
+                                   (S, i + cols, y + 1 < y0 + h)):
+                if not inside or j in blocked:
+                    continue
+                if walls[i] & bit:
+                    candidates.append((i, j, bit))
+                else:
+                    parent[find(j)] = find(i)
+    rng.shuffle(candidates)
+    opened = 0
+    for i, j, bit in candidates:
+        a, b = find(i), find(j)
+        if a == b:
+            continue
+        parent[b] = a
+        walls[i] &= ~bit
+        walls[j] &= ~(W if bit == E else N)
+        opened += 1
+    return opened
+
+
+def recursive_division(maze: "MazeGenerator") -> None:
+    """
+    Carve a perfect maze by recursive division.
+
+    Grids of PARALLEL_CELLS cells or more are divided by
+    DIVISION_WORKERS processes, every core when 0.
+
+    Args:
+        maze (MazeGenerator): A maze not carved yet.
+    """
+    cols, rows = maze.cols, maze.rows
+    blocked = frozenset(y * cols + x
+                        for x, y in maze.get_42_cells(cols, rows))
+    walls = walled_grid(cols, rows, blocked)
+    rng = random.Random(maze.seed)
+    root: Chamber = (0, 0, cols, rows, rng.getrandbits(64))
+    workers = maze.division_workers or os.cpu_count() or 1
+
+    if workers > 1 and cols * rows >= PARALLEL_CELLS:
+        depth = (CHAMBERS_PER_WORKER * workers - 1).bit_length()
+        farmed, inner, forced = divide(walls, cols, rows, [root], blocked,
+                                       depth)
+        for found, blocked_gaps in divide_in_pool(walls, cols, rows, farmed,
+                                                  blocked, workers):
+            forced += blocked_gaps
+            if found is not None and (inner is None or found[2] * found[3]
+                                      < inner[2] * inner[3]):
+                inner = found
+        tasks = len(farmed)
+    else:
+        _, inner, forced = divide(walls, cols, rows, [root], blocked)
+        tasks = 0
+
+    # every chamber outside the inner one hangs from it by a valid gap,
+    # unless a gap had to open on a 42 cell
+    opened = 0
+    if inner is not None:
+        if not all(contains(inner, rect) for rect in forced):
+            inner = root[:4]
+        opened = reconnect(walls, cols, inner, blocked, rng)
+
+    for y, row in enumerate(maze.grid):
+        for x, cell in enumerate(row):
+            bits = walls[y * cols + x]
+            cell.walls = {"W": bits >> 3 & 1, "S": bits >> 2 & 1,
+                          "E": bits >> 1 & 1, "N": bits & 1}
+            cell.visited = not cell._is_42
+    maze.unvisited.clear()
+    if maze.metrics is not None:
+        maze.metrics.count("division_tasks", tasks)
+        maze.metrics.count("reconnected_walls", opened)
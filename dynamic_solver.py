@@ -0,0 +1,350 @@
+#!/usr/bin/env python3
+# File: dynamic_solver.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/23 09:52:16
+# Updated: 2026/02/23 09:52:16
+
+"""
+Shortest path kept up to date while walls are opened and closed.
+
+The solver keeps the distance of every cell from the entry and the
+direction of its parent in a BFS tree, in flat arrays. Opening a wall
+can only shorten distances: they are lowered by a BFS starting from
+the new passage and stopping where nothing gets shorter. Closing a
+wall only matters when it cuts a passage of the tree: the cells below
+it lose their distance and take the best one offered by their
+neighbors outside, spread by a Dijkstra inside the cut subtree. Both
+only visit cells whose distance or parent changes. Many walls changed
+at once are set together and repaired by one such Dijkstra, so that
+no passage is cut while another one is still to be opened.
+
+The path is the chain of parents from the exit. After an edit it is
+kept up to the last cell that did not change, and only the part after
+it is walked again.
+"""
+
+import heapq
+from array import array
+from collections import deque
+from typing import Dict, Iterable, List, Set, Tuple
+
+# N, E, S, W: wall bit, letter and opposite direction of each index
+BITS: Tuple[int, ...] = (1, 2, 4, 8)
+LETTERS: str = "NESW"
+OPPOSITE: Tuple[int, ...] = (2, 3, 0, 1)
+# parent of the entry and of the cells out of reach
+NO_PARENT: int = 255
+
+
+class DynamicSolver:
+    """
+    Distance field, BFS tree and path of a maze, updated per wall edit.
+
+    Walls are bits of one byte per cell, N=1, E=2, S=4, W=8 as in the
+    output file. The outer border and the 42 cells must stay walled.
+
+    Attributes:
+        cols (int): Width of the maze.
+        rows (int): Height of the maze.
+        walls (bytearray): Wall bits of every cell, row by row.
+        entry (int): Id of the entry cell, y * cols + x.
+        exit (int): Id of the exit cell.
+        distance (array): Steps from the entry, -1 out of reach.
+        parent (bytearray): Direction of the parent of every cell.
+        route (List[int]): Cells of the path, from the entry.
+        visited (int): Cells whose distance was set by the last edit.
+        stale (bool): Walls were set by defer, distances and path are
+            computed again on the next edit or path read.
+    """
+
+    def __init__(self, cols: int, rows: int, walls: bytearray,
+                 entry: int, exit: int) -> None:
+        """
+        Solve the maze once with a full BFS.
+
+        Args:
+            cols (int): Width of the maze.
+            rows (int): Height of the maze.
+            walls (bytearray): Wall bits, kept and updated in place.
+            entry (int): Id of the entry cell.
+            exit (int): Id of the exit cell.
+        """
+        self.cols: int = cols
+        self.rows: int = rows
+        self.walls: bytearray = walls
+        self.entry: int = entry
+        self.exit: int = exit
+        self.steps: Tuple[int, ...] = (-cols, 1, cols, -1)
+        self.distance: array = array("i", [-1]) * (cols * rows)
+        self.parent: bytearray = bytearray([NO_PARENT]) * (cols * rows)
+        self.route: List[int] = []
+        self.moves: List[str] = []
+        self.on_route: Dict[int, int] = {}
+        self.visited: int = 0
+        self.stale: bool = False
+        self._path: str | None = None
+        self.solve()
+
+    def solve(self) -> None:
+        """Compute every distance and the path from scratch."""
+        distance, parent, walls = self.distance, self.parent, self.walls
+        for i in range(len(distance)):
+            distance[i] = -1
+            parent[i] = NO_PARENT
+        distance[self.entry] = 0
+        queue = deque([self.entry])
+        while queue:
+            cell = queue.popleft()
+            reach = distance[cell] + 1
+            for d, step in enumerate(self.steps):
+                if not walls[cell] & BITS[d] and distance[cell + step] < 0:
+                    distance[cell + step] = reach
+                    parent[cell + step] = OPPOSITE[d]
+                    queue.append(cell + step)
+        self.visited = len(distance)
+        self.stale = False
+        self.route, self.moves, self.on_route = [], [], {}
+        self._path = None
+        self.update_route(set())
+
+    @property
+    def path(self) -> str:
+        """Directions from the entry to the exit, empty out of reach."""
+        self.refresh()
+        if self._path is None:
+            self._path = "".join(self.moves)
+        return self._path
+
+    def open_wall(self, cell: int, d: int) -> None:
+        """
+        Open the wall of a cell in a direction and lower the distances.
+
+        Args:
+            cell (int): Id of the cell.
+            d (int): Index of the direction in N, E, S, W.
+        """
+        self.refresh()
+        other = cell + self.steps[d]
+        self.walls[cell] &= ~BITS[d]
+        self.walls[other] &= ~BITS[OPPOSITE[d]]
+        changed: Set[int] = set()
+        distance = self.distance
+        for near, far, towards in ((cell, other, OPPOSITE[d]),
+                                   (other, cell, d)):
+            if distance[near] >= 0 and (distance[far] < 0
+                                        or distance[near] + 1 < distance[far]):
+                distance[far] = distance[near] + 1
+                self.parent[far] = towards
+                changed.add(far)
+                self.lower(far, changed)
+        self.visited = len(changed)
+        self.update_route(changed)
+
+    def lower(self, start: int, changed: Set[int]) -> None:
+        """Spread a shorter distance from a cell to its neighbors."""
+        distance, parent, walls = self.distance, self.parent, self.walls
+        queue = deque([start])
+        while queue:
+            cell = queue.popleft()
+            reach = distance[cell] + 1
+            for d, step in enumerate(self.steps):
+                neighbor = cell + step
+                if not walls[cell] & BITS[d] and (
+                        distance[neighbor] < 0 or reach < distance[neighbor]):
+                    distance[neighbor] = reach
+                    parent[neighbor] = OPPOSITE[d]
+                    changed.add(neighbor)
+                    queue.append(neighbor)
+
+    def close_wall(self, cell: int, d: int) -> None:
+        """
+        Close the wall of a cell in a direction and repair the subtree
+        the closed passage held, if any.
+
+        Args:
+            cell (int): Id of the cell.
+            d (int): Index of the direction in N, E, S, W.
+        """
+        self.refresh()
+        other = cell + self.steps[d]
+        cut = self.cut_by(cell, d)
+        self.walls[cell] |= BITS[d]
+        self.walls[other] |= BITS[OPPOSITE[d]]
+        changed = self.subtree(cut)
+        if 2 * len(changed) > len(self.distance):
+            # most of the tree is cut: a BFS is cheaper than the heap
+            self.solve()
+            return
+        self.rebuild(changed)
+        self.visited = len(changed)
+        self.update_route(changed)
+
+    def cut_by(self, cell: int, d: int) -> List[int]:
+        """The cell cut from its parent by closing a passage, if any."""
+        other = cell + self.steps[d]
+        if self.parent[other] == OPPOSITE[d]:
+            return [other]
+        if self.parent[cell] == d:
+            return [cell]
+        return []
+
+    def subtree(self, roots: Iterable[int]) -> Set[int]:
+        """
+        Cells below some cells in the BFS tree, the cells included.
+
+        The walk stops past half the maze, a BFS is cheaper then.
+        """
+        parent = self.parent
+        size = len(parent)
+        subtree = set(roots)
+        stack = list(subtree)
+        while stack and 2 * len(subtree) <= size:
+            cell = stack.pop()
+            for d, step in enumerate(self.steps):
+                child = cell + step
+                # a tree passage, the parent of the child is the cell
+                if 0 <= child < size and parent[child] == OPPOSITE[d] \
+                        and child not in subtree:
+                    subtree.add(child)
+                    stack.append(child)
+        return subtree
+
+    def rebuild(self, subtree: Set[int],
+                opened: Iterable[Tuple[int, int]] = ()) -> Set[int]:
+        """
+        Give new distances to a cut subtree and across opened passages.
+
+        The cells outside the subtree keep a path as long as their
+        distance, so it can only get shorter, through the subtree or an
+        opened passage.
+
+        Returns:
+            Set[int]: The cells whose distance changed.
+        """
+        distance, parent, walls = self.distance, self.parent, self.walls
+        for cell in subtree:
+            distance[cell] = -1
+            parent[cell] = NO_PARENT
+
+        # best distance offered to every cell by the rest of the maze
+        heap: List[Tuple[int, int, int]] = []
+        for cell in subtree:
+            for d, step in enumerate(self.steps):
+                neighbor = cell + step
+                if not walls[cell] & BITS[d] and distance[neighbor] >= 0:
+                    heap.append((distance[neighbor] + 1, cell, d))
+        for cell, d in opened:
+            for near, far, towards in ((cell, cell + self.steps[d],
+                                        OPPOSITE[d]),
+                                       (cell + self.steps[d], cell, d)):
+                if distance[near] >= 0:
+                    heap.append((distance[near] + 1, far, towards))
+        heapq.heapify(heap)
+        changed: Set[int] = set()
+        while heap:
+            reach, cell, d = heapq.heappop(heap)
+            if 0 <= distance[cell] <= reach:
+                continue
+            distance[cell] = reach
+            parent[cell] = d
+            changed.add(cell)
+            for d, step in enumerate(self.steps):
+                neighbor = cell + step
+                if not walls[cell] & BITS[d] and not 0 <= distance[neighbor] \
+                        <= reach + 1:
+                    heapq.heappush(heap, (reach + 1, neighbor, OPPOSITE[d]))
+        return changed
+
+    def update_route(self, changed: Set[int]) -> None:
+        """
+        Follow the parents from the exit back to the old path.
+
+        The cells of the old path that did not change keep their
+        parents and distances, so the path is kept up to the last of
+        them met from the exit.
+        """
+        if self.distance[self.exit] < 0:
+            if self.route:
+                self.route, self.moves, self.on_route = [], [], {}
+                self._path = None
+            return
+        if self.route and self.exit not in changed \
+                and not any(cell in self.on_route for cell in changed):
+            return
+        tail: List[int] = []
+        cell = self.exit
+        while cell != self.entry and (cell not in self.on_route
+                                      or cell in changed):
+            tail.append(cell)
+            cell += self.steps[self.parent[cell]]
+        keep = self.on_route.get(cell, 0)
+        for dropped in self.route[keep + 1:]:
+            del self.on_route[dropped]
+        del self.route[keep + 1:]
+        del self.moves[keep:]
+        if not self.route:
+            self.route.append(self.entry)
+            self.on_route[self.entry] = 0
+        for cell in reversed(tail):
+            self.on_route[cell] = len(self.route)
+            self.route.append(cell)
+            self.moves.append(LETTERS[OPPOSITE[self.parent[cell]]])
+        self._path = None
+
+    def sync(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Apply the walls of some cells changed outside the solver.
+
+        Every wall is set first, then the subtrees cut by the closed
+        passages and the cells reached sooner through the opened ones
+        are repaired by one Dijkstra, a BFS when most of the maze is
+        cut.
+
+        Args:
+            cells: Id and new wall bits of every cell changed.
+        """
+        self.refresh()
+        walls = self.walls
+        opened: List[Tuple[int, int]] = []
+        roots: List[int] = []
+        for cell, bits in cells:
+            for d in range(4):
+                if not (bits ^ walls[cell]) & BITS[d]:
+                    continue
+                other = cell + self.steps[d]
+                if bits & BITS[d]:
+                    roots += self.cut_by(cell, d)
+                    walls[cell] |= BITS[d]
+                    walls[other] |= BITS[OPPOSITE[d]]
+                else:
+                    opened.append((cell, d))
+                    walls[cell] &= ~BITS[d]
+                    walls[other] &= ~BITS[OPPOSITE[d]]
+        cut = self.subtree(roots)
+        if 2 * len(cut) > len(self.distance):
+            self.solve()
+            return
+        changed = self.rebuild(cut, opened) | cut
+        self.visited = len(changed)
+        self.update_route(changed)
+
+    def defer(self, cells: Iterable[Tuple[int, int]]) -> None:
+        """
+        Set the walls of some cells and solve again only when needed.
+
+        For edits whose path is known by other means: the distances
+        are computed by a full BFS on the next edit or path read.
+
+        Args:
+            cells: Id and new wall bits of every cell changed.
+        """
+        for cell, bits in cells:
+            self.walls[cell] = bits
+        self.stale = True
+        self._path = None
+
+    def refresh(self) -> None:
+        """Solve again after walls set by defer."""
+        if self.stale:
+            self.solve()
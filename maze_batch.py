@@ -0,0 +1,408 @@
+#!/usr/bin/env python3
+# File: maze_batch.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/20 09:27:51
+# Updated: 2026/02/20 09:27:51
+
+"""
+Batch engine for many small mazes of the same size.
+
+The walls of B mazes are kept in one (B, H, W) array of nibbles
+(N=1, E=2, S=4, W=8) and every step of the carving, of the BFS and of
+the export works on the whole batch at once, so that no Python object
+is created per cell. All mazes share the size, the entry, the exit and
+the 42 pattern; they are perfect.
+
+Algorithms:
+    BINARY_TREE: every cell opens towards a random neighbor closer to
+        the top right corner, N or E on a plain grid.
+    SIDEWINDER: rows are cut in runs opened to the east, each run
+        opens north from one of its cells.
+    ALDOUS_BRODER: one random walk per maze, uniform mazes.
+
+Usage: python3 maze_batch.py COUNT [--size 15x10] [--algorithm name]
+           [--seed N] [--entry x,y] [--exit x,y] [--output file]
+"""
+
+import argparse
+import time
+from collections import deque
+from typing import List, Tuple
+
+import numpy as np
+
+from maze_config import MazeConfig
+from popping import neighbor_table
+
+ALGORITHMS: List[str] = ["BINARY_TREE", "SIDEWINDER", "ALDOUS_BRODER"]
+# N, E, S, W: wall bit, offset and opposite direction of each index
+BITS = np.array([1, 2, 4, 8], dtype=np.uint8)
+DX: Tuple[int, ...] = (0, 1, 0, -1)
+DY: Tuple[int, ...] = (-1, 0, 1, 0)
+OPPOSITE: Tuple[int, ...] = (2, 3, 0, 1)
+HEX = np.frombuffer(b"0123456789ABCDEF", dtype=np.uint8)
+LETTERS = np.frombuffer(b"NESW", dtype=np.uint8)
+
+
+def shifted(d: int) -> Tuple[Tuple[slice, slice], Tuple[slice, slice]]:
+    """
+    Slices pairing the cells with their neighbor in a direction.
+
+    Returns:
+        tuple: (rows, cols) slices of the cells having a neighbor in
+        direction d, and the slices of those neighbors.
+    """
+    def cut(offset: int) -> Tuple[slice, slice]:
+        if offset < 0:
+            return slice(1, None), slice(None, -1)
+        if offset > 0:
+            return slice(None, -1), slice(1, None)
+        return slice(None), slice(None)
+
+    (ys, ny), (xs, nx) = cut(DY[d]), cut(DX[d])
+    return (ys, xs), (ny, nx)
+
+
+class MazeBatch:
+    """
+    Carve, solve and export a batch of mazes along a NumPy batch axis.
+
+    Attributes:
+        count (int): Number of mazes B.
+        cols (int): Width of every maze.
+        rows (int): Height of every maze.
+        entry (tuple): Entry of every maze.
+        exit (tuple): Exit of every maze.
+        valid (np.ndarray): (H, W) mask of the cells outside the 42.
+        walls (np.ndarray): (B, H, W) walls of the mazes.
+        paths (List[str]): Shortest path of every maze, once solved.
+    """
+
+    def __init__(self, count: int, cols: int, rows: int,
+                 entry: Tuple[int, int] = (0, 0),
+                 exit: Tuple[int, int] | None = None) -> None:
+        """
+        Prepare an uncarved batch.
+
+        Args:
+            count (int): Number of mazes.
+            cols (int): Width of the mazes.
+            rows (int): Height of the mazes.
+            entry (tuple): Entry of the mazes.
+            exit (tuple | None): Exit, the bottom right cell by default.
+
+        Raises:
+            ValueError: If the size is too small or the entry or the exit
+                is outside the maze or in the 42 pattern.
+        """
+        if count < 1 or cols < 2 or rows < 2:
+            raise ValueError("need at least one maze of 2x2 cells")
+        self.count: int = count
+        self.cols: int = cols
+        self.rows: int = rows
+        self.entry: Tuple[int, int] = entry
+        self.exit: Tuple[int, int] = exit or (cols - 1, rows - 1)
+        self.valid: np.ndarray = np.ones((rows, cols), dtype=bool)
+        for x, y in MazeConfig.get_42_cells(cols, rows):
+            self.valid[y, x] = False
+        for name, (x, y) in (("entry", self.entry), ("exit", self.exit)):
+            if not (0 <= x < cols and 0 <= y < rows) or not self.valid[y, x]:
+                raise ValueError(f"invalid {name} {x},{y}")
+        if self.entry == self.exit:
+            raise ValueError("entry and exit cannot be the same cell")
+        self.walls: np.ndarray = np.full((count, rows, cols), 15,
+                                         dtype=np.uint8)
+        self.paths: List[str] = []
+        self.generator: np.random.Generator = np.random.default_rng()
+
+    def generate(self, algorithm: str = "BINARY_TREE",
+                 seed: int | None = None) -> None:
+        """
+        Carve and solve every maze.
+
+        Args:
+            algorithm (str): One of ALGORITHMS.
+            seed (int | None): Seed of the whole batch.
+        """
+        self.generator = np.random.Generator(np.random.PCG64(seed))
+        self.walls[:] = 15
+        if algorithm == "BINARY_TREE":
+            self.binary_tree()
+        elif algorithm == "SIDEWINDER":
+            self.sidewinder()
+        elif algorithm == "ALDOUS_BRODER":
+            self.aldous_broder()
+        else:
+            raise ValueError(f"Invalid algorithm: pick "
+                             f"{', '.join(ALGORITHMS)}")
+        self.solve()
+
+    def neighbors_valid(self) -> np.ndarray:
+        """(H, W, 4) mask of the valid neighbors of the valid cells."""
+        ok = np.zeros((self.rows, self.cols, 4), dtype=bool)
+        for d in range(4):
+            cells, neighbors = shifted(d)
+            ok[cells + (d,)] = self.valid[cells] & self.valid[neighbors]
+        return ok
+
+    def open_all(self, choice: np.ndarray) -> None:
+        """
+        Open the wall of every cell in its chosen direction.
+
+        Args:
+            choice (np.ndarray): (B, H, W) direction of each cell, -1 to
+                keep its walls.
+        """
+        for d in range(4):
+            cells, neighbors = shifted(d)
+            selected = choice[(slice(None),) + cells] == d
+            self.walls[(slice(None),) + cells][selected] &= ~BITS[d]
+            self.walls[(slice(None),) + neighbors][selected] &= \
+                ~BITS[OPPOSITE[d]]
+
+    def open_walls(self, batch: np.ndarray, y: np.ndarray, x: np.ndarray,
+                   d: np.ndarray) -> None:
+        """Open one wall in some mazes, each at its own cell."""
+        self.walls[batch, y, x] &= ~BITS[d]
+        self.walls[batch, y + np.take(DY, d), x + np.take(DX, d)] &= \
+            ~BITS[np.take(OPPOSITE, d)]
+
+    def binary_tree(self) -> None:
+        """
+        Open every cell towards a random neighbor closer to the corner.
+
+        Distances to the top right corner are taken around the 42
+        pattern, so that each cell but the corner has a neighbor closer
+        to it and the mazes stay spanning trees.
+        """
+        root = (0, self.cols - 1)
+        distance = np.full((self.rows, self.cols), -1, dtype=np.int64)
+        distance[root] = 0
+        queue = deque([root])
+        ok = self.neighbors_valid()
+        while queue:
+            y, x = queue.popleft()
+            for d in range(4):
+                ny, nx = y + DY[d], x + DX[d]
+                if ok[y, x, d] and distance[ny, nx] < 0:
+                    distance[ny, nx] = distance[y, x] + 1
+                    queue.append((ny, nx))
+        closer = np.zeros_like(ok)
+        for d in range(4):
+            cells, neighbors = shifted(d)
+            closer[cells + (d,)] = ok[cells + (d,)] \
+                & (distance[neighbors] < distance[cells])
+        # pick the k-th closer neighbor of each cell, k uniform
+        counts = closer.sum(axis=2)
+        k = (self.generator.random((self.count, self.rows, self.cols))
+             * counts).astype(np.int64)
+        rank = np.cumsum(closer, axis=2)
+        choice = (rank[None] > k[..., None]).argmax(axis=3)
+        choice[:, counts == 0] = -1
+        self.open_all(choice)
+
+    def sidewinder(self) -> None:
+        """
+        Carve the rows in runs, each run opening north once.
+
+        A run may only stop at random once one of its cells can open
+        north. A run stopped by the 42 pattern or the border without
+        such a cell opens west into the previous run of its row.
+
+        Raises:
+            ValueError: If a row of cells between the 42 pattern and
+                the border cannot open north at all.
+        """
+        B = self.count
+        batch = np.arange(B)
+        north = np.zeros_like(self.valid)
+        north[1:] = self.valid[1:] & self.valid[:-1]
+        for y in range(self.rows):
+            segments = np.split(np.arange(self.cols),
+                                np.flatnonzero(~self.valid[y]))
+            for segment in segments:
+                segment = segment[self.valid[y, segment]]
+                if not len(segment):
+                    continue
+                if y > 0 and not north[y, segment].any():
+                    raise ValueError("SIDEWINDER cannot carve around "
+                                     "this 42 pattern")
+                seen = np.zeros(B, dtype=np.int64)
+                pick = np.zeros(B, dtype=np.int64)
+                start = np.full(B, segment[0], dtype=np.int64)
+                for x in segment:
+                    if north[y, x]:
+                        # uniform pick of a north cell of the run
+                        seen += 1
+                        swap = self.generator.random(B) * seen < 1
+                        pick[swap] = x
+                    last = x == segment[-1]
+                    if y == 0:
+                        close = np.full(B, last)
+                    elif last:
+                        close = np.ones(B, dtype=bool)
+                    else:
+                        close = (self.generator.random(B) < 0.5) & (seen > 0)
+                    up = close & (seen > 0)
+                    self.open_walls(batch[up], np.full(up.sum(), y),
+                                    pick[up], np.zeros(up.sum(), np.int64))
+                    west = close & (seen == 0) & (y > 0)
+                    self.open_walls(batch[west], np.full(west.sum(), y),
+                                    start[west],
+                                    np.full(west.sum(), 3, np.int64))
+                    east = ~close
+                    self.open_walls(batch[east], np.full(east.sum(), y),
+                                    np.full(east.sum(), x),
+                                    np.ones(east.sum(), np.int64))
+                    seen[close] = 0
+                    start[close] = x + 1
+
+    def aldous_broder(self) -> None:
+        """
+        Walk at random in every maze until each cell is visited.
+
+        The walk opens the wall into each cell it reaches first; the
+        walks of the finished mazes are dropped.
+        """
+        neighbors, directions, degrees = neighbor_table(self.valid)
+        total = int(self.valid.sum())
+        x, y = self.entry
+        position = np.full(self.count, y * self.cols + x, dtype=np.int64)
+        batch = np.arange(self.count)
+        visited = np.zeros((self.count, self.rows * self.cols), dtype=bool)
+        visited[:, position[0]] = True
+        seen = np.ones(self.count, dtype=np.int64)
+        while len(batch):
+            slot = (self.generator.random(len(batch))
+                    * degrees[position]).astype(np.int64)
+            target = neighbors[position, slot]
+            new = ~visited[batch, target]
+            if new.any():
+                cells = position[new]
+                self.open_walls(batch[new], cells // self.cols,
+                                cells % self.cols,
+                                directions[cells, slot[new]])
+                visited[batch[new], target[new]] = True
+                seen[batch[new]] += 1
+            position = target
+            running = seen[batch] < total
+            batch, position = batch[running], position[running]
+
+    def solve(self) -> List[str]:
+        """
+        Find the shortest path of every maze with one batched BFS.
+
+        Returns:
+            List[str]: The path of every maze, also kept in paths.
+        """
+        B = self.count
+        distance = np.full((B, self.rows, self.cols), -1, dtype=np.int32)
+        ex, ey = self.entry
+        frontier = np.zeros((B, self.rows, self.cols), dtype=bool)
+        frontier[:, ey, ex] = True
+        distance[:, ey, ex] = 0
+        xx, xy = self.exit
+        # open walls of every direction, as (cells, neighbors, mask)
+        passages = []
+        for d in range(4):
+            cells, neighbors = shifted(d)
+            index = (slice(None),) + cells
+            passages.append((index, (slice(None),) + neighbors,
+                             self.walls[index] & BITS[d] == 0))
+        step = 0
+        while frontier.any() and (distance[:, xy, xx] < 0).any():
+            step += 1
+            reached = np.zeros_like(frontier)
+            for index, target, passage in passages:
+                reached[target] |= frontier[index] & passage
+            frontier = reached & (distance < 0)
+            np.copyto(distance, step, where=frontier)
+        # direction of the step into every cell from the one before it
+        came = np.zeros((B, self.rows, self.cols), dtype=np.uint8)
+        for d, (index, target, passage) in enumerate(passages):
+            np.copyto(came[target], d, where=passage
+                      & (distance[target] == distance[index] + 1))
+        lengths = distance[:, xy, xx]
+        if (lengths < 0).any():
+            raise ValueError("exit unreachable in some mazes")
+
+        # walk back from the exit, the longest paths first
+        longest = int(lengths.max())
+        moves = np.zeros((B, longest), dtype=np.uint8)
+        order = np.argsort(-lengths, kind="stable")
+        y = np.full(B, xy, dtype=np.int64)
+        x = np.full(B, xx, dtype=np.int64)
+        moving = 0
+        for k in range(longest, 0, -1):
+            while moving < B and lengths[order[moving]] >= k:
+                moving += 1
+            batch = order[:moving]
+            into = came[batch, y[:moving], x[:moving]]
+            moves[batch, k - 1] = into
+            y[:moving] -= np.take(DY, into)
+            x[:moving] -= np.take(DX, into)
+        letters = LETTERS[moves]
+        self.paths = [letters[b, :lengths[b]].tobytes().decode()
+                      for b in range(B)]
+        return self.paths
+
+    def export(self, output_file: str) -> None:
+        """
+        Write every maze in the output file format, in one write.
+
+        Mazes are separated by an empty line.
+
+        Args:
+            output_file (str): Destination file.
+        """
+        text = HEX[self.walls]
+        newlines = np.full((self.count, self.rows, 1), ord("\n"),
+                           dtype=np.uint8)
+        grids = np.concatenate([text, newlines], axis=2).reshape(
+                self.count, -1)
+        x, y = self.entry
+        ex, ey = self.exit
+        points = f"\n{x},{y}\n{ex},{ey}\n".encode()
+        chunks = [grid.tobytes() + points + path.encode() + b"\n"
+                  for grid, path in zip(grids, self.paths)]
+        with open(output_file, "wb") as f:
+            f.write(b"\n".join(chunks))
+
+
+def parse_point(value: str) -> Tuple[int, int]:
+    """Parse x,y."""
+    x, y = (int(v) for v in value.split(","))
+    return x, y
+
+
+def main() -> None:
+    """Generate a batch of mazes from the command line."""
+    parser = argparse.ArgumentParser(description="Batch maze generation")
+    parser.add_argument("count", type=int, help="number of mazes")
+    parser.add_argument("--size", default="15x10",
+                        help="maze size as WIDTHxHEIGHT")
+    parser.add_argument("--algorithm", default="BINARY_TREE",
+                        choices=ALGORITHMS)
+    parser.add_argument("--seed", type=int, default=None)
+    parser.add_argument("--entry", type=parse_point, default=(0, 0))
+    parser.add_argument("--exit", type=parse_point, default=None)
+    parser.add_argument("--output", default="mazes.txt")
+    args = parser.parse_args()
+
+    width, height = (int(v) for v in args.size.split("x"))
+    start = time.perf_counter()
+    try:
+        batch = MazeBatch(args.count, width, height, args.entry, args.exit)
+        batch.generate(args.algorithm, args.seed)
+        batch.export(args.output)
+    except (ValueError, OSError) as e:
+        print(f"Error: {e}")
+        raise SystemExit(1)
+    elapsed = time.perf_counter() - start
+    print(f"{args.count} mazes written to {args.output} in {elapsed:.2f}s "
+          f"({args.count / elapsed:.0f} mazes/s)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,255 @@
+#!/usr/bin/env python3
+# File: maze_cache.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/17 11:12:05
+# Updated: 2026/02/17 11:12:05
+
+"""
+On-disk cache of seeded mazes.
+
+A seeded maze only depends on its size, seed, algorithm, PERFECT,
+entry, exit or their placement, 42 pattern, random stream and on the
+code carving it, so a finished maze is stored under a hash of these
+and read back instead of generated again. Entries use the format of
+the output file.
+
+Usage: python3 maze_cache.py [directory] [--clear]
+"""
+
+import hashlib
+import os
+import sys
+import tempfile
+from typing import TYPE_CHECKING, Dict, List, Tuple
+
+if TYPE_CHECKING:
+    from maze_generator import MazeGenerator
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+# modules whose code decides the maze of a seed
+CODE_FILES: List[str] = [
+        "maze_generator.py", "cell.py", "maze_config.py", "rng.py",
+        "popping.py", "division.py", "placement.py",
+        ]
+SUFFIX: str = ".maze"
+# wall of each bit of a cell, see Cell.hex_repr
+BITS: Dict[str, int] = {"N": 1, "E": 2, "S": 4, "W": 8}
+
+_code_version: str | None = None
+
+
+def code_version() -> str:
+    """Hash of the generation code, computed once per process."""
+    global _code_version
+    if _code_version is None:
+        digest = hashlib.sha256()
+        for name in CODE_FILES:
+            with open(os.path.join(ROOT, name), "rb") as f:
+                digest.update(f.read())
+        _code_version = digest.hexdigest()[:16]
+    return _code_version
+
+
+class MazeCache:
+    """
+    Content-addressed maze files with a size bound.
+
+    Files are written to a temporary name and renamed, so that
+    concurrent processes never read a partial entry. Reading an entry
+    touches it, and the least recently used entries are deleted once
+    the directory grows past max_bytes.
+    """
+
+    DIRECTORY: str = ".maze_cache"
+    MAX_BYTES: int = 64 * 1024 * 1024
+    # one cache per directory, so that the statistics cover the run
+    shared: Dict[str, "MazeCache"] = {}
+
+    def __init__(self, directory: str | None = None,
+                 max_bytes: int | None = None) -> None:
+        """
+        Open a cache directory, created on the first store.
+
+        Args:
+            directory (str | None): Where entries are kept, DIRECTORY
+                by default.
+            max_bytes (int | None): Size bound of the directory,
+                MAX_BYTES by default.
+        """
+        self.directory: str = directory or self.DIRECTORY
+        self.max_bytes: int = (
+                max_bytes if max_bytes is not None else self.MAX_BYTES
+                )
+        self.size: int | None = None
+        self.stats: Dict[str, int] = {
+                "hits": 0, "misses": 0, "stores": 0, "evictions": 0,
+                }
+
+    @classmethod
+    def get(cls, directory: str, max_bytes: int) -> "MazeCache":
+        """Return the cache of a directory, opening it once."""
+        cache = cls.shared.get(directory)
+        if cache is None or cache.max_bytes != max_bytes:
+            cache = cls.shared[directory] = cls(directory, max_bytes)
+        return cache
+
+    def key(self, maze: "MazeGenerator") -> str:
+        """Hash of everything that decides the maze."""
+        mask = ";".join(f"{x},{y}" for x, y in
+                        maze.get_42_cells(maze.cols, maze.rows))
+        # automatic points move once carved, their settings are kept
+        entry = "AUTO" if maze.auto_entry else maze.entry
+        exit = "AUTO" if maze.auto_exit else maze.exit
+        params = (f"{maze.cols}x{maze.rows}|{maze.seed}|{maze.algorithm}|"
+                  f"{maze.perfect}|{entry}|{exit}|{mask}|"
+                  f"{maze.rng_name}|{maze.hybrid_fraction}|"
+                  f"{maze.auto_border}|{maze.auto_distance}|"
+                  f"{code_version()}")
+        return hashlib.sha256(params.encode()).hexdigest()
+
+    def path(self, key: str) -> str:
+        """File of an entry."""
+        return os.path.join(self.directory, key + SUFFIX)
+
+    def load(self, maze: "MazeGenerator") -> bool:
+        """
+        Fill a maze from its cached entry.
+
+        Args:
+            maze (MazeGenerator): A maze not carved yet.
+
+        Returns:
+            bool: True on a hit, the maze is then carved and solved.
+        """
+        path = self.path(self.key(maze))
+        try:
+            with open(path) as f:
+                lines = f.read().split("\n")
+            os.utime(path)
+        except OSError:
+            self.stats["misses"] += 1
+            return False
+        rows, solution = lines[:maze.rows], lines[maze.rows + 3:]
+        try:
+            # automatic points are stored with the maze
+            entry, exit = (tuple(int(v) for v in line.split(","))
+                           for line in lines[maze.rows + 1:maze.rows + 3])
+        except ValueError:
+            entry, exit = (), ()
+        if len(solution) < 1 or any(len(row) != maze.cols for row in rows) \
+                or len(entry) != 2 or len(exit) != 2 \
+                or not self.apply(maze, rows, solution[0]):
+            # written by other code, regenerate it
+            self.stats["misses"] += 1
+            return False
+        if maze.auto_entry or maze.auto_exit:
+            maze.set_entry_exit(entry, exit)
+        self.stats["hits"] += 1
+        return True
+
+    @staticmethod
+    def apply(maze: "MazeGenerator", rows: List[str], path: str) -> bool:
+        """Set the walls and the path of a maze, False if invalid."""
+        try:
+            for y, row in enumerate(rows):
+                for cell, nibble in zip(maze.grid[y], row):
+                    value = int(nibble, 16)
+                    for direction, bit in BITS.items():
+                        cell.walls[direction] = 1 if value & bit else 0
+                    cell.visited = not cell._is_42
+        except ValueError:
+            return False
+        if path.strip("NESW"):
+            return False
+        maze.unvisited.clear()
+        maze.path = path
+        return True
+
+    def store(self, maze: "MazeGenerator") -> None:
+        """
+        Write the entry of a carved and solved maze.
+
+        Args:
+            maze (MazeGenerator): The maze to store.
+        """
+        x, y = maze.entry
+        ex, ey = maze.exit
+        data = f"{maze.hex_repr}\n{x},{y}\n{ex},{ey}\n{maze.path}\n"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+            with os.fdopen(fd, "w") as f:
+                f.write(data)
+            os.replace(tmp, self.path(self.key(maze)))
+        except OSError:
+            # a read-only or full disk only costs the cache
+            return
+        self.stats["stores"] += 1
+        if self.size is None:
+            self.size = sum(size for _, size, _ in self.entries())
+        else:
+            self.size += len(data)
+        if self.size > self.max_bytes:
+            self.evict()
+
+    def entries(self) -> List[Tuple[float, int, str]]:
+        """Last use, size and path of every entry."""
+        entries: List[Tuple[float, int, str]] = []
+        try:
+            names = os.listdir(self.directory)
+        except OSError:
+            return entries
+        for name in names:
+            if not name.endswith(SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                # deleted by another process meanwhile
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return entries
+
+    def evict(self) -> None:
+        """Delete the least recently used entries down to 3/4 of the bound."""
+        entries = sorted(self.entries())
+        size = sum(entry[1] for entry in entries)
+        for _, entry_size, path in entries:
+            if size <= self.max_bytes * 3 // 4:
+                break
+            try:
+                os.remove(path)
+                self.stats["evictions"] += 1
+            except OSError:
+                pass
+            size -= entry_size
+        self.size = size
+
+    def clear(self) -> None:
+        """Delete every entry."""
+        for _, _, path in self.entries():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self.size = 0
+
+
+def main() -> None:
+    """Print the content of a cache directory, or clear it."""
+    args = [arg for arg in sys.argv[1:] if arg != "--clear"]
+    cache = MazeCache(args[0] if args else None)
+    if "--clear" in sys.argv:
+        cache.clear()
+        print(f"Cleared {cache.directory}")
+        return
+    entries = cache.entries()
+    size = sum(entry[1] for entry in entries)
+    print(f"{cache.directory}: {len(entries)} mazes, {size / 1024:.1f}kB "
+          f"of {cache.max_bytes / 1024 / 1024:.0f}MB")
+
+
+if __name__ == "__main__":
+    main()
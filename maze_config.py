@@ -0,0 +1,486 @@
+#!/usr/bin/env python3
+# File: maze_config.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/13 16:12:05
+# Updated: 2026/02/13 16:12:05
+
+import importlib.util
+from typing import Dict, List
+from profiler import Profiler
+from rng import RNGS
+
+
+class MazeConfig:
+    """Settings of a maze, parsed once from the config file.
+
+    The entry point loads the file once and the same object is shared
+    by the renderer, the MazeGenerator of every maze and the workers
+    generating mazes ahead of time.
+
+    Attributes:
+        cols (int): define the width of the maze
+        rows (int): define the height of the maze
+        entry (tuple): coordinates of the entry
+        exit (tuple): coordinates of the exit
+        auto_entry (bool): ENTRY=AUTO, the entry is placed once carved
+        auto_exit (bool): EXIT=AUTO, the exit is placed once carved
+        auto_border (bool): automatic points only on the border
+        auto_distance (int): steps at least between automatic points,
+            0 for the farthest pair
+        seed (int | None): the seed passed to random
+        perfect (bool): True if there is juste one path between exit and start
+        output_file (str): file receiving the hex representation
+        algorithm (str) : define which algorithm to use to generate the maze
+        display (str): ASCII or MLX
+        pool_depth (int): number of mazes generated ahead of time, 0
+            to generate each one when needed
+        pool_worker (str): THREAD or PROCESS, where they are generated
+        profile (str): OFF, ON, CPROFILE, TRACEMALLOC or ALL
+        record_metrics (bool): record the generation metrics
+        cache (bool): read seeded mazes from the cache directory
+        cache_dir (str): directory of the maze cache
+        cache_size (int): size bound of the cache in MB
+        rng (str): LEGACY, FAST or PCG64, the random stream of the mazes;
+            POPPING always draws from PCG64
+        hybrid_fraction (float): part of the cells carved by random walk
+            before Wilson's walks take over with ALGORITHM=HYBRID; 1,
+            plain Aldous-Broder, and 0, plain Wilson, are uniform, the
+            fractions between them are faster but biased
+        division_workers (int): processes dividing large grids with
+            ALGORITHM=DIVISION, 0 for every core
+        custom (list(str)): keys that came from the config file
+    """
+
+    def __init__(self, verbose: bool = True) -> None:
+        """Set the default config."""
+        self.verbose: bool = verbose
+        self.cols: int = 20
+        self.rows: int = 10
+        self.seed: int | None = None
+        self.perfect: bool = True
+        self.entry: tuple = (0, 0)
+        self.exit: tuple = (19, 9)
+        self.auto_entry: bool = False
+        self.auto_exit: bool = False
+        self.auto_border: bool = False
+        self.auto_distance: int = 0
+        self.output_file: str = "maze.txt"
+        self.algorithm: str = "WILSON"
+        self.display: str = "ASCII"
+        self.pool_depth: int = 0
+        self.pool_worker: str = "THREAD"
+        self.profile: str = "OFF"
+        self.record_metrics: bool = False
+        self.cache: bool = False
+        self.cache_dir: str = ".maze_cache"
+        self.cache_size: int = 64
+        self.rng: str = "LEGACY"
+        self.hybrid_fraction: float = 1.0
+        self.division_workers: int = 0
+        # Track which settings came from config file
+        self.custom: List[str] = []
+
+    @classmethod
+    def load(cls, config_file: str | None,
+             verbose: bool = True) -> "MazeConfig":
+        """
+        Read and validate a config file, or use the defaults.
+
+        Args:
+            config_file (str | None): Path to the configuration file.
+            verbose (bool): Print the settings and the errors.
+
+        Returns:
+            MazeConfig: The parsed settings.
+        """
+        config = cls(verbose)
+        if config_file is not None:
+            config.custom = config.load_config(config_file)
+        else:
+            config.log("No config file, switching to default settings.")
+            config.print_config(config.custom)
+        return config
+
+    @classmethod
+    def from_settings(cls, raw_config: Dict[str, str],
+                      verbose: bool = False) -> "MazeConfig":
+        """
+        Parse settings given as KEY=value pairs instead of a file.
+
+        Invalid settings fall back to their default like in a file,
+        they are the keys of raw_config missing from custom.
+
+        Args:
+            raw_config (dict): Values by upper case key.
+            verbose (bool): Print the errors.
+
+        Returns:
+            MazeConfig: The parsed settings.
+        """
+        config = cls(verbose)
+        config.custom = config._parse_config_values(raw_config)
+        config._validate_entry_exit(config.custom)
+        return config
+
+    def log(self, msg: str = "") -> None:
+        """Print a message unless the config is loaded silently."""
+        if self.verbose:
+            print(msg)
+
+    def print_config(self, custom: List[str]) -> None:
+        """Print final settings of the maze."""
+        self.log("\nMaze configuration:")
+        config_items = {
+            "WIDTH": self.cols,
+            "HEIGHT": self.rows,
+            "ENTRY": "AUTO" if self.auto_entry else self.entry,
+            "EXIT": "AUTO" if self.auto_exit else self.exit,
+            "SEED": self.seed,
+            "PERFECT": self.perfect,
+            "ALGORITHM": self.algorithm,
+            "OUTPUT_FILE": self.output_file,
+            "DISPLAY": self.display,
+            "POOL_DEPTH": self.pool_depth,
+            "POOL_WORKER": self.pool_worker,
+            "PROFILE": self.profile,
+            "METRICS": self.record_metrics,
+            "CACHE": self.cache,
+            "CACHE_DIR": self.cache_dir,
+            "CACHE_SIZE": self.cache_size,
+            "RNG": self.rng,
+            "HYBRID_FRACTION": self.hybrid_fraction,
+            "DIVISION_WORKERS": self.division_workers,
+            "AUTO_BORDER": self.auto_border,
+            "AUTO_DISTANCE": self.auto_distance
+        }
+
+        for k, v in config_items.items():
+            if k in custom:
+                self.log(f"  {k}: {v}")
+            else:
+                self.log(f"  {k}: {v} (default)")
+        self.log()
+
+    def _read_config_file(self, file: str) -> Dict[str, str] | None:
+        """Read config file and return raw dict or None on error."""
+        try:
+            with open(file, "r") as f:
+                content: str = f.read()
+                if content == '':
+                    self.log("Config file is empty")
+                    return None
+
+                self.log(f"Loading settings from config file {file}...")
+                raw_config: Dict[str, str] = {}
+
+                for line in content.splitlines():
+                    try:
+                        line = line.strip()
+                        if line and not line.startswith('#'):
+                            key, value = line.split('=', 1)
+                            key = key.strip().upper()
+                            raw_config[key] = value.strip()
+                    except ValueError:
+                        self.log(
+                                f'Error in line {line} - '
+                                f'Expected syntax: "KEY=value"'
+                                )
+                        continue
+            if not len(raw_config.keys()):
+                raise ValueError(f"No valid settings in {file}")
+            return raw_config
+
+        except (FileNotFoundError, PermissionError) as e:
+            self.log(f"Error: {e}")
+            return None
+        except Exception as e:
+            self.log(f"Error: {e}")
+            return None
+
+    def _parse_config_values(self, raw_config: Dict[str, str]) -> List[str]:
+        """
+        Parse and validate each config value.
+
+        Return: list of successfully parsed keys.
+        """
+        custom: List[str] = []
+
+        for k, v in raw_config.items():
+            try:
+                if k == "WIDTH":
+                    if int(v) < 0 or int(v) == 1:
+                        raise ValueError("width cannot be one or negative")
+                    self.cols = int(v)
+                    custom.append(k)
+                elif k == "HEIGHT":
+                    if int(v) < 0 or int(v) == 1:
+                        raise ValueError("height cannot be one or negative")
+                    self.rows = int(v)
+                    custom.append(k)
+                elif k == "ENTRY":
+                    if v.upper() == "AUTO":
+                        self.auto_entry = True
+                    else:
+                        self.entry = self._parse_coordinate(v, k)
+                    custom.append(k)
+                elif k == "EXIT":
+                    if v.upper() == "AUTO":
+                        self.auto_exit = True
+                    else:
+                        self.exit = self._parse_coordinate(v, k)
+                    custom.append(k)
+                elif k == "PERFECT":
+                    self.perfect = self._parse_boolean(v, k)
+                    custom.append(k)
+                elif k == "SEED":
+                    self.seed = int(v)
+                    custom.append(k)
+                elif k == "OUTPUT_FILE":
+                    self.output_file = v
+                    custom.append(k)
+                elif k == "ALGORITHM":
+                    if v.upper() not in ["DFS", "WILSON", "HYBRID",
+                                         "POPPING", "DIVISION"]:
+                        raise ValueError(
+                                "Invalid algorithm: pick DFS, WILSON, "
+                                "HYBRID, POPPING or DIVISION"
+                                )
+                    if v.upper() == "POPPING" \
+                            and importlib.util.find_spec("numpy") is None:
+                        raise ValueError("POPPING needs NumPy")
+                    self.algorithm = v.upper()
+                    custom.append(k)
+                elif k == "DISPLAY":
+                    if v.upper() not in ["ASCII", "MLX"]:
+                        raise ValueError(
+                                "Invalid display mode: pick ASCII or MLX"
+                                )
+                    self.display = v.upper()
+                    custom.append(k)
+                elif k == "POOL_DEPTH":
+                    if int(v) < 0:
+                        raise ValueError("pool depth cannot be negative")
+                    self.pool_depth = int(v)
+                    custom.append(k)
+                elif k == "POOL_WORKER":
+                    if v.upper() not in ["THREAD", "PROCESS"]:
+                        raise ValueError(
+                                "Invalid pool worker: pick THREAD or PROCESS"
+                                )
+                    self.pool_worker = v.upper()
+                    custom.append(k)
+                elif k == "METRICS":
+                    self.record_metrics = self._parse_boolean(v, k)
+                    custom.append(k)
+                elif k == "PROFILE":
+                    if v.upper() not in Profiler.MODES:
+                        raise ValueError(
+                                "Invalid profile: pick OFF, ON, CPROFILE, "
+                                "TRACEMALLOC or ALL"
+                                )
+                    self.profile = v.upper()
+                    custom.append(k)
+                elif k == "CACHE":
+                    self.cache = self._parse_boolean(v, k)
+                    custom.append(k)
+                elif k == "CACHE_DIR":
+                    self.cache_dir = v
+                    custom.append(k)
+                elif k == "CACHE_SIZE":
+                    if int(v) < 1:
+                        raise ValueError("cache size must be at least 1MB")
+                    self.cache_size = int(v)
+                    custom.append(k)
+                elif k == "RNG":
+                    if v.upper() not in RNGS:
+                        raise ValueError("Invalid RNG: pick LEGACY, FAST "
+                                         "or PCG64")
+                    if v.upper() == "PCG64" \
+                            and importlib.util.find_spec("numpy") is None:
+                        raise ValueError("PCG64 needs NumPy")
+                    self.rng = v.upper()
+                    custom.append(k)
+                elif k == "HYBRID_FRACTION":
+                    if not 0 <= float(v) <= 1:
+                        raise ValueError("fraction must be between 0 and 1")
+                    self.hybrid_fraction = float(v)
+                    custom.append(k)
+                elif k == "DIVISION_WORKERS":
+                    if int(v) < 0:
+                        raise ValueError("workers cannot be negative")
+                    self.division_workers = int(v)
+                    custom.append(k)
+                elif k == "AUTO_BORDER":
+                    self.auto_border = self._parse_boolean(v, k)
+                    custom.append(k)
+                elif k == "AUTO_DISTANCE":
+                    if int(v) < 0:
+                        raise ValueError("distance cannot be negative")
+                    self.auto_distance = int(v)
+                    custom.append(k)
+                else:
+                    self.log(
+                            f"Error: Invalid keyword {k} - "
+                            "Allowed: WIDTH, HEIGHT, ENTRY, EXIT, "
+                            "OUTPUT_FILE, PERFECT, SEED, ALGORITHM, DISPLAY, "
+                            "POOL_DEPTH, POOL_WORKER, PROFILE, METRICS, "
+                            "CACHE, CACHE_DIR, CACHE_SIZE, RNG, "
+                            "HYBRID_FRACTION, DIVISION_WORKERS, "
+                            "AUTO_BORDER, AUTO_DISTANCE"
+                            )
+            except Exception as e:
+                self.log(f'Error in {k}: {e}\nSwitching to default value')
+
+        return custom
+
+    def _parse_coordinate(self, value: str, key: str) -> tuple:
+        """Parse a coordinate string 'x,y' into a tuple."""
+        coord_tuple = tuple(int(i.strip()) for i in value.split(','))
+        if len(coord_tuple) != 2:
+            raise ValueError('coordinates expect 2 values "x,y"')
+        return coord_tuple
+
+    def _parse_boolean(self, value: str, key: str) -> bool:
+        """Parse a boolean string 'True' or 'False'."""
+        if value.upper() == "TRUE":
+            return True
+        elif value.upper() == "FALSE":
+            return False
+        else:
+            raise ValueError('boolean expects "True" or "False"')
+
+    def _is_within_bounds(self, coord: tuple) -> bool:
+        """Check if a coordinate is within maze bounds."""
+        x, y = coord
+        if 0 <= x < self.cols and 0 <= y < self.rows:
+            return True
+        return False
+
+    def is_free_cell(self, coord: tuple) -> bool:
+        """Check if a coordinate is within bounds and out of the 42."""
+        return self._is_within_bounds(coord) \
+            and tuple(coord) not in self.get_42_cells(self.cols, self.rows)
+
+    def reset_default_extry(self, point_type: str, custom: List[str]) -> None:
+        """Reset entry or exit to default value and remove from custom list."""
+        if point_type == "ENTRY":
+            self.entry = (0, 0)
+        elif point_type == "EXIT":
+            self.exit = (self.cols - 1, self.rows - 1)
+        if point_type in custom:
+            custom.remove(point_type)
+
+    def _validate_entry_exit(self, custom: List[str]) -> None:
+        """Validate entry/exit by checking maze bounds and 42 cells."""
+        # Adjust exit defaults if WIDTH/HEIGHT changed
+        if "EXIT" not in custom and ("WIDTH" in custom or "HEIGHT" in custom):
+            self.exit = (self.cols - 1, self.rows - 1)
+        # Automatic points start from the defaults, moved once carved
+        if self.auto_entry:
+            self.entry = (0, 0)
+        if self.auto_exit:
+            self.exit = (self.cols - 1, self.rows - 1)
+
+        # Check if entry/exit coordinates are within maze bounds
+        if not self._is_within_bounds(self.entry):
+            self.log(
+                "Error: Entry point exceeds borders of the maze.\n"
+                'Switching to default entry'
+            )
+            self.reset_default_extry("ENTRY", custom)
+        if not self._is_within_bounds(self.exit):
+            self.log(
+                "Error: Exit point exceeds borders of the maze.\n"
+                'Switching to default exit'
+            )
+            self.reset_default_extry("EXIT", custom)
+
+        # Check if entry/exit coordinates conflict with 42 blocked cells
+        ft_walls: List[tuple] = self.get_42_cells(self.cols, self.rows)
+        if self.entry in ft_walls:
+            self.log(
+                    "Error: Entry point is stuck in the 42 pattern\n"
+                    "Switching to default entry"
+                    )
+            self.reset_default_extry("ENTRY", custom)
+        if self.exit in ft_walls:
+            self.log(
+                    "Error: Exit point is stuck in the 42 pattern\n"
+                    "Switching to default exit"
+                    )
+            self.reset_default_extry("EXIT", custom)
+
+        if self.entry == self.exit \
+                and not (self.auto_entry or self.auto_exit):
+            self.log(
+                    "Error: Entry and exit cannot have "
+                    "the same coordinates"
+                    )
+            if self.entry != (0, 0):
+                self.reset_default_extry("ENTRY", custom)
+                self.log("Switching to default entry")
+            if self.entry == self.exit:
+                self.reset_default_extry("EXIT", custom)
+                self.log("Switching to default exit")
+
+    def load_config(self, file: str) -> List[str]:
+        """
+        Parse the config file and update maze attributes.
+
+        Return: list of custom keys.
+        """
+        custom: List[str] = []
+        raw_config: Dict[str, str] | None = {}
+
+        # Read and parse the config file
+        raw_config = self._read_config_file(file)
+        if raw_config is None:
+            self.log("Switching to default settings")
+            self.print_config(custom)
+            return custom
+
+        # Parse each configuration value
+        custom = self._parse_config_values(raw_config)
+
+        # Validate and adjust entry/exit points
+        self._validate_entry_exit(custom)
+
+        # Error message for "42" pattern if maze too small
+        if self.cols < 11 or self.rows < 9:
+            self.log("Warning: Maze too small for “42” pattern")
+
+        if self.algorithm == "HYBRID" and 0 < self.hybrid_fraction < 1:
+            self.log("Warning: HYBRID is not uniform with a fraction "
+                     "between 0 and 1, use 0 or 1 for uniform mazes")
+        if self.algorithm == "POPPING" and "RNG" in custom \
+                and self.rng != "PCG64":
+            self.log("Warning: POPPING always draws from PCG64, RNG is "
+                     "ignored")
+
+        self.print_config(custom)
+        return custom
+
+    @staticmethod
+    def get_42_cells(w: int, h: int) -> List[tuple]:
+        """Calculate the coordinates of the 42 cells."""
+        if w < 11 or h < 9:
+            return []  # No 42_walls, maze too small
+        cx: int = (w - 1) // 2 if w % 2 == 0 else w // 2
+        cy: int = (h - 1) // 2 if h % 2 == 0 else h // 2
+
+        four_walls: List[tuple] = [
+                (cx - 1, cy), (cx - 2, cy), (cx - 3, cy),
+                (cx - 1, cy + 1), (cx - 1, cy + 2),
+                (cx - 3, cy - 1), (cx - 3, cy - 2)
+                ]
+        two_walls: List[tuple] = [
+                (cx + 1, cy), (cx + 2, cy), (cx + 3, cy),
+                (cx + 1, cy + 1), (cx + 1, cy + 2),
+                (cx + 3, cy - 1), (cx + 3, cy - 2),
+                (cx + 1, cy - 2), (cx + 2, cy - 2), (cx + 3, cy - 2),
+                (cx + 2, cy + 2), (cx + 3, cy + 2)
+                ]
+
+        ft_walls = four_walls + two_walls
+        return ft_walls
@@ -5,27 +5,52 @@
 # Created: 2026/01/20 18:33:22
 # Updated: 2026/01/20 18:02:15
 
-from typing import Dict, List
+from typing import TYPE_CHECKING, Dict, List
 import random
 from collections import deque
 from cell import Cell
+from maze_config import MazeConfig
+from metrics import MazeMetrics
+from profiler import Profiler
+from rng import BufferedRng, make_rng
+
+if TYPE_CHECKING:
+    from dynamic_solver import DynamicSolver
+    from maze_cache import MazeCache
 
 
 class MazeGenerator:
     """A class for the maze attributes and methods.
 
     Attributes:
-    - Attributes define by the loaded config:
+    - Attributes copied from the MazeConfig:
         cols (int): define the width of the maze
         rows (int): define the height of the maze
         seed (int | None): the seed passed to random
         perfect (bool): True if there is juste one path between exit and start
-        algorithm (str) : define which algorithm to use to generate the maze
+        algorithm (str) : DFS, WILSON, HYBRID, POPPING or DIVISION, carves
+            the maze
+        pool_depth (int): number of mazes generated ahead of time
+        pool_worker (str): THREAD or PROCESS, where they are generated
+        profile (str): OFF, ON, CPROFILE, TRACEMALLOC or ALL
+        record_metrics (bool): record the generation metrics
+        cache (bool): read seeded mazes from the cache directory
+        rng_name (str): LEGACY, FAST or PCG64, the random stream used
+        hybrid_fraction (float): cells carved by random walk in HYBRID
+        division_workers (int): processes of DIVISION, 0 for every core
+        auto_entry, auto_exit (bool): points placed once carved
+        auto_border (bool): automatic points only on the border
+        auto_distance (int): steps at least between automatic points
     - Attributes created:
         grid (list(list(Cell))): Create a Cell in every cell of the maze
         unvisited (list(Cell)): a list of every unvisited cell without 42 block
         start (Cell): Keep the starting Cell
         exit (Cell): Keep the exit Cell
+        config (MazeConfig): The settings shared by every maze
+        profiler (Profiler): Times the phases of the generation
+        metrics (MazeMetrics | None): Counters of the last generation
+        solver (DynamicSolver | None): Keeps the path up to date after
+            wall edits, once track_path is called
     """
 
     offset: Dict[str, tuple] = {
@@ -35,39 +60,78 @@ class MazeGenerator:
             "W": (-1, 0)
             }
 
-    def __init__(self, config_file: str | None) -> None:
-        """Initialise the attributes of the maze with the default config."""
-        # Set defaults first
-        self.cols: int = 20
-        self.rows: int = 10
-        self.seed: int | None = None
-        self.perfect: bool = True
-        self.entry: tuple = (0, 0)
-        self.exit: tuple = (19, 9)
-        self.output_file: str = "maze.txt"
-        self.algorithm: str = "WILSON"
-        self.display: str = "ASCII"
-
-        # Track which settings came from config file
-        custom: List[str] = []
-
-        # Load config file if provided
-        if config_file is not None:
-            custom = self.load_config(config_file)
+    def __init__(self, config_file: str | MazeConfig | None,
+                 verbose: bool = True,
+                 profiler: Profiler | None = None) -> None:
+        """
+        Initialise the attributes of the maze from its config.
+
+        Args:
+            config_file (str | MazeConfig | None): Settings already parsed,
+                or the path of the config file to parse.
+            verbose (bool): Print messages.
+            profiler (Profiler | None): Times the phases of the generation.
+        """
+        # Messages are muted for mazes generated in the background
+        self.verbose: bool = verbose
+        # Shared with the renderer so that one report covers the run
+        self.profiler: Profiler = (
+                profiler if profiler is not None else Profiler()
+                )
+        # Parse the config file unless it was parsed already
+        if isinstance(config_file, MazeConfig):
+            config = config_file
         else:
-            print("No config file, switching to default settings.")
-            self.print_config(custom)
+            with self.profiler.phase("config"):
+                config = MazeConfig.load(config_file, verbose)
+        self.config: MazeConfig = config
+
+        # Copy the settings, a maze may change its own seed
+        self.cols: int = config.cols
+        self.rows: int = config.rows
+        self.seed: int | None = config.seed
+        self.perfect: bool = config.perfect
+        self.entry: tuple = config.entry
+        self.exit: tuple = config.exit
+        self.output_file: str = config.output_file
+        self.algorithm: str = config.algorithm
+        self.display: str = config.display
+        self.pool_depth: int = config.pool_depth
+        self.pool_worker: str = config.pool_worker
+        self.profile: str = config.profile
+        self.record_metrics: bool = config.record_metrics
+        self.cache: bool = config.cache
+        self.rng_name: str = config.rng
+        self.hybrid_fraction: float = config.hybrid_fraction
+        self.division_workers: int = config.division_workers
+        self.auto_entry: bool = config.auto_entry
+        self.auto_exit: bool = config.auto_exit
+        self.auto_border: bool = config.auto_border
+        self.auto_distance: int = config.auto_distance
+
+        # Own random stream so mazes can be generated in parallel
+        self.rng: random.Random | BufferedRng = make_rng(self.rng_name)
+
+        # mazes generated in the background are not profiled
+        if "PROFILE" in config.custom and self.verbose \
+                and not self.profiler.enabled:
+            self.profiler.configure(self.profile)
 
         # Initialize remaining attributes
         self.tot_size: int = self.cols * self.rows
         self.path: str = ""
+        self.metrics: MazeMetrics | None = None
+        self.solver: "DynamicSolver | None" = None
+        # walls set one by one, a perfect maze may have lost its tree
+        self.edited: bool = False
 
         # create utils lists
-        self.grid: List[List[Cell]] = [
-                [Cell(x, y, self) for x in range(self.cols)]
-                for y in range(self.rows)
-                ]
-        self.block_42_walls()
+        with self.profiler.phase("grid"):
+            self.grid: List[List[Cell]] = [
+                    [Cell(x, y, self) for x in range(self.cols)]
+                    for y in range(self.rows)
+                    ]
+            self.block_42_walls()
 
         self.unvisited: List[Cell] = [
             cell for row in self.grid
@@ -80,231 +144,10 @@ class MazeGenerator:
         self.entry_cell: Cell | None = self.get_cell(*self.entry)
         self.exit_cell: Cell | None = self.get_cell(*self.exit)
 
-    def print_config(self, custom: List[str]) -> None:
-        """Print final settings of the maze."""
-        print("\nMaze configuration:")
-        config_items = {
-            "WIDTH": self.cols,
-            "HEIGHT": self.rows,
-            "ENTRY": self.entry,
-            "EXIT": self.exit,
-            "SEED": self.seed,
-            "PERFECT": self.perfect,
-            "ALGORITHM": self.algorithm,
-            "OUTPUT_FILE": self.output_file,
-            "DISPLAY": self.display
-        }
-
-        for k, v in config_items.items():
-            if k in custom:
-                print(f"  {k}: {v}")
-            else:
-                print(f"  {k}: {v} (default)")
-        print()
-
-    def _read_config_file(self, file: str) -> Dict[str, str] | None:
-        """Read config file and return raw dict or None on error."""
-        try:
-            with open(file, "r") as f:
-                content: str = f.read()
-                if content == '':
-                    print("Config file is empty")
-                    return None
-
-                print(f"Loading settings from config file {file}...")
-                raw_config: Dict[str, str] = {}
-
-                for line in content.splitlines():
-                    try:
-                        line = line.strip()
-                        if line and not line.startswith('#'):
-                            key, value = line.split('=', 1)
-                            key = key.strip().upper()
-                            raw_config[key] = value.strip()
-                    except ValueError:
-                        print(
-                                f'Error in line {line} - '
-                                f'Expected syntax: "KEY=value"'
-                                )
-                        continue
-            if not len(raw_config.keys()):
-                raise ValueError(f"No valid settings in {file}")
-            return raw_config
-
-        except (FileNotFoundError, PermissionError) as e:
-            print(f"Error: {e}")
-            return None
-        except Exception as e:
-            print(f"Error: {e}")
-            return None
-
-    def _parse_config_values(self, raw_config: Dict[str, str]) -> List[str]:
-        """
-        Parse and validate each config value.
-
-        Return: list of successfully parsed keys.
-        """
-        custom: List[str] = []
-
-        for k, v in raw_config.items():
-            try:
-                if k == "WIDTH":
-                    if int(v) < 0 or int(v) == 1:
-                        raise ValueError("width cannot be one or negative")
-                    self.cols = int(v)
-                    custom.append(k)
-                elif k == "HEIGHT":
-                    if int(v) < 0 or int(v) == 1:
-                        raise ValueError("height cannot be one or negative")
-                    self.rows = int(v)
-                    custom.append(k)
-                elif k == "ENTRY":
-                    self.entry = self._parse_coordinate(v, k)
-                    custom.append(k)
-                elif k == "EXIT":
-                    self.exit = self._parse_coordinate(v, k)
-                    custom.append(k)
-                elif k == "PERFECT":
-                    self.perfect = self._parse_boolean(v, k)
-                    custom.append(k)
-                elif k == "SEED":
-                    self.seed = int(v)
-                    custom.append(k)
-                elif k == "OUTPUT_FILE":
-                    self.output_file = v
-                    custom.append(k)
-                elif k == "ALGORITHM":
-                    if v.upper() not in ["DFS", "WILSON"]:
-                        raise ValueError(
-                                "Invalid algorithm: pick DFS or WILSON"
-                                )
-                    self.algorithm = v.upper()
-                    custom.append(k)
-                elif k == "DISPLAY":
-                    if v.upper() not in ["ASCII", "MLX"]:
-                        raise ValueError(
-                                "Invalid display mode: pick ASCII or MLX"
-                                )
-                    self.display = v.upper()
-                    custom.append(k)
-                else:
-                    print(
-                            f"Error: Invalid keyword {k} - "
-                            "Allowed: WIDTH, HEIGHT, ENTRY, EXIT"
-                            "OUTPUT_FILE, PERFECT, SEED, ALGORITHM, DISPLAY"
-                            )
-            except Exception as e:
-                print(f'Error in {k}: {e}\nSwitching to default value')
-
-        return custom
-
-    def _parse_coordinate(self, value: str, key: str) -> tuple:
-        """Parse a coordinate string 'x,y' into a tuple."""
-        coord_tuple = tuple(int(i.strip()) for i in value.split(','))
-        if len(coord_tuple) != 2:
-            raise ValueError('coordinates expect 2 values "x,y"')
-        return coord_tuple
-
-    def _parse_boolean(self, value: str, key: str) -> bool:
-        """Parse a boolean string 'True' or 'False'."""
-        if value.upper() == "TRUE":
-            return True
-        elif value.upper() == "FALSE":
-            return False
-        else:
-            raise ValueError('boolean expects "True" or "False"')
-
-    def _is_within_bounds(self, coord: tuple) -> bool:
-        """Check if a coordinate is within maze bounds."""
-        x, y = coord
-        if 0 <= x < self.cols and 0 <= y < self.rows:
-            return True
-        return False
-
-    def reset_default_extry(self, point_type: str, custom: List[str]) -> None:
-        """Reset entry or exit to default value and remove from custom list."""
-        if point_type == "ENTRY":
-            self.entry = (0, 0)
-        elif point_type == "EXIT":
-            self.exit = (self.cols - 1, self.rows - 1)
-        if point_type in custom:
-            custom.remove(point_type)
-
-    def _validate_entry_exit(self, custom: List[str]) -> None:
-        """Validate entry/exit by checking maze bounds and 42 cells."""
-        # Adjust exit defaults if WIDTH/HEIGHT changed
-        if "EXIT" not in custom and ("WIDTH" in custom or "HEIGHT" in custom):
-            self.exit = (self.cols - 1, self.rows - 1)
-
-        # Check if entry/exit coordinates are within maze bounds
-        if not self._is_within_bounds(self.entry):
-            print(
-                "Error: Entry point exceeds borders of the maze.\n"
-                'Switching to default entry'
-            )
-            self.reset_default_extry("ENTRY", custom)
-        if not self._is_within_bounds(self.exit):
-            print(
-                "Error: Exit point exceeds borders of the maze.\n"
-                'Switching to default exit'
-            )
-            self.reset_default_extry("EXIT", custom)
-
-        # Check if entry/exit coordinates conflict with 42 blocked cells
-        ft_walls: List[tuple] = self.get_42_cells(self.cols, self.rows)
-        if self.entry in ft_walls:
-            print(
-                    "Error: Entry point is stuck in the 42 pattern\n"
-                    "Switching to default entry"
-                    )
-            self.reset_default_extry("ENTRY", custom)
-        if self.exit in ft_walls:
-            print(
-                    "Error: Exit point is stuck in the 42 pattern\n"
-                    "Switching to default exit"
-                    )
-            self.reset_default_extry("EXIT", custom)
-
-        if self.entry == self.exit:
-            print(
-                    "Error: Entry and exit cannot have "
-                    "the same coordinates"
-                    )
-            if self.entry != (0, 0):
-                self.reset_default_extry("ENTRY", custom)
-                print("Switching to default entry")
-            if self.entry == self.exit:
-                self.reset_default_extry("EXIT", custom)
-                print("Switching to default exit")
-
-    def load_config(self, file: str) -> List[str]:
-        """
-        Parse the config file and update maze attributes.
-
-        Return: list of custom keys.
-        """
-        custom: List[str] = []
-        raw_config: Dict[str, str] | None = {}
-
-        # Read and parse the config file
-        raw_config = self._read_config_file(file)
-        if raw_config is None:
-            print("Switching to default settings")
-            self.print_config(custom)
-            return custom
-
-        # Parse each configuration value
-        custom = self._parse_config_values(raw_config)
-
-        # Validate and adjust entry/exit points
-        self._validate_entry_exit(custom)
-
-        # Error message for "42" pattern if maze too small
-        if self.cols < 11 or self.rows < 9:
-            print("Warning: Maze too small for “42” pattern")
-
-        self.print_config(custom)
-        return custom
+    def log(self, msg: str = "") -> None:
+        """Print a message unless the maze is generated silently."""
+        if self.verbose:
+            print(msg)
 
     def get_cell(self, x: int, y: int) -> Cell | None:
         """Get cell at (x, y), return None if out of borders."""
@@ -314,26 +157,7 @@ class MazeGenerator:
 
     def get_42_cells(self, w: int, h: int) -> List[tuple]:
         """Calculate the coordinates of the 42 cells."""
-        if w < 11 or h < 9:
-            return []  # No 42_walls, maze too small
-        cx: int = (w - 1) // 2 if w % 2 == 0 else w // 2
-        cy: int = (h - 1) // 2 if h % 2 == 0 else h // 2
-
-        four_walls: List[tuple] = [
-                (cx - 1, cy), (cx - 2, cy), (cx - 3, cy),
-                (cx - 1, cy + 1), (cx - 1, cy + 2),
-                (cx - 3, cy - 1), (cx - 3, cy - 2)
-                ]
-        two_walls: List[tuple] = [
-                (cx + 1, cy), (cx + 2, cy), (cx + 3, cy),
-                (cx + 1, cy + 1), (cx + 1, cy + 2),
-                (cx + 3, cy - 1), (cx + 3, cy - 2),
-                (cx + 1, cy - 2), (cx + 2, cy - 2), (cx + 3, cy - 2),
-                (cx + 2, cy + 2), (cx + 3, cy + 2)
-                ]
-
-        ft_walls = four_walls + two_walls
-        return ft_walls
+        return MazeConfig.get_42_cells(w, h)
 
     def block_42_walls(self) -> None:
         """Prevent access to the 42 walls in the center of the maze."""
@@ -353,15 +177,66 @@ class MazeGenerator:
     def wilson(self) -> None:
         """Generate an uniform random maze using Wilson's algorithm."""
         # Premier îlot du labyrinthe
-        if self.entry_cell:
+        if self.entry_cell and not self.entry_cell.visited:
             self.entry_cell.set_visited()
 
         # walk until every cell is visited
+        metrics = self.metrics
         while self.unvisited:
-            random_cell = random.choice(self.unvisited)
-            for cell, dir in self.walk(random_cell):
+            random_cell = self.rng.choice(self.unvisited)
+            path = self.walk(random_cell)
+            for cell, dir in path:
                 cell.set_visited()
                 cell.set_walls(dir)
+            if metrics is not None:
+                metrics.count("walks")
+                metrics.observe("cells_per_walk", len(path))
+
+    def aldous_broder(self, fraction: float) -> None:
+        """
+        Carve by random walk until a fraction of the cells is visited.
+
+        The walk carves into every cell it reaches for the first time.
+        It is fast while most cells are new, unlike the first walks of
+        Wilson's algorithm which wander until they meet the lone entry.
+
+        Args:
+            fraction (float): Part of the valid cells to visit.
+        """
+        assert self.entry_cell is not None
+        current: Cell = self.entry_cell
+        if not current.visited:
+            current.set_visited()
+        # stop once that many cells are left to Wilson's walks
+        remaining: int = self.valid_cells - int(self.valid_cells * fraction)
+        steps: int = 0
+
+        while len(self.unvisited) > remaining:
+            next: Cell = self.rng.choice(self.get_neighbors_cells(current))
+            steps += 1
+            if not next.visited:
+                direction = current.get_direction(next)
+                assert direction is not None
+                current.set_walls(direction)
+                next.set_visited()
+            current = next
+
+        if self.metrics is not None:
+            self.metrics.count("random_walk_steps", steps)
+
+    def hybrid(self) -> None:
+        """
+        Generate a random maze, Aldous-Broder then Wilson.
+
+        Wilson's walks finish the partial tree of the random walk. Each
+        algorithm alone is uniform, the switch is not: Wilson completes
+        a partial tree uniformly, but the random walk does not draw
+        partial trees in proportion to their completions. Only the
+        fractions 1, the default, and 0 give uniform mazes; the others
+        trade that bias, measured by benchmarks/hybrid.py, for speed.
+        """
+        self.aldous_broder(self.hybrid_fraction)
+        self.wilson()
 
     def walk(self, start_cell: Cell) -> List[tuple[Cell, str]]:
         """Walk until finding a path of unvisited cell without looping."""
@@ -369,12 +244,15 @@ class MazeGenerator:
         draft_path: List = []
         walking: bool = True
         curr_cell: Cell = start_cell
+        steps: int = 0
+        loops: int = 0
 
         while walking:
             # random choice in neighbors cells
-            next: Cell = random.choice(self.get_neighbors_cells(curr_cell))
+            next: Cell = self.rng.choice(self.get_neighbors_cells(curr_cell))
             direction: str = curr_cell.get_direction(next)
             cell_visited[curr_cell] = direction
+            steps += 1
             if next.visited:
                 break
 
@@ -382,10 +260,16 @@ class MazeGenerator:
             if next in draft_path:
                 loop_start_idx: int = draft_path.index(next)
                 draft_path = draft_path[:loop_start_idx + 1]
+                loops += 1
             else:
                 draft_path.append(next)
             curr_cell = next
 
+        if self.metrics is not None:
+            self.metrics.count("walk_steps", steps)
+            self.metrics.count("loops_erased", loops)
+            self.metrics.observe("walk_length", steps)
+
         # final way reconstruction
         path = []
         curr_cell = start_cell
@@ -400,24 +284,33 @@ class MazeGenerator:
         stack: List[Cell] = []
         current: Cell = self.entry_cell
         current.set_visited()
+        max_depth: int = 0
+        backtracks: int = 0
 
         while self.unvisited:
             neighbors = self.get_neighbors_cells(current)
             unvisited_neighbors = [cell for cell in neighbors
                                    if cell in self.unvisited]
             if unvisited_neighbors:
-                neighbor = random.choice(unvisited_neighbors)
+                neighbor = self.rng.choice(unvisited_neighbors)
                 direction = current.get_direction(neighbor)
                 current.set_walls(direction)
                 stack.append(current)
+                if len(stack) > max_depth:
+                    max_depth = len(stack)
                 current = neighbor
                 current.set_visited()
             else:
                 if stack:
                     current = stack.pop()
+                    backtracks += 1
                 else:
                     break
 
+        if self.metrics is not None:
+            self.metrics.maximum("max_stack_depth", max_depth)
+            self.metrics.count("backtracks", backtracks)
+
     def get_walled_neighbors(self, cell: Cell) -> List[tuple]:
         """Get all the neighbors that still have a wall."""
         neighbors: List[Cell] = self.get_neighbors_cells(cell)
@@ -447,7 +340,7 @@ class MazeGenerator:
         dead_ends: List[Cell] = self.get_dead_ends()
         max_removable: int = int(len(dead_ends) * percentage)
 
-        random.shuffle(dead_ends)
+        self.rng.shuffle(dead_ends)
         removed: int = 0
 
         for cell in dead_ends:
@@ -477,6 +370,10 @@ class MazeGenerator:
         # print(f"Target walls to remove: {max_removable}")
         # print(f"Actually removed: {removed}")
         # print()
+        if self.metrics is not None:
+            self.metrics.count("dead_ends", len(dead_ends))
+            self.metrics.count("walls_target", max_removable)
+            self.metrics.count("walls_removed", removed)
 
     def bfs(self):
         # deque containing cells to explore
@@ -514,25 +411,212 @@ class MazeGenerator:
         # set path attribute reversing stored path
         self.path = path[::-1]
 
-    def generate_maze(self) -> None:
-        """Generate maze with the choosen algo."""
+    def generate_maze(self, export: bool = True,
+                      metrics: bool | None = None) -> MazeMetrics | None:
+        """
+        Generate maze with the choosen algo.
+
+        Args:
+            export (bool): Write the output file once the maze is solved.
+                Mazes generated ahead of time are exported when shown.
+            metrics (bool | None): Record the generation metrics,
+                following the METRICS config key when None.
+
+        Returns:
+            MazeMetrics | None: The recorded metrics, None when off.
+        """
         # set seed: custom if configured else None
-        random.seed(self.seed)
+        self.rng.seed(self.seed)
+        # a new maze needs a new solver, see track_path
+        self.solver = None
+        self.edited = False
+        if metrics is None:
+            metrics = self.record_metrics
+        self.metrics = None
+        if metrics:
+            self.metrics = MazeMetrics(self.seed, self.cols, self.rows,
+                                       self.algorithm, self.perfect)
+
+        # a seeded maze may have been generated by an earlier run
+        cache = self.open_cache()
+        hit = False
+        if cache is not None:
+            with self.profiler.phase("cache"):
+                hit = cache.load(self)
+            if self.metrics is not None:
+                self.metrics.count("cache_hits" if hit else "cache_misses")
+            stats = cache.stats
+            self.log(f"Cache {'hit' if hit else 'miss'} ({stats['hits']} "
+                     f"hits, {stats['misses']} misses)")
+
+        if not hit:
+            # select algo
+            with self.profiler.phase("carve"):
+                if self.algorithm == "DFS":
+                    self._iter_DFS()
+                elif self.algorithm == "WILSON":
+                    self.wilson()
+                elif self.algorithm == "HYBRID":
+                    self.hybrid()
+                elif self.algorithm == "POPPING":
+                    # NumPy is only imported for this algorithm
+                    from popping import cycle_popping
+                    cycle_popping(self)
+                elif self.algorithm == "DIVISION":
+                    from division import recursive_division
+                    recursive_division(self)
+
+            if not self.perfect:
+                with self.profiler.phase("make_imperfect"):
+                    self.make_imperfect()
+
+            if self.auto_entry or self.auto_exit:
+                from placement import place_entry_exit
+                with self.profiler.phase("place_entry_exit"):
+                    self.set_entry_exit(*place_entry_exit(self))
+
+            # Search solution path
+            with self.profiler.phase("bfs"):
+                parent = self.bfs()
+            with self.profiler.phase("shortest_path"):
+                self.shortest_path(parent)
+            if cache is not None:
+                cache.store(self)
 
-        # select algo
-        if self.algorithm == "DFS":
-            self._iter_DFS()
-        elif self.algorithm == "WILSON":
-            self.wilson()
+        # export hex representation of the maze
+        if export:
+            with self.profiler.phase("export_to_txt"):
+                self.export_to_txt()
+        return self.metrics
+
+    def regenerate_region(self, x: int, y: int, width: int, height: int,
+                          export: bool = True) -> int:
+        """
+        Carve a rectangle of the maze again, the rest left as it is.
 
-        if not self.perfect:
-            self.make_imperfect()
+        The maze stays perfect and the cost depends on the area of the
+        region, not on the size of the maze, see region.py.
 
-        # Search solution path
-        self.shortest_path(self.bfs())
+        Args:
+            x (int): Column of the top left cell of the region.
+            y (int): Row of the top left cell of the region.
+            width (int): Width of the region.
+            height (int): Height of the region.
+            export (bool): Patch the output file.
 
-        # export hex representation of the maze
-        self.export_to_txt()
+        Returns:
+            int: The number of pieces of the region carved.
+
+        Raises:
+            ValueError: If the region leaves the maze.
+        """
+        from region import patch_output, regenerate_region
+        with self.profiler.phase("regenerate_region"):
+            carved = regenerate_region(self, x, y, width, height)
+        if export:
+            with self.profiler.phase("patch_output"):
+                patch_output(self, x, y, width, height)
+        return carved
+
+    def set_entry_exit(self, entry: tuple, exit: tuple) -> None:
+        """
+        Move the entry and the exit, checked like the config ones.
+
+        A point outside the maze or in the 42 pattern keeps its place.
+
+        Args:
+            entry (tuple): Coordinates of the entry.
+            exit (tuple): Coordinates of the exit.
+        """
+        for name, point in (("Entry", entry), ("Exit", exit)):
+            if not self.config.is_free_cell(point):
+                self.log(f"Error: {name} point {point} is outside the "
+                         f"maze or stuck in the 42 pattern")
+                return
+        self.entry, self.exit = tuple(entry), tuple(exit)
+        self.entry_cell = self.get_cell(*self.entry)
+        self.exit_cell = self.get_cell(*self.exit)
+
+    def wall_bits(self, cell: Cell) -> int:
+        """Walls of a cell as bits, N=1, E=2, S=4, W=8."""
+        walls = cell.walls
+        return walls["N"] | walls["E"] << 1 | walls["S"] << 2 \
+            | walls["W"] << 3
+
+    def track_path(self) -> "DynamicSolver":
+        """
+        Keep the path up to date through later wall edits.
+
+        The solver is built with one full BFS, then set_wall and
+        walls_changed only repair the distances that change.
+
+        Returns:
+            DynamicSolver: The solver of the maze.
+        """
+        from dynamic_solver import DynamicSolver
+        walls = bytearray(self.wall_bits(cell)
+                          for row in self.grid for cell in row)
+        x, y = self.entry
+        ex, ey = self.exit
+        self.solver = DynamicSolver(self.cols, self.rows, walls,
+                                    y * self.cols + x, ey * self.cols + ex)
+        self.path = self.solver.path
+        return self.solver
+
+    def walls_changed(self, cells: List[Cell]) -> None:
+        """
+        Update the path after the walls of some cells were edited.
+
+        Without a solver, see track_path, the maze is solved again.
+
+        Args:
+            cells (List[Cell]): Cells whose walls changed.
+        """
+        if self.solver is not None:
+            self.solver.sync((cell.coord[1] * self.cols + cell.coord[0],
+                              self.wall_bits(cell)) for cell in cells)
+            self.path = self.solver.path
+            if self.metrics is not None:
+                self.metrics.observe("solver_cells", self.solver.visited)
+            return
+        parent = self.bfs()
+        if parent is None:
+            self.path = ""
+        else:
+            self.shortest_path(parent)
+
+    def set_wall(self, x: int, y: int, direction: str,
+                 closed: bool) -> None:
+        """
+        Open or close one wall and update the path.
+
+        Args:
+            x (int): Column of the cell.
+            y (int): Row of the cell.
+            direction (str): N, E, S or W.
+            closed (bool): Close the wall, or open it.
+
+        Raises:
+            ValueError: If the wall is on the border or the 42 pattern.
+        """
+        cell = self.get_cell(x, y)
+        neighbor = cell.get_neighbor(direction) if cell else None
+        if cell is None or neighbor is None or cell._is_42 \
+                or neighbor._is_42:
+            raise ValueError(f"no wall {direction} of {x},{y} can change")
+        cell.walls[direction] = int(closed)
+        neighbor.walls[cell.OPPOSITE[direction]] = int(closed)
+        self.edited = True
+        self.walls_changed([cell, neighbor])
+
+    def open_cache(self) -> "MazeCache | None":
+        """Return the maze cache, None when off or the maze is unseeded."""
+        if not self.cache or self.seed is None:
+            return None
+        # hashlib is only imported when the cache is used
+        from maze_cache import MazeCache
+        return MazeCache.get(self.config.cache_dir,
+                             self.config.cache_size * 1024 * 1024)
 
     @property
     def hex_repr(self):
@@ -554,4 +638,4 @@ class MazeGenerator:
                 f.write(f'{x},{y}\n')
                 f.write(self.path + "\n")
         except Exception as e:
-            print(f"Error writing file: {e}")
+            self.log(f"Error writing file: {e}")
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+# File: maze_pool.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/04 14:21:07
+# Updated: 2026/02/04 14:21:07
+
+import random
+import threading
+from collections import deque
+from concurrent.futures import Executor, Future
+from queue import SimpleQueue
+from typing import Any, Callable, Deque, Tuple, TypeVar
+from maze_config import MazeConfig
+from maze_generator import MazeGenerator
+
+
+def build_maze(config_file: str | MazeConfig | None,
+               seed: int | None) -> MazeGenerator:
+    """
+    Generate a maze silently, without writing the output file.
+
+    Args:
+        config_file (str | MazeConfig | None): Parsed settings or path
+            to the configuration file.
+        seed (int | None): Seed of the maze.
+
+    Returns:
+        MazeGenerator: The generated and solved maze.
+    """
+    maze = MazeGenerator(config_file, verbose=False)
+    maze.seed = seed
+    maze.generate_maze(export=False)
+    return maze
+
+
+T = TypeVar("T")
+
+
+class DaemonExecutor(Executor):
+    """
+    Run the tasks in order on one daemon thread.
+
+    Unlike ThreadPoolExecutor, whose threads are joined at interpreter
+    exit, a maze still being carved does not delay quitting.
+    """
+
+    def __init__(self) -> None:
+        """Start the worker thread."""
+        self.tasks: SimpleQueue[Tuple[Future[Any], Callable[..., Any],
+                                      tuple, dict] | None] = SimpleQueue()
+        threading.Thread(target=self.run, name="MazePool",
+                         daemon=True).start()
+
+    def submit(self, fn: Callable[..., T], /, *args: Any,
+               **kwargs: Any) -> Future[T]:
+        """Queue a call, its future is cancelled by shutdown if pending."""
+        future: Future[T] = Future()
+        self.tasks.put((future, fn, args, kwargs))
+        return future
+
+    def run(self) -> None:
+        """Run the queued calls until shutdown."""
+        while (task := self.tasks.get()) is not None:
+            future, fn, args, kwargs = task
+            if not future.set_running_or_notify_cancel():
+                continue
+            try:
+                future.set_result(fn(*args, **kwargs))
+            except BaseException as e:
+                future.set_exception(e)
+
+    def shutdown(self, wait: bool = True, *,
+                 cancel_futures: bool = False) -> None:
+        """
+        Stop the worker after the current call.
+
+        Args:
+            wait (bool): Ignored, the current call is never waited for.
+            cancel_futures (bool): Cancel the calls not started yet.
+        """
+        if cancel_futures:
+            while not self.tasks.empty():
+                task = self.tasks.get()
+                if task is not None:
+                    task[0].cancel()
+        self.tasks.put(None)
+
+
+class MazePool:
+    """
+    Keep a bounded queue of mazes generated ahead of time.
+
+    Mazes are generated by a thread or a process pool and handed out in
+    the order they were requested, whichever worker finishes first, so
+    a seeded sequence of mazes is the same as when generated one by one.
+    Closing the pool never waits for a maze being generated: the thread
+    is a daemon and the processes are terminated.
+    """
+
+    def __init__(self, config_file: str | MazeConfig | None,
+                 seed: int | None,
+                 depth: int = 2, worker: str = "THREAD") -> None:
+        """
+        Start filling the queue.
+
+        Args:
+            config_file (str | MazeConfig | None): Parsed settings or
+                path to the configuration file.
+            seed (int | None): Seed configured for the maze, if any.
+            depth (int): Number of mazes kept ready.
+            worker (str): THREAD or PROCESS.
+        """
+        self.config_file: str | MazeConfig | None = config_file
+        self.seed: int | None = seed
+        self.depth: int = max(1, depth)
+        # seeds of unseeded mazes come from the pool's own stream
+        self.rng: random.Random = random.Random()
+        self.executor: Executor
+        if worker == "PROCESS":
+            # multiprocessing is slow to import, only load it when used
+            from concurrent.futures import ProcessPoolExecutor
+            self.executor = ProcessPoolExecutor(max_workers=self.depth)
+        else:
+            self.executor = DaemonExecutor()
+        self.queue: Deque[Future[MazeGenerator]] = deque()
+        for _ in range(self.depth):
+            self.submit()
+
+    def next_seed(self) -> int:
+        """Return the seed of the next maze to generate."""
+        if self.seed is not None:
+            return self.seed
+        return self.rng.getrandbits(64)
+
+    def submit(self) -> None:
+        """Queue the generation of one more maze."""
+        self.queue.append(
+                self.executor.submit(
+                    build_maze, self.config_file, self.next_seed()
+                    )
+                )
+
+    def get(self) -> MazeGenerator:
+        """
+        Pop the oldest maze, waiting for it if it is not ready yet.
+
+        Returns:
+            MazeGenerator: The next maze of the sequence.
+        """
+        maze = self.queue.popleft().result()
+        self.submit()
+        return maze
+
+    def close(self) -> None:
+        """Stop the workers and drop the mazes not handed out."""
+        # process workers are joined at exit, stop the one carving now
+        processes = dict(getattr(self.executor, "_processes", None) or {})
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        for process in processes.values():
+            process.terminate()
+        self.queue.clear()
@@ -6,14 +6,30 @@
 # Updated: 2026/01/22 12:35:09
 
 from mlx import Mlx
-from typing import List, Tuple, Dict, Optional
+from collections import OrderedDict
+from typing import Any, List, Tuple, Dict, Optional, Set
+from maze_config import MazeConfig
 from maze_generator import MazeGenerator
+from maze_pool import MazePool
+from profiler import Profiler
+from tile_set import TileSet
+from viewport import Viewport
 
 class MazeRenderer:
     """A class holding the renderer's specifications."""
     
-    YELLOW = 0xFFFF00
-    BLUE = 0x00FFFF
+    YELLOW = TileSet.EXIT_COLOR
+    BLUE = TileSet.ENTRY_COLOR
+    MAX_PATCHES = 32
+    # arrow keys: move by a quarter of the view
+    PAN: Dict[int, Tuple[float, float]] = {
+            65361: (-0.25, 0),
+            65362: (0, -0.25),
+            65363: (0.25, 0),
+            65364: (0, 0.25)
+            }
+    # memory allowed for the cached palette/solution images
+    IMAGE_CACHE_BYTES = 256 * 1024 * 1024
     OFFSET: Dict[str, tuple] = {
             "N": (0, -1),
             "S": (0, 1),
@@ -21,12 +37,15 @@ class MazeRenderer:
             "W": (-1, 0)
             }
 
-    def __init__(self, config: Optional[str] = None) -> None:
+    def __init__(self, config: str | MazeConfig | None = None,
+                 profiler: Optional[Profiler] = None) -> None:
         """
         Initialize MLX renderer.
         
         Args:
-            output_file: Path to the maze file from MazeGenerator
+            config: Parsed settings or path to the configuration file
+            profiler: Times the phases of the run, enabled by --profile
+                or the PROFILE config key
             
         Attributes:
             content: parsed content of maze output file
@@ -42,15 +61,20 @@ class MazeRenderer:
         self.m = Mlx()
         self.ptr = self.m.mlx_init()
         self.maze_gen: MazeGenerator = None
+        self.pool: Optional[MazePool] = None
+        self.profiler: Profiler = (
+                profiler if profiler is not None else Profiler()
+                )
  
         # declare maze data
-        self.config_file: str = ""
+        self.config_file: str | MazeConfig | None = None
         self.maze_w: int = 0
         self.maze_h: int = 0
         self.content: List[str] = []
         self.entry = (0, 0)
         self.exit = (0, 0)
-        self.coord_path: List[Tuples[int, int]] = []
+        self.coord_path: List[Tuple[int, int]] = []
+        self.path_cells: Set[Tuple[int, int]] = set()
 
         # create a maze
         self.create_maze(config)
@@ -63,38 +87,25 @@ class MazeRenderer:
         self.img_h: int = 0
         self.cell_size: int = 30
         self.wall_thickness: int = 3
+        self.tiles: TileSet = TileSet(self.cell_size, self.wall_thickness)
+        self.screen_size: Optional[Tuple[int, int]] = None
+        # mazes larger than the screen are shown through a viewport
+        self.use_viewport: bool = False
+        self.view_size: Tuple[int, int] = (0, 0)
+        self.viewport: Optional[Viewport] = None
+        self.spare_images: List[Tuple[Any, Any]] = []
 
         # Additional colors and color counter
-        green: Dict[str, int] = {
-                "wall": 0x00CC00,
-                "path": 0x106050
-                }
-        cyan: Dict[str, int] = {
-                "wall": 0x00ECFF,
-                "path": 0x156055
-                }
-        pink: Dict[str, int] = {
-                "wall": 0xFF15F0,
-                "path": 0x850065
-                }
-        red: Dict[str, int] = {
-                "wall": 0xFF0020,
-                "path": 0x506020
-                }
-        orange: Dict[str, int] = {
-                "wall": 0xFF7F50,
-                "path": 0x852520
-                }
         # original = 0x00CC00
         # red = 0xFF0000
         # orange = 0xFF7F50
         # pink = 0xFF10F0
-        self.color_palettes: List[Dict[str,int]] = [green, cyan, pink, orange] 
-        self.palette_names: List[str] = ["green", "cyan", "pink", "orange"]
+        self.color_palettes: List[Dict[str, int]] = TileSet.PALETTES
+        self.palette_names: List[str] = TileSet.PALETTE_NAMES
         self.color_idx: int = 0
-        self.color_wall = green["wall"]
-        self.color_bg = 0x1A1A1A
-        self.color_path = green["path"]
+        self.color_wall = self.color_palettes[0]["wall"]
+        self.color_bg = TileSet.BACKGROUND
+        self.color_path = self.color_palettes[0]["path"]
         self.color_cursor = 0x1F1F1F
 
         # create configure and launch renderer
@@ -110,13 +121,26 @@ class MazeRenderer:
             coord_path.append(next_coord)
             x, y = next_coord
         self.coord_path = coord_path[:-1]
+        self.path_cells = set(self.coord_path)
 
-    def create_maze(self, config: str) -> None:
+    def create_maze(self, config: str | MazeConfig | None) -> None:
         self.config_file = config
-        maze_gen = MazeGenerator(config)
+        # release the previous maze before building the next one
+        self.maze_gen = None
+        if self.pool is None:
+            maze_gen = MazeGenerator(config, profiler=self.profiler)
+            # generate maze
+            maze_gen.generate_maze()
+            # next mazes are generated in the background
+            if maze_gen.pool_depth:
+                self.pool = MazePool(config, maze_gen.seed,
+                                     maze_gen.pool_depth,
+                                     maze_gen.pool_worker)
+        else:
+            with self.profiler.phase("next_maze"):
+                maze_gen = self.pool.get()
+                maze_gen.export_to_txt()
         self.maze_gen = maze_gen
-        # generate maze
-        maze_gen.generate_maze()
         # store maze data
         self.maze_w = maze_gen.cols
         self.maze_h = maze_gen.rows
@@ -129,14 +153,21 @@ class MazeRenderer:
         self.exit = maze_gen.exit
         self.convert_path(maze_gen.path)
         self.toggle_path: bool = False
+        self.wall_rects: List[Tuple[int, int, int, int]] = []
+        self.viewport = None
 
     def set_cell_size_and_wall_thickness(self) -> None:
         """Calculate cell size according to screen and maze size."""
-        # Get screen dimensions or switch to default on failure
-        ret, screen_width, screen_height = self.m.mlx_get_screen_size(self.ptr)
-        if ret != 0:
-            screen_width, screen_height = 1920, 1080
-            print("Warning: Using default screen size")
+        # Get screen dimensions once or switch to default on failure
+        if self.screen_size is None:
+            ret, screen_width, screen_height = (
+                    self.m.mlx_get_screen_size(self.ptr)
+                    )
+            if ret != 0:
+                screen_width, screen_height = 1920, 1080
+                print("Warning: Using default screen size")
+            self.screen_size = (screen_width, screen_height)
+        screen_width, screen_height = self.screen_size
 
         # Calculate usable screen space (90% of total scren size)
         usable_width: int = int(screen_width * 0.90)
@@ -165,15 +196,18 @@ class MazeRenderer:
         if (self.cell_size * self.maze_h) > available_height:
             self.cell_size = min(self.cell_size, int(available_height // self.maze_h))
 
-        # Enforce minimum
-        if self.cell_size < 12:
-            print("Warning: Maze is too large!")
-            print("Consider generating a smaller maze for better visibility")
-            print("Recommended maze size: 120x60\n")
+        # Enforce minimum, larger mazes are zoomed and panned instead
+        self.use_viewport = self.cell_size < 12
+        self.view_size = (available_width, available_height)
+        if self.use_viewport:
+            print("Maze is larger than the screen!")
+            print("Zoom with +/- and move with the arrow keys\n")
             self.cell_size = 12
 
         # adapt wall thickness to cell size
         self.wall_thickness = self.cell_size // 10
+        if self.tiles.cell_size != self.cell_size:
+            self.tiles = TileSet(self.cell_size, self.wall_thickness)
 
         # debug
         # print(f"Cell size: {self.cell_size}")
@@ -181,9 +215,12 @@ class MazeRenderer:
 
     def set_window_and_img_size(self) -> None:
         """Calculate window and image sizes."""
-        # Calculate maze image size
-        self.img_w = self.maze_w * self.cell_size
-        self.img_h = self.maze_h * self.cell_size
+        # Calculate maze image size, the whole view for large mazes
+        if self.use_viewport:
+            self.img_w, self.img_h = self.view_size
+        else:
+            self.img_w = self.maze_w * self.cell_size
+            self.img_h = self.maze_h * self.cell_size
 
         # Calculate window size with the extra space
         # use +300 instead of * 1.60 for a consistent empty space
@@ -199,19 +236,69 @@ class MazeRenderer:
     def config_launch_renderer(self) -> None:
         self.set_cell_size_and_wall_thickness()
         self.set_window_and_img_size()
+        self.create_window()
+        self.create_image_buffer()
+        self.define_mlx_operations()
 
-        # Create window and images
+    def create_window(self) -> None:
+        """Create the window with the size computed for the maze."""
         self.win_ptr = self.m.mlx_new_window(
             self.ptr, self.window_w, self.window_h, "=== A-maze-ing ==="
         )
+
+    def create_image_buffer(self) -> None:
+        """Create the maze image and the cache holding its variants."""
         self.img_ptr = self.m.mlx_new_image(
             self.ptr, self.img_w, self.img_h
         )
         # store img data in the renderer object for faster results
         self.img_data = self.m.mlx_get_data_addr(self.img_ptr)
+        self.dirty: List[Tuple[int, int, int, int]] = []
+
+        # one image per (palette, solution shown), least recently used first
+        self.image_cache: OrderedDict[Tuple[int, bool], Tuple[Any, Any]] = (
+                OrderedDict()
+                )
+        self.shown_key: Tuple[int, bool] = self.image_key()
+        self.image_cache[self.shown_key] = (self.img_ptr, self.img_data)
+        img_bytes = max(1, self.img_w * self.img_h * 4)
+        self.cache_limit: int = max(
+                2, min(2 * len(self.color_palettes),
+                       self.IMAGE_CACHE_BYTES // img_bytes)
+                )
+
+    def regenerate(self) -> None:
+        """
+        Generate a new maze and repaint it in the current window.
 
+        The window and the displayed image are kept when their size
+        does not change: the image buffer is filled in place and shown
+        with a single refresh. The cached variants of the previous maze
+        are kept as spare buffers for the next ones.
+        """
+        old_window = (self.window_w, self.window_h)
+        old_img = (self.img_w, self.img_h)
+        self.create_maze(self.config_file)
+        self.set_cell_size_and_wall_thickness()
+        self.set_window_and_img_size()
 
-        self.define_mlx_operations()
+        if (self.img_w, self.img_h) != old_img:
+            self.clear_image_cache()
+            if (self.window_w, self.window_h) != old_window:
+                self.m.mlx_destroy_window(self.ptr, self.win_ptr)
+                self.create_window()
+                self.register_hooks()
+            self.m.mlx_clear_window(self.ptr, self.win_ptr)
+            self.put_commands()
+            self.create_image_buffer()
+        else:
+            for key, image in self.image_cache.items():
+                if key != self.shown_key:
+                    self.spare_images.append(image)
+            self.image_cache.clear()
+            self.shown_key = self.image_key()
+            self.image_cache[self.shown_key] = (self.img_ptr, self.img_data)
+        self.create_image()
 
     def my_string_put(self, offset: int, color: int, msg: str) -> None: 
         if self.margin[0] == "bot":
@@ -226,6 +313,9 @@ class MazeRenderer:
         self.my_string_put(70, 0xFFFFFF, "c: toggle colors")
         self.my_string_put(90, 0xFFFFFF, "r: generate new maze")
         self.my_string_put(110, 0xFFFFFF, "q: quit")
+        if self.use_viewport:
+            self.my_string_put(130, 0xFFFFFF, "+/-: zoom")
+            self.my_string_put(150, 0xFFFFFF, "arrows: move")
 
     def my_mlx_pixel_put(self, x, y, color):
         """Fast pixel writing to image buffer."""
@@ -248,121 +338,293 @@ class MazeRenderer:
             for x in range(start_x, end_x):
                 self.my_mlx_pixel_put(x, y, color)
 
-    def draw_cell(self, i, j, color):
-        """Fast pixel writing to image buffer."""
-        start_x = j * self.cell_size
-        end_x = start_x + self.cell_size
-        start_y = i * self.cell_size
-        end_y = start_y + self.cell_size
-        self.draw(start_x, end_x, start_y, end_y, color)
-
-    def draw_entry_exit(self, i, j, color) -> None:
-        fraction: int = self.cell_size // 3
-        start_x = j * self.cell_size + fraction
-        end_x = start_x + fraction
-        start_y = i * self.cell_size + fraction
-        end_y = start_y + fraction
-        self.draw(start_x, end_x, start_y, end_y, color)
-
-    def draw_north_wall(self, i, j, color):
-        start_x = j * self.cell_size
-        end_x = start_x + self.cell_size
-        start_y = i * self.cell_size
-        end_y = start_y + self.wall_thickness
-        self.draw(start_x, end_x, start_y, end_y, color)
-
-    def draw_south_wall(self, i, j, color):
-        start_x = j * self.cell_size
-        end_x = start_x + self.cell_size
-        end_y = i * self.cell_size + self.cell_size
-        start_y = end_y - self.wall_thickness
-        self.draw(start_x, end_x, start_y, end_y, color)
-
-    def draw_east_wall(self, i, j, color):
-        end_x = j * self.cell_size + self.cell_size
-        start_x = end_x - self.wall_thickness
-        start_y = i * self.cell_size
-        end_y = start_y + self.cell_size
-        self.draw(start_x, end_x, start_y, end_y, color)
-
-    def draw_west_wall(self, i, j, color):
-        start_x = j * self.cell_size
-        end_x = start_x + self.wall_thickness
-        start_y = i * self.cell_size
-        end_y = start_y + self.cell_size
-        self.draw(start_x, end_x, start_y, end_y, color)
+    def cell_tile(self, i: int, j: int, cell: str) -> List[bytes]:
+        """Return the pre-rendered tile matching the state of a cell."""
+        if cell == 'F':
+            fill = self.color_wall
+        elif self.toggle_path and (j, i) in self.path_cells:
+            fill = self.color_path
+        else:
+            fill = self.color_bg
+        marker: Optional[int] = None
+        if (j, i) == self.entry:
+            marker = self.BLUE
+        elif (j, i) == self.exit:
+            marker = self.YELLOW
+        return self.tiles.get(cell, fill, self.color_wall, marker)
+
+    def blit_tile(self, i: int, j: int, tile: List[bytes]) -> None:
+        """Copy a tile into the image buffer, one pixel row at a time."""
+        data, bpp, size_line, endian = self.img_data
+        row_len = len(tile[0])
+        offset = i * self.cell_size * size_line + j * row_len
+        for row in tile:
+            data[offset:offset + row_len] = row
+            offset += size_line
 
     def create_image(self):
-        # Draw cases
+        """Paint the whole maze by copying tile rows into the buffer."""
+        if self.use_viewport:
+            self.viewport = Viewport(self.content, self.entry, self.exit,
+                                     self.path_cells, self.img_w, self.img_h)
+            self.draw_view()
+            return
+        data, bpp, size_line, endian = self.img_data
+        row_len = self.img_w * (bpp // 8)
+        self.tiles.prerender(self.color_wall, [self.color_bg, self.color_path])
         for i, line in enumerate(self.content):
-            for j, cell in enumerate(line):
-                if cell == 'F':
-                    self.draw_cell(i, j, self.color_wall)
-                elif self.toggle_path:
-                    if (j, i) in self.coord_path:
-                        self.draw_cell(i, j, self.color_path)
-                else:
-                    self.draw_cell(i, j, self.color_bg)
-                # Draw walls
-                if cell in "13579BD":
-                    self.draw_north_wall(i, j, self.color_wall)
-                if cell in "4567CDE":
-                    self.draw_south_wall(i, j, self.color_wall)
-                if cell in "2367ABE":
-                    self.draw_east_wall(i, j, self.color_wall)
-                if cell in "89ABCDE":
-                    self.draw_west_wall(i, j, self.color_wall)
-                if (j, i) == self.entry: 
-                    self.draw_entry_exit(i, j, self.BLUE)
-                if (j, i) == self.exit:
-                    self.draw_entry_exit(i, j, self.YELLOW)
+            tiles = [self.cell_tile(i, j, cell) for j, cell in enumerate(line)]
+            offset = i * self.cell_size * size_line
+            # one slice assignment per pixel row of the whole maze row
+            for r in range(self.cell_size):
+                data[offset:offset + row_len] = b"".join(t[r] for t in tiles)
+                offset += size_line
 
         # Display the image
         self.m.mlx_put_image_to_window(
             self.ptr, self.win_ptr, self.img_ptr, 0, 0)
 
+    def draw_view(self) -> None:
+        """Compose the visible part of a large maze and display it."""
+        if self.viewport is None:
+            return
+        data, bpp, size_line, endian = self.img_data
+        path = self.color_path if self.toggle_path else None
+        self.viewport.draw(data, size_line, self.color_wall, path)
+        self.m.mlx_put_image_to_window(
+            self.ptr, self.win_ptr, self.img_ptr, 0, 0)
+
     def mymouse(self, button, x, y, mystuff):
         print(f"Got mouse event! button {button} at {x},{y}.")
     
-    def toggle_solution(self, color) -> None:
-        # Draw(COLOR_PATH) or erase(COLOR_BG) solution
-        for i, line in enumerate(self.content):
-            for j, cell in enumerate(line):
-                if (j, i) in self.coord_path:
-                    self.draw_cell(i, j, color)
-                    if cell in "13579BD":
-                        self.draw_north_wall(i, j, self.color_wall)
-                    if cell in "4567CDE":
-                        self.draw_south_wall(i, j, self.color_wall)
-                    if cell in "2367ABE":
-                        self.draw_east_wall(i, j, self.color_wall)
-                    if cell in "89ABCDE":
-                        self.draw_west_wall(i, j, self.color_wall)
+    def mark_dirty(self, x: int, y: int, w: int, h: int) -> None:
+        """Record a damaged rectangle of the image, in pixels."""
+        self.dirty.append((x, y, w, h))
+
+    def mark_cell_dirty(self, i: int, j: int) -> None:
+        """Record the rectangle covered by a cell as damaged."""
+        size = self.cell_size
+        self.mark_dirty(j * size, i * size, size, size)
+
+    def merge_dirty(self) -> List[Tuple[int, int, int, int]]:
+        """Merge damaged rectangles sharing a band and touching in x."""
+        merged: List[Tuple[int, int, int, int]] = []
+        for x, y, w, h in sorted(self.dirty, key=lambda r: (r[1], r[3], r[0])):
+            if merged:
+                mx, my, mw, mh = merged[-1]
+                if my == y and mh == h and x <= mx + mw:
+                    merged[-1] = (mx, my, max(mx + mw, x + w) - mx, mh)
+                    continue
+            merged.append((x, y, w, h))
+        return merged
+
+    def push_rect(self, x: int, y: int, w: int, h: int) -> None:
+        """Upload one rectangle of the image through a patch image."""
+        data, bpp, size_line, endian = self.img_data
+        patch = self.m.mlx_new_image(self.ptr, w, h)
+        patch_data, patch_bpp, patch_line, _ = self.m.mlx_get_data_addr(patch)
+        row_len = w * (bpp // 8)
+        src = y * size_line + x * (bpp // 8)
+        dst = 0
+        for _ in range(h):
+            patch_data[dst:dst + row_len] = data[src:src + row_len]
+            src += size_line
+            dst += patch_line
+        self.m.mlx_put_image_to_window(self.ptr, self.win_ptr, patch, x, y)
+        self.m.mlx_destroy_image(self.ptr, patch)
+
+    def flush_dirty(self) -> None:
+        """Push the damaged parts of the image to the window."""
+        if not self.dirty:
+            return
+        left = min(x for x, _, _, _ in self.dirty)
+        top = min(y for _, y, _, _ in self.dirty)
+        right = max(x + w for x, _, w, _ in self.dirty)
+        bottom = max(y + h for _, y, _, h in self.dirty)
+        merged = self.merge_dirty()
+        if (right - left) * (bottom - top) * 2 >= self.img_w * self.img_h:
+            # most of the image changed: a single upload is cheaper
+            self.m.mlx_put_image_to_window(
+                self.ptr, self.win_ptr, self.img_ptr, 0, 0)
+        elif len(merged) > self.MAX_PATCHES:
+            self.push_rect(left, top, right - left, bottom - top)
+        else:
+            for rect in merged:
+                self.push_rect(*rect)
+        self.dirty.clear()
 
-        # Display the image
-        self.m.mlx_put_image_to_window(
-            self.ptr, self.win_ptr, self.img_ptr, 0, 0)
+    def get_wall_rects(self) -> List[Tuple[int, int, int, int]]:
+        """
+        List the wall pixels of the maze as merged rectangles.
+
+        Runs of horizontal walls along a row and of vertical walls
+        along a column are merged so that recoloring only needs a few
+        writes per maze row and column. The result is cached per maze.
+        """
+        if self.wall_rects:
+            return self.wall_rects
+        size = self.cell_size
+        thick = self.wall_thickness
+        rects: List[Tuple[int, int, int, int]] = []
+
+        def runs(flags: List[bool]) -> List[Tuple[int, int]]:
+            found: List[Tuple[int, int]] = []
+            start = -1
+            for k, flag in enumerate(flags + [False]):
+                if flag and start < 0:
+                    start = k
+                elif not flag and start >= 0:
+                    found.append((start, k - start))
+                    start = -1
+            return found
 
-    def toggle_colors(self) -> None:
         for i, line in enumerate(self.content):
+            y = i * size
+            for j, n in runs([c in TileSet.NORTH for c in line]):
+                rects.append((j * size, y, n * size, thick))
+            for j, n in runs([c in TileSet.SOUTH for c in line]):
+                rects.append((j * size, y + size - thick, n * size, thick))
             for j, cell in enumerate(line):
-                if (j, i) in self.coord_path and self.toggle_path:
-                    self.draw_cell(i, j, self.color_path)
                 if cell == 'F':
-                    self.draw_cell(i, j, self.color_wall)
-                if cell in "13579BD":
-                    self.draw_north_wall(i, j, self.color_wall)
-                if cell in "4567CDE":
-                    self.draw_south_wall(i, j, self.color_wall)
-                if cell in "2367ABE":
-                    self.draw_east_wall(i, j, self.color_wall)
-                if cell in "89ABCDE":
-                    self.draw_west_wall(i, j, self.color_wall)
+                    rects.append((j * size, y, size, size))
+        for j in range(self.maze_w):
+            x = j * size
+            column = [line[j] for line in self.content]
+            for i, n in runs([c in TileSet.WEST for c in column]):
+                rects.append((x, i * size, thick, n * size))
+            for i, n in runs([c in TileSet.EAST for c in column]):
+                rects.append((x + size - thick, i * size, thick, n * size))
+        self.wall_rects = rects
+        return rects
+
+    def fill_rects(self, rects: List[Tuple[int, int, int, int]],
+                   color: int) -> None:
+        """Fill rectangles with one color using 32-bit slice writes."""
+        data, bpp, size_line, endian = self.img_data
+        pixels = memoryview(data).cast('I')
+        stride = size_line // 4
+        pixel = TileSet.pixel(color)
+        runs: Dict[int, memoryview] = {}
+        for x, y, w, h in rects:
+            start = y * stride + x
+            if w >= h:
+                # few long rows: contiguous writes
+                if w not in runs:
+                    runs[w] = memoryview(pixel * w).cast('I')
+                for _ in range(h):
+                    pixels[start:start + w] = runs[w]
+                    start += stride
+            else:
+                # few tall columns: strided writes
+                if h not in runs:
+                    runs[h] = memoryview(pixel * h).cast('I')
+                for _ in range(w):
+                    pixels[start:start + h * stride:stride] = runs[h]
+                    start += 1
+
+    def paint_path(self, color: int) -> None:
+        """Repaint the solution cells with a fill color."""
+        for j, i in self.coord_path:
+            cell = self.content[i][j]
+            self.blit_tile(i, j, self.tiles.get(cell, color, self.color_wall))
+            self.mark_cell_dirty(i, j)
+
+    def paint_walls(self) -> None:
+        """Repaint only the wall pixels with the current wall color."""
+        wall_rects = self.get_wall_rects()
+        self.fill_rects(wall_rects, self.color_wall)
+        self.dirty.extend(wall_rects)
 
-        # Display the image
+    def toggle_solution(self, color) -> None:
+        # Draw(COLOR_PATH) or erase(COLOR_BG) solution
+        self.paint_path(color)
+        self.flush_dirty()
+
+    def toggle_colors(self) -> None:
+        # Only wall pixels change, plus the path when it is displayed
+        self.paint_walls()
+        if self.toggle_path:
+            self.paint_path(self.color_path)
+        self.flush_dirty()
+
+    def image_key(self) -> Tuple[int, bool]:
+        """Key of the cached image matching the displayed state."""
+        return (self.color_idx, self.toggle_path)
+
+    def build_image(self, key: Tuple[int, bool]) -> Tuple[Any, Any]:
+        """
+        Build the image of a (palette, solution shown) state.
+
+        The displayed image is copied into a new image and only the
+        pixels that differ (walls and/or path) are repainted.
+        """
+        if self.spare_images:
+            img_ptr, img_data = self.spare_images.pop()
+        else:
+            img_ptr = self.m.mlx_new_image(self.ptr, self.img_w, self.img_h)
+            img_data = self.m.mlx_get_data_addr(img_ptr)
+        src = self.img_data[0]
+        img_data[0][:len(src)] = src
+
+        # paint the target state, then restore the current colors
+        saved = (self.img_data, self.color_wall, self.color_path)
+        src_idx, src_shown = self.shown_key
+        palette = self.color_palettes[key[0]]
+        self.img_data = img_data
+        self.color_wall = palette["wall"]
+        self.color_path = palette["path"]
+        if key[0] != src_idx:
+            self.paint_walls()
+        if key[1]:
+            self.paint_path(self.color_path)
+        elif src_shown:
+            self.paint_path(self.color_bg)
+        self.dirty.clear()
+        self.img_data, self.color_wall, self.color_path = saved
+        return img_ptr, img_data
+
+    def show_image(self) -> None:
+        """Display the cached image of the current state, building it once."""
+        if self.use_viewport:
+            # the viewport caches its own tiles per palette and path
+            self.draw_view()
+            return
+        key = self.image_key()
+        if key in self.image_cache:
+            self.image_cache.move_to_end(key)
+        else:
+            self.image_cache[key] = self.build_image(key)
+            # evict least recently used images, never the displayed one
+            while len(self.image_cache) > self.cache_limit:
+                _, (img_ptr, _) = self.image_cache.popitem(last=False)
+                self.m.mlx_destroy_image(self.ptr, img_ptr)
+        self.img_ptr, self.img_data = self.image_cache[key]
+        self.shown_key = key
         self.m.mlx_put_image_to_window(
             self.ptr, self.win_ptr, self.img_ptr, 0, 0)
 
+    def prebuild_image(self, param) -> int:
+        """Build one missing image while the loop is idle."""
+        if self.use_viewport or len(self.image_cache) >= self.cache_limit:
+            return 0
+        idx, shown = self.image_key()
+        nb_palettes = len(self.color_palettes)
+        # most likely next presses first: s, then c
+        for key in [(idx, not shown), ((idx + 1) % nb_palettes, shown)]:
+            if key not in self.image_cache:
+                self.image_cache[key] = self.build_image(key)
+                self.image_cache.move_to_end(key, last=False)
+                break
+        return 0
+
+    def clear_image_cache(self) -> None:
+        """Destroy every cached image, the displayed one included."""
+        images = list(self.image_cache.values()) + self.spare_images
+        for img_ptr, _ in images:
+            self.m.mlx_destroy_image(self.ptr, img_ptr)
+        self.image_cache.clear()
+        self.spare_images.clear()
+
     def mykey(self, keynum, param):
         #navigation: Dict[str, int] = {
         #        65361: "W",
@@ -374,12 +636,12 @@ class MazeRenderer:
         # s key
         if keynum == 115:
             self.toggle_path = not self.toggle_path
+            with self.profiler.phase("solution"):
+                self.show_image()
             if self.toggle_path:
                 print("Showing solution")
-                self.toggle_solution(self.color_path)
             else:
                 print("Hiding solution")
-                self.toggle_solution(self.color_bg)
         # c key
         elif keynum == 99:
             next_idx = (self.color_idx + 1) % len(self.color_palettes)
@@ -387,33 +649,50 @@ class MazeRenderer:
             palette = self.color_palettes[next_idx]
             self.color_wall = palette["wall"]
             self.color_path = palette["path"]
-            self.toggle_colors()
+            with self.profiler.phase("palette"):
+                self.show_image()
             print(f"Switched to {self.palette_names[next_idx]} color palette")
         # r key
         elif keynum == 114:
             print("Generating new maze...")
-            self.m.mlx_clear_window(self.ptr, self.win_ptr)
-            self.m.mlx_destroy_image(self.ptr, self.img_ptr)
-            self.m.mlx_destroy_window(self.ptr, self.win_ptr)
-            self.m.mlx_loop_exit(self.ptr)
-            # create new maze
-            self.create_maze(self.config_file)
-            # create configure and launch renderer
-            self.config_launch_renderer()
+            with self.profiler.phase("regenerate"):
+                self.regenerate()
+        # +/= and - keys: zoom large mazes
+        elif keynum in (43, 61, 45) and self.use_viewport \
+                and self.viewport is not None:
+            if self.viewport.zoom(1 if keynum == 45 else -1):
+                with self.profiler.phase("view"):
+                    self.draw_view()
+        # arrow keys: move the view on large mazes
+        elif keynum in self.PAN and self.use_viewport \
+                and self.viewport is not None:
+            self.viewport.pan(*self.PAN[keynum])
+            with self.profiler.phase("view"):
+                self.draw_view()
         #elif keynum in navigation.keys():
         #        self.navigate(navigation[keynum])
         elif keynum == 113:
             self.gere_close(None)
              
     def gere_close(self, dummy):
+        if self.pool is not None:
+            self.pool.close()
+        if self.profiler.enabled:
+            print(f"Profile written to {self.profiler.write()}")
         self.m.mlx_loop_exit(self.ptr)
 
+    def register_hooks(self) -> None:
+        """Attach the event handlers to the current window."""
+        self.m.mlx_mouse_hook(self.win_ptr, self.mymouse, None)
+        self.m.mlx_key_hook(self.win_ptr, self.mykey, None)
+        self.m.mlx_hook(self.win_ptr, 33, 0, self.gere_close, None)
+        self.m.mlx_loop_hook(self.ptr, self.prebuild_image, None)
+
     def define_mlx_operations(self) -> None:
         """Define series of operations to perform."""
         self.m.mlx_clear_window(self.ptr, self.win_ptr)
         self.put_commands()
-        self.create_image()
-        self.m.mlx_mouse_hook(self.win_ptr, self.mymouse, None)
-        self.m.mlx_key_hook(self.win_ptr, self.mykey, None)
-        self.m.mlx_hook(self.win_ptr, 33, 0, self.gere_close, None)
+        with self.profiler.phase("render"):
+            self.create_image()
+        self.register_hooks()
         self.m.mlx_loop(self.ptr)
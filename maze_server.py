@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+# File: maze_server.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/16 10:20:44
+# Updated: 2026/02/16 10:20:44
+
+"""
+Local maze generation service.
+
+A long-running asyncio HTTP server, on localhost or a Unix socket,
+hands mazes to other tools without paying the interpreter startup and
+the file I/O of a_maze_ing.py on every request. Mazes are generated by
+a warm process pool; the event loop only parses requests and writes
+responses.
+
+Requests take the keys of the config file, in the query string or as
+KEY=value lines in a POST body, plus FORMAT=HEX or FORMAT=BINARY:
+
+    GET /maze?WIDTH=30&HEIGHT=20&SEED=4&ALGORITHM=DFS
+    GET /stats
+
+At most `concurrency` mazes are generated at once and `max_pending`
+more requests may wait for a slot; beyond that the server answers 503
+at once, so that a burst cannot pile up unbounded work. Generations
+running longer than `timeout` seconds are answered with 504.
+
+Usage: python3 maze_server.py [--host 127.0.0.1] [--port 8042]
+           [--unix path] [--workers N] [--concurrency N]
+           [--max-pending N] [--timeout seconds] [--max-cells N]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import struct
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlsplit
+
+from maze_config import MazeConfig
+from maze_generator import MazeGenerator
+
+ALLOWED: List[str] = ["WIDTH", "HEIGHT", "ENTRY", "EXIT", "SEED", "PERFECT",
+                      "ALGORITHM", "RNG", "HYBRID_FRACTION", "AUTO_BORDER",
+                      "AUTO_DISTANCE"]
+FORMATS: List[str] = ["HEX", "BINARY"]
+MAGIC: bytes = b"AMZ1"
+# cols, rows, entry x/y, exit x/y, number of moves
+HEADER = struct.Struct(">4sHHHHHHI")
+# sides and coordinates are packed as uint16 in HEADER
+MAX_SIDE: int = 0xFFFF
+DIRECTIONS: str = "NESW"
+STATUS: Dict[int, str] = {
+        200: "OK", 400: "Bad Request", 404: "Not Found",
+        405: "Method Not Allowed", 413: "Payload Too Large",
+        500: "Internal Server Error", 503: "Service Unavailable",
+        504: "Gateway Timeout",
+        }
+MAX_BODY: int = 64 * 1024
+# time allowed to send the headers of a request
+READ_TIMEOUT: float = 10.0
+
+
+def encode_hex(maze: MazeGenerator) -> bytes:
+    """The maze in the format of the output file."""
+    x, y = maze.entry
+    ex, ey = maze.exit
+    return f"{maze.hex_repr}\n{x},{y}\n{ex},{ey}\n{maze.path}\n".encode()
+
+
+def encode_binary(maze: MazeGenerator) -> bytes:
+    """
+    The maze packed: a header, two cells per byte, four moves per byte.
+
+    The header holds the magic, the size, the entry, the exit and the
+    number of moves of the path. Cells follow row by row, high nibble
+    first, then the moves as 2 bits each (N, E, S, W).
+    """
+    cells = "".join(cell.hex_repr for row in maze.grid for cell in row)
+    if len(cells) % 2:
+        cells += "0"
+    moves = bytearray((len(maze.path) + 3) // 4)
+    for k, direction in enumerate(maze.path):
+        moves[k >> 2] |= DIRECTIONS.index(direction) << (6 - 2 * (k & 3))
+    header = HEADER.pack(MAGIC, maze.cols, maze.rows, *maze.entry,
+                         *maze.exit, len(maze.path))
+    return header + bytes.fromhex(cells) + bytes(moves)
+
+
+def decode_binary(data: bytes) -> Tuple[List[str], Tuple[int, int],
+                                        Tuple[int, int], str]:
+    """
+    Unpack a maze encoded by encode_binary.
+
+    Returns:
+        tuple: Hex rows, entry, exit and path.
+    """
+    magic, cols, rows, x, y, ex, ey, length = HEADER.unpack_from(data)
+    if magic != MAGIC:
+        raise ValueError("not a binary maze")
+    size = (cols * rows + 1) // 2
+    cells = data[HEADER.size:HEADER.size + size].hex().upper()
+    content = [cells[r * cols:(r + 1) * cols] for r in range(rows)]
+    moves = data[HEADER.size + size:]
+    path = "".join(DIRECTIONS[(moves[k >> 2] >> (6 - 2 * (k & 3))) & 3]
+                   for k in range(length))
+    return content, (x, y), (ex, ey), path
+
+
+def warm_up() -> None:
+    """Generate a tiny maze so that a new worker is ready to serve."""
+    MazeGenerator(MazeConfig(verbose=False), verbose=False).generate_maze(
+            export=False)
+
+
+def generate(config: MazeConfig, fmt: str) -> bytes:
+    """
+    Generate and encode one maze, in a worker process.
+
+    Args:
+        config (MazeConfig): Settings of the maze.
+        fmt (str): HEX or BINARY.
+
+    Returns:
+        bytes: The encoded maze.
+    """
+    maze = MazeGenerator(config, verbose=False)
+    maze.generate_maze(export=False)
+    return encode_binary(maze) if fmt == "BINARY" else encode_hex(maze)
+
+
+class MazeServer:
+    """
+    Serve mazes over HTTP with a bounded amount of work in flight.
+
+    Connections are kept alive, so a client can send many requests
+    without reconnecting.
+    """
+
+    def __init__(self, workers: int = 0, concurrency: int = 0,
+                 max_pending: int = 64, timeout: float = 10.0,
+                 max_cells: int = 250000) -> None:
+        """
+        Prepare the server, the pool is started by start().
+
+        Args:
+            workers (int): Worker processes, one per CPU by default.
+            concurrency (int): Mazes generated at once, workers by
+                default.
+            max_pending (int): Requests waiting for a slot before new
+                ones are rejected with 503.
+            timeout (float): Seconds allowed to generate a maze.
+            max_cells (int): Largest maze accepted.
+        """
+        self.workers: int = workers or os.cpu_count() or 1
+        self.concurrency: int = concurrency or self.workers
+        self.max_pending: int = max_pending
+        self.timeout: float = timeout
+        self.max_cells: int = max_cells
+        self.slots: asyncio.Semaphore = asyncio.Semaphore(self.concurrency)
+        self.waiting: int = 0
+        self.pool: Optional[ProcessPoolExecutor] = None
+        self.stats: Dict[str, int] = {
+                "requests": 0, "served": 0, "rejected": 0, "timeouts": 0,
+                "errors": 0,
+                }
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8042,
+                    unix: Optional[str] = None) -> asyncio.AbstractServer:
+        """
+        Start the warm workers, then listen.
+
+        Args:
+            host (str): Address to listen on.
+            port (int): TCP port.
+            unix (str | None): Path of a Unix socket, used instead of
+                the TCP address when given.
+
+        Returns:
+            asyncio.AbstractServer: The listening server.
+        """
+        loop = asyncio.get_running_loop()
+        self.pool = ProcessPoolExecutor(max_workers=self.workers,
+                                        initializer=warm_up)
+        await asyncio.gather(*(loop.run_in_executor(self.pool, os.getpid)
+                               for _ in range(self.workers)))
+        if unix is not None:
+            return await asyncio.start_unix_server(self.handle, unix)
+        return await asyncio.start_server(self.handle, host, port)
+
+    def close(self) -> None:
+        """Stop the workers."""
+        if self.pool is not None:
+            self.pool.shutdown(wait=False, cancel_futures=True)
+
+    def parse_settings(self, pairs: List[Tuple[str, str]]
+                       ) -> Tuple[MazeConfig, str]:
+        """
+        Turn request settings into a maze config.
+
+        Args:
+            pairs (list): KEY, value pairs of the request.
+
+        Returns:
+            tuple: The config and the output format.
+
+        Raises:
+            ValueError: If a setting is unknown or invalid.
+        """
+        raw: Dict[str, str] = {}
+        fmt = "HEX"
+        for key, value in pairs:
+            key = key.strip().upper()
+            if key == "FORMAT":
+                fmt = value.strip().upper()
+                if fmt not in FORMATS:
+                    raise ValueError("FORMAT: pick HEX or BINARY")
+            elif key in ALLOWED:
+                raw[key] = value.strip()
+            else:
+                raise ValueError(f"{key}: allowed keys are "
+                                 f"{', '.join(ALLOWED)}, FORMAT")
+        config = MazeConfig.from_settings(raw)
+        rejected = [key for key in raw if key not in config.custom]
+        if rejected:
+            raise ValueError(f"invalid {', '.join(rejected)}")
+        if config.cols < 2 or config.rows < 2 \
+                or config.cols * config.rows > self.max_cells:
+            raise ValueError(f"size must be at least 2x2 and at most "
+                             f"{self.max_cells} cells")
+        if config.cols > MAX_SIDE or config.rows > MAX_SIDE:
+            raise ValueError(f"width and height must be at most {MAX_SIDE}")
+        # the pool already uses every core, DIVISION stays in its worker
+        config.division_workers = 1
+        return config, fmt
+
+    async def serve_maze(self, config: MazeConfig,
+                         fmt: str) -> Tuple[int, bytes, str]:
+        """
+        Generate a maze within the concurrency limit and the timeout.
+
+        The slot of a timed out maze is only released when its worker
+        is done, so timeouts cannot overload the pool.
+
+        Returns:
+            tuple: Status, body and content type of the response.
+        """
+        if self.waiting >= self.concurrency + self.max_pending:
+            self.stats["rejected"] += 1
+            return 503, b"server busy, retry later\n", "text/plain"
+        self.waiting += 1
+        try:
+            await self.slots.acquire()
+        finally:
+            self.waiting -= 1
+        loop = asyncio.get_running_loop()
+        future = loop.run_in_executor(self.pool, generate, config, fmt)
+        future.add_done_callback(lambda _: self.slots.release())
+        try:
+            body = await asyncio.wait_for(asyncio.shield(future),
+                                          self.timeout)
+        except asyncio.TimeoutError:
+            self.stats["timeouts"] += 1
+            return 504, b"generation timed out\n", "text/plain"
+        except Exception as e:
+            self.stats["errors"] += 1
+            return 500, f"generation failed: {e}\n".encode(), "text/plain"
+        self.stats["served"] += 1
+        if fmt == "BINARY":
+            return 200, body, "application/octet-stream"
+        return 200, body, "text/plain"
+
+    async def read_request(self, reader: asyncio.StreamReader
+                           ) -> Optional[Tuple[str, str, Dict[str, str],
+                                               bytes]]:
+        """
+        Read one HTTP request.
+
+        Returns:
+            tuple | None: Method, target, headers and body, None when
+            the client closed the connection, stopped sending for
+            READ_TIMEOUT or sent an invalid Content-Length.
+        """
+        try:
+            head = await asyncio.wait_for(reader.readuntil(b"\r\n\r\n"),
+                                          READ_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError,
+                asyncio.LimitOverrunError, ConnectionError):
+            return None
+        lines = head.decode("latin-1").split("\r\n")
+        method, target, _ = (lines[0].split(" ", 2) + ["", ""])[:3]
+        headers: Dict[str, str] = {}
+        for line in lines[1:]:
+            if ":" in line:
+                name, value = line.split(":", 1)
+                headers[name.strip().lower()] = value.strip()
+        try:
+            length = int(headers.get("content-length", "0") or 0)
+        except ValueError:
+            length = -1
+        if length < 0:
+            return None
+        if length > MAX_BODY:
+            return method, target, headers, b"\0" * (MAX_BODY + 1)
+        try:
+            body = await asyncio.wait_for(reader.readexactly(length),
+                                          READ_TIMEOUT)
+        except (asyncio.IncompleteReadError, asyncio.TimeoutError,
+                ConnectionError):
+            return None
+        return method, target, headers, body
+
+    async def respond(self, writer: asyncio.StreamWriter, status: int,
+                      body: bytes, content_type: str,
+                      keep_alive: bool) -> None:
+        """Write a response, waiting while the client is slow to read."""
+        head = (f"HTTP/1.1 {status} {STATUS[status]}\r\n"
+                f"Content-Type: {content_type}\r\n"
+                f"Content-Length: {len(body)}\r\n"
+                f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n")
+        if status == 503:
+            head += "Retry-After: 1\r\n"
+        writer.write((head + "\r\n").encode("latin-1") + body)
+        await writer.drain()
+
+    async def dispatch(self, method: str, target: str,
+                       body: bytes) -> Tuple[int, bytes, str]:
+        """Route a request to the maze or the stats endpoint."""
+        url = urlsplit(target)
+        if url.path == "/stats":
+            stats = dict(self.stats, waiting=self.waiting,
+                         concurrency=self.concurrency)
+            return 200, json.dumps(stats).encode() + b"\n", \
+                "application/json"
+        if url.path != "/maze":
+            return 404, b"use /maze or /stats\n", "text/plain"
+        if method not in ("GET", "POST"):
+            return 405, b"use GET or POST\n", "text/plain"
+        if len(body) > MAX_BODY:
+            return 413, b"request too large\n", "text/plain"
+        pairs = parse_qsl(url.query)
+        for line in body.decode("utf-8", "replace").splitlines():
+            line = line.strip()
+            if line and not line.startswith("#") and "=" in line:
+                key, value = line.split("=", 1)
+                pairs.append((key, value))
+        try:
+            config, fmt = self.parse_settings(pairs)
+        except ValueError as e:
+            return 400, f"Error: {e}\n".encode(), "text/plain"
+        return await self.serve_maze(config, fmt)
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        """Serve the requests of one connection until it is closed."""
+        try:
+            while True:
+                request = await self.read_request(reader)
+                if request is None:
+                    break
+                method, target, headers, body = request
+                self.stats["requests"] += 1
+                status, payload, content_type = await self.dispatch(
+                        method, target, body)
+                keep_alive = headers.get("connection", "").lower() != "close"
+                await self.respond(writer, status, payload, content_type,
+                                   keep_alive)
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+
+async def serve(args: argparse.Namespace) -> None:
+    """Run the server until interrupted."""
+    server = MazeServer(args.workers, args.concurrency, args.max_pending,
+                        args.timeout, args.max_cells)
+    listener = await server.start(args.host, args.port, args.unix)
+    where = args.unix or f"http://{args.host}:{args.port}"
+    print(f"Serving mazes on {where} with {server.workers} workers")
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        server.close()
+
+
+def main() -> None:
+    """Parse the options and start the server."""
+    parser = argparse.ArgumentParser(description="Maze generation server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8042)
+    parser.add_argument("--unix", default=None,
+                        help="listen on a Unix socket instead")
+    parser.add_argument("--workers", type=int, default=0,
+                        help="worker processes, one per CPU by default")
+    parser.add_argument("--concurrency", type=int, default=0,
+                        help="mazes generated at once, workers by default")
+    parser.add_argument("--max-pending", type=int, default=64,
+                        help="requests waiting before answering 503")
+    parser.add_argument("--timeout", type=float, default=10.0,
+                        help="seconds allowed to generate a maze")
+    parser.add_argument("--max-cells", type=int, default=250000,
+                        help="largest maze accepted")
+    args = parser.parse_args()
+    try:
+        asyncio.run(serve(args))
+    except KeyboardInterrupt:
+        print("Bye!")
+
+
+if __name__ == "__main__":
+    main()
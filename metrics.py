@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# File: metrics.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/13 10:06:52
+# Updated: 2026/02/13 10:06:52
+
+from typing import Any, Dict
+
+
+class Histogram:
+    """
+    Distribution of a value in power-of-two buckets.
+
+    Bucket b counts the values v such that 2**(b-1) <= v < 2**b, bucket
+    0 counts zeros, which keeps a few buckets for any maze size.
+    """
+
+    def __init__(self) -> None:
+        """Start an empty histogram."""
+        self.count: int = 0
+        self.total: int = 0
+        self.max: int = 0
+        self.buckets: Dict[int, int] = {}
+
+    def add(self, value: int) -> None:
+        """
+        Record one value.
+
+        Args:
+            value (int): Non negative value to record.
+        """
+        self.count += 1
+        self.total += value
+        if value > self.max:
+            self.max = value
+        bucket = value.bit_length()
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+
+    @property
+    def mean(self) -> float:
+        """Average of the recorded values."""
+        return self.total / self.count if self.count else 0.0
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Summary and buckets, labelled by their value range."""
+        return {
+                "count": self.count,
+                "mean": round(self.mean, 3),
+                "max": self.max,
+                "buckets": {
+                    (f"{1 << (b - 1)}-{(1 << b) - 1}" if b else "0"): n
+                    for b, n in sorted(self.buckets.items())
+                    },
+                }
+
+
+class MazeMetrics:
+    """
+    Counters and histograms recorded while a maze is generated.
+
+    The generator only records them when metrics are enabled, with the
+    METRICS config key or generate_maze(metrics=True), and returns
+    them from generate_maze so that the cost of a maze can be related
+    to its seed and size.
+    """
+
+    def __init__(self, seed: int | None, cols: int, rows: int,
+                 algorithm: str, perfect: bool) -> None:
+        """
+        Start empty metrics for a maze.
+
+        Args:
+            seed (int | None): Seed of the maze.
+            cols (int): Width of the maze.
+            rows (int): Height of the maze.
+            algorithm (str): Algorithm carving the maze.
+            perfect (bool): Whether the maze is perfect.
+        """
+        self.seed: int | None = seed
+        self.cols: int = cols
+        self.rows: int = rows
+        self.algorithm: str = algorithm
+        self.perfect: bool = perfect
+        self.counters: Dict[str, int] = {}
+        self.histograms: Dict[str, Histogram] = {}
+
+    def count(self, name: str, n: int = 1) -> None:
+        """Add n to a counter."""
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def maximum(self, name: str, value: int) -> None:
+        """Keep the largest value seen for a counter."""
+        if value > self.counters.get(name, 0):
+            self.counters[name] = value
+
+    def observe(self, name: str, value: int) -> None:
+        """Record a value in a histogram."""
+        histogram = self.histograms.get(name)
+        if histogram is None:
+            histogram = self.histograms[name] = Histogram()
+        histogram.add(value)
+
+    def as_dict(self) -> Dict[str, Any]:
+        """Metrics as plain data, ready for JSON."""
+        return {
+                "seed": self.seed,
+                "size": [self.cols, self.rows],
+                "algorithm": self.algorithm,
+                "perfect": self.perfect,
+                "counters": dict(self.counters),
+                "histograms": {
+                    name: histogram.as_dict()
+                    for name, histogram in self.histograms.items()
+                    },
+                }
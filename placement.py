@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+# File: placement.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/24 10:17:52
+# Updated: 2026/02/24 10:17:52
+
+"""
+Entry and exit placed as far apart as the maze allows.
+
+In a tree the cell farthest from any cell is one end of a longest
+path, and the cell farthest from that end is the other one: two BFS
+give the diameter of a perfect maze. This holds as well when the ends
+are restricted to a set of cells, such as the border. A maze with
+loops has no such shortcut; the double sweep is repeated from its last
+end while it finds a longer distance, a bounded number of times. The
+pair found is then a lower bound of the diameter, exact on trees.
+
+With a minimum distance, the points are drawn at random among those
+far enough apart instead. In a tree the farthest cell from any cell is
+one of the two ends of the diameter, so the cells having a partner far
+enough are known from the two BFS of the ends.
+"""
+
+from array import array
+from collections import deque
+from typing import TYPE_CHECKING, List, Tuple
+
+if TYPE_CHECKING:
+    from maze_generator import MazeGenerator
+
+# N, E, S, W wall bits, see MazeGenerator.wall_bits
+BITS: Tuple[int, ...] = (1, 2, 4, 8)
+# double sweeps tried on a maze with loops
+SWEEPS: int = 4
+
+
+def sweep(walls: bytearray, cols: int, start: int) -> array:
+    """Steps from a cell to every cell, -1 out of reach."""
+    steps = (-cols, 1, cols, -1)
+    distance = array("i", [-1]) * len(walls)
+    distance[start] = 0
+    queue = deque([start])
+    while queue:
+        cell = queue.popleft()
+        reach = distance[cell] + 1
+        for d, step in enumerate(steps):
+            if not walls[cell] & BITS[d] and distance[cell + step] < 0:
+                distance[cell + step] = reach
+                queue.append(cell + step)
+    return distance
+
+
+def candidates(maze: "MazeGenerator") -> List[int]:
+    """Ids of the cells an automatic point may take."""
+    cols, rows = maze.cols, maze.rows
+    return [y * cols + x for y in range(rows) for x in range(cols)
+            if not maze.grid[y][x]._is_42
+            and (not maze.auto_border or x in (0, cols - 1)
+                 or y in (0, rows - 1))]
+
+
+def farthest(distance: array, cells: List[int]) -> int:
+    """The first of the cells farthest away."""
+    return max(cells, key=distance.__getitem__)
+
+
+def diameter(maze: "MazeGenerator", walls: bytearray, cells: List[int],
+             start: int) -> Tuple[int, array, int]:
+    """
+    Ends of the longest path between two of the cells.
+
+    Returns:
+        tuple: One end, the distances from it and the other end.
+    """
+    first = farthest(sweep(walls, maze.cols, start), cells)
+    distance = sweep(walls, maze.cols, first)
+    last = farthest(distance, cells)
+    if not maze.perfect:
+        for _ in range(SWEEPS):
+            back = sweep(walls, maze.cols, last)
+            end = farthest(back, cells)
+            if back[end] <= distance[last]:
+                break
+            first, distance, last = last, back, end
+    return first, distance, last
+
+
+def pick(maze: "MazeGenerator", distance: array, cells: List[int]) -> int:
+    """A cell at least AUTO_DISTANCE away, the farthest otherwise."""
+    far = [cell for cell in cells if distance[cell] >= maze.auto_distance]
+    if maze.auto_distance and far:
+        return maze.rng.choice(far)
+    if maze.auto_distance:
+        maze.log(f"Warning: no cell {maze.auto_distance} steps away, "
+                 f"using the farthest one")
+    return farthest(distance, cells)
+
+
+def place_entry_exit(maze: "MazeGenerator") -> Tuple[tuple, tuple]:
+    """
+    Choose the automatic entry and exit of a carved maze.
+
+    A fixed point keeps its place and the other one is chosen from a
+    BFS of it. Both automatic take the diameter, or a pair at least
+    AUTO_DISTANCE apart.
+
+    Args:
+        maze (MazeGenerator): A carved maze, not solved yet.
+
+    Returns:
+        tuple: Coordinates of the entry and of the exit.
+    """
+    cols = maze.cols
+    walls = bytearray(maze.wall_bits(cell)
+                      for row in maze.grid for cell in row)
+    cells = candidates(maze)
+    x, y = maze.entry
+    ex, ey = maze.exit
+    entry, exit = y * cols + x, ey * cols + ex
+    if not cells:
+        maze.log("Warning: no cell for the automatic points")
+        return maze.entry, maze.exit
+
+    if maze.auto_entry and maze.auto_exit:
+        entry, distance, exit = diameter(maze, walls, cells, entry)
+        if maze.auto_distance and distance[exit] >= maze.auto_distance:
+            back = sweep(walls, cols, exit)
+            # a cell far enough from any cell is one of the two ends
+            entry = maze.rng.choice([
+                cell for cell in cells
+                if max(distance[cell], back[cell]) >= maze.auto_distance])
+            exit = pick(maze, sweep(walls, cols, entry), cells)
+        elif maze.auto_distance:
+            maze.log(f"Warning: no cells {maze.auto_distance} steps "
+                     f"apart, using the farthest pair")
+    elif maze.auto_exit:
+        exit = pick(maze, sweep(walls, cols, entry), cells)
+    elif maze.auto_entry:
+        entry = pick(maze, sweep(walls, cols, exit), cells)
+    return (entry % cols, entry // cols), (exit % cols, exit // cols)
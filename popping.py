@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# File: popping.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/19 10:03:48
+# Updated: 2026/02/19 10:03:48
+
+"""
+Uniform spanning trees by cycle popping, on NumPy arrays.
+
+Every cell but the root points to a random neighbor. While the arrows
+hold cycles, the cells of every cycle draw a new arrow; the arrows left
+form a uniform spanning tree (Propp and Wilson), the same distribution
+as Wilson's algorithm, which pops the same cycles one walk at a time.
+The arrows and every round of redraws are drawn as whole arrays, and
+the cycles of a round found at once by pointer jumping over the cells
+redrawn last; only the walks along the unchanged arrows between them
+are plain loops.
+
+NumPy is imported with this module, only when ALGORITHM=POPPING.
+"""
+
+from typing import TYPE_CHECKING, List, Tuple
+
+import numpy as np
+
+from rng import pcg64_generator
+
+if TYPE_CHECKING:
+    from maze_generator import MazeGenerator
+
+# directions of the neighbor slots, in the order of OFFSETS
+DIRECTIONS: str = "NESW"
+OFFSETS: Tuple[Tuple[int, int], ...] = ((0, -1), (1, 0), (0, 1), (-1, 0))
+# states of the cells while popping
+DRAWN: int = 1
+SETTLED: int = 2
+
+
+def neighbor_table(valid: np.ndarray) -> Tuple[np.ndarray, np.ndarray,
+                                               np.ndarray]:
+    """
+    Valid neighbors of every cell, packed at the start of each row.
+
+    Args:
+        valid (np.ndarray): (rows, cols) mask of the cells outside the
+            42 pattern.
+
+    Returns:
+        tuple: (n, 4) neighbor ids, (n, 4) direction of each of them in
+        DIRECTIONS, and the number of neighbors of each cell.
+    """
+    rows, cols = valid.shape
+    ys, xs = np.divmod(np.arange(rows * cols), cols)
+    ids = np.empty((rows * cols, 4), dtype=np.int64)
+    ok = np.empty((rows * cols, 4), dtype=bool)
+    flat = valid.ravel()
+    for k, (dx, dy) in enumerate(OFFSETS):
+        nx, ny = xs + dx, ys + dy
+        inside = (nx >= 0) & (nx < cols) & (ny >= 0) & (ny < rows)
+        ids[:, k] = np.where(inside, ny * cols + nx, 0)
+        ok[:, k] = inside & flat[ids[:, k]] & flat
+    # stable sort moves the valid slots first, keeping their order
+    order = np.argsort(~ok, axis=1, kind="stable")
+    return (np.take_along_axis(ids, order, axis=1), order,
+            ok.sum(axis=1))
+
+
+def pop_cycles(neighbors: np.ndarray, degrees: np.ndarray, root: int,
+               generator: np.random.Generator) -> Tuple[np.ndarray, int]:
+    """
+    Draw arrows and pop their cycles until they form a tree.
+
+    The arrows not drawn last round form trees hanging from the drawn
+    cells or from the root, so every new cycle goes through drawn
+    cells. Each round follows the arrow of each drawn cell to the next
+    drawn cell or to a cell leading to the root, and pointer jumping
+    over the drawn cells alone finds the cycles; the cells walked
+    between two drawn cells of a cycle are on it too. The walks keep
+    shortcuts to their end, valid until that end is drawn again: no
+    cell on the way can be drawn without it, being on the same cycle.
+
+    Args:
+        neighbors (np.ndarray): Neighbor ids, see neighbor_table.
+        degrees (np.ndarray): Neighbors of each cell, 0 outside the
+            maze.
+        root (int): Cell the tree hangs from.
+        generator (np.random.Generator): Random stream of the arrows.
+
+    Returns:
+        tuple: The chosen neighbor slot of every cell, and the number
+        of popping rounds.
+    """
+    n = len(degrees)
+    slots = (generator.random(n) * degrees).astype(np.int64)
+    arrows = neighbors[np.arange(n), slots]
+    arrows[root] = root
+    drawn = np.flatnonzero((degrees > 0) & (np.arange(n) != root))
+    # DRAWN last round, SETTLED leading to the root, 0 in the trees;
+    # the walks run on lists and bytes, faster than arrays one cell at
+    # a time, state is an array view of the same flags
+    flags = bytearray([SETTLED]) * n
+    state = np.frombuffer(flags, dtype=np.uint8)
+    state[drawn] = DRAWN
+    successor: List[int] = arrows.tolist()
+    shortcut = [-1] * n
+    shortcut_round = [0] * n
+    drawn_round = [0] * n
+    local = np.full(n, -1, dtype=np.int64)
+    rounds = 0
+    while len(drawn):
+        m = len(drawn)
+        ends = arrows[drawn]
+        for i in np.flatnonzero(state[ends] == 0).tolist():
+            cell = int(ends[i])
+            path: List[int] = []
+            while not flags[cell]:
+                path.append(cell)
+                hop = shortcut[cell]
+                if hop >= 0 and drawn_round[hop] == shortcut_round[cell]:
+                    cell = hop
+                else:
+                    cell = successor[cell]
+            for step in path:
+                shortcut[step] = cell
+                shortcut_round[step] = drawn_round[cell]
+            ends[i] = cell
+        # drawn cells renumbered, m for those leading to the root
+        local[drawn] = np.arange(m)
+        jump = np.append(np.where(state[ends] == SETTLED, m, local[ends]),
+                         m)
+        local[drawn] = -1
+        for _ in range(m.bit_length()):
+            jump = jump[jump]
+        on_cycle = np.zeros(m + 1, dtype=bool)
+        on_cycle[jump[:m]] = True
+        state[drawn] = 0
+        for cell in drawn[jump[:m] == m].tolist():
+            while flags[cell] != SETTLED:
+                flags[cell] = SETTLED
+                cell = successor[cell]
+        looped = drawn[on_cycle[:m]]
+        state[looped] = DRAWN
+        between: List[int] = []
+        for cell in arrows[looped].tolist():
+            while not flags[cell]:
+                flags[cell] = DRAWN
+                between.append(cell)
+                cell = successor[cell]
+        cycles = np.sort(np.concatenate(
+            (looped, np.array(between, dtype=np.int64))))
+        if not len(cycles):
+            break
+        rounds += 1
+        redrawn = (generator.random(len(cycles))
+                   * degrees[cycles]).astype(np.int64)
+        slots[cycles] = redrawn
+        arrows[cycles] = neighbors[cycles, redrawn]
+        for cell, arrow in zip(cycles.tolist(), arrows[cycles].tolist()):
+            successor[cell] = arrow
+            drawn_round[cell] = rounds
+        drawn = cycles
+    return slots, rounds
+
+
+def cycle_popping(maze: "MazeGenerator") -> None:
+    """
+    Carve a uniform maze in bulk passes.
+
+    The tree hangs from the valid cell nearest to the center, which
+    keeps the walks to the root short; the maze does not depend on the
+    root. The arrows come from a PCG64 stream seeded with the maze seed,
+    see rng.pcg64_generator, whatever the RNG setting: the popping
+    rounds draw whole arrays of floats, not the words of the streams.
+
+    Args:
+        maze (MazeGenerator): A maze not carved yet.
+    """
+    valid = np.ones((maze.rows, maze.cols), dtype=bool)
+    for x, y in maze.get_42_cells(maze.cols, maze.rows):
+        valid[y, x] = False
+    neighbors, directions, degrees = neighbor_table(valid)
+    ys, xs = np.divmod(np.arange(maze.rows * maze.cols), maze.cols)
+    # open cells: their neighbors have four neighbors too, unlike the
+    # corridors of the 42 pattern which walks hardly ever enter
+    full = degrees == 4
+    open_cells = full & full[neighbors].all(axis=1)
+    if not open_cells.any():
+        open_cells = degrees > 0
+    distance = np.where(open_cells, (2 * xs - maze.cols) ** 2
+                        + (2 * ys - maze.rows) ** 2, np.iinfo(np.int64).max)
+    root = int(np.argmin(distance))
+
+    generator = pcg64_generator(maze.seed)
+    slots, rounds = pop_cycles(neighbors, degrees, root, generator)
+
+    cells = np.flatnonzero(degrees > 0)
+    cells = cells[cells != root]
+    carved = directions[cells, slots[cells]]
+    for cell_id, direction in zip(cells.tolist(), carved.tolist()):
+        y, x = divmod(cell_id, maze.cols)
+        maze.grid[y][x].set_walls(DIRECTIONS[direction])
+    for row in maze.grid:
+        for cell in row:
+            cell.visited = not cell._is_42
+    maze.unvisited.clear()
+    if maze.metrics is not None:
+        maze.metrics.count("popping_rounds", rounds)
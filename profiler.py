@@ -0,0 +1,155 @@
+#!/usr/bin/env python3
+# File: profiler.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/12 15:40:18
+# Updated: 2026/02/12 15:40:18
+
+import contextlib
+import os
+import time
+from typing import Any, ContextManager, Dict, Iterator, List
+
+
+class Profiler:
+    """
+    Time the phases of a run and report them as JSON.
+
+    Phases are wrapped in `with profiler.phase(name):` blocks. When
+    profiling is off, phase() returns a shared null context and costs
+    one attribute check; the capture modules are only imported when
+    used. Top level phases can also be captured with cProfile (one
+    .prof file per phase) and tracemalloc (peak memory and top
+    allocations per phase); nested phases are only timed.
+    """
+
+    MODES: List[str] = ["OFF", "ON", "CPROFILE", "TRACEMALLOC", "ALL"]
+    DIRECTORY: str = "profile"
+    TOP_ALLOCATIONS: int = 10
+    NULL: ContextManager[None] = contextlib.nullcontext()
+
+    def __init__(self, mode: str = "OFF") -> None:
+        """
+        Create a profiler.
+
+        Args:
+            mode (str): OFF, ON (timers only), CPROFILE, TRACEMALLOC or
+                ALL, see configure().
+        """
+        self.enabled: bool = False
+        self.cprofile: bool = False
+        self.tracemalloc: bool = False
+        self.depth: int = 0
+        self.phases: Dict[str, Dict[str, float]] = {}
+        # cProfile.Profile of each phase
+        self.profiles: Dict[str, Any] = {}
+        self.allocations: Dict[str, List[str]] = {}
+        self.configure(mode)
+
+    def configure(self, mode: str) -> None:
+        """
+        Switch profiling on or off.
+
+        Args:
+            mode (str): OFF, ON for the timers only, CPROFILE or
+                TRACEMALLOC to add one capture, ALL for both.
+        """
+        mode = mode.upper()
+        if mode not in self.MODES:
+            raise ValueError(f"Invalid profile mode: pick one of "
+                             f"{', '.join(self.MODES)}")
+        self.enabled = mode != "OFF"
+        self.cprofile = mode in ("CPROFILE", "ALL")
+        self.tracemalloc = mode in ("TRACEMALLOC", "ALL")
+        if self.tracemalloc:
+            import tracemalloc
+            if not tracemalloc.is_tracing():
+                tracemalloc.start()
+
+    def phase(self, name: str) -> ContextManager[None]:
+        """
+        Return the context measuring a phase.
+
+        Args:
+            name (str): Name of the phase, calls are aggregated by name.
+        """
+        if not self.enabled:
+            return self.NULL
+        return self.measure(name)
+
+    @contextlib.contextmanager
+    def measure(self, name: str) -> Iterator[None]:
+        """Time a phase and run the captures of top level phases."""
+        top = self.depth == 0
+        self.depth += 1
+        profile = None
+        if top and self.cprofile:
+            import cProfile
+            profile = self.profiles.setdefault(name, cProfile.Profile())
+            profile.enable()
+        if top and self.tracemalloc:
+            import tracemalloc
+            tracemalloc.reset_peak()
+            base = tracemalloc.get_traced_memory()[0]
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1000
+            self.depth -= 1
+            if profile is not None:
+                profile.disable()
+            stats = self.phases.setdefault(
+                    name, {"calls": 0, "total_ms": 0.0, "max_ms": 0.0})
+            stats["calls"] += 1
+            stats["total_ms"] += elapsed
+            stats["max_ms"] = max(stats["max_ms"], elapsed)
+            if top and self.tracemalloc:
+                peak = (tracemalloc.get_traced_memory()[1] - base) / 1024
+                if peak >= stats.get("peak_kb", 0):
+                    stats["peak_kb"] = peak
+                    top_stats = tracemalloc.take_snapshot().statistics(
+                            "lineno")[:self.TOP_ALLOCATIONS]
+                    self.allocations[name] = [str(s) for s in top_stats]
+
+    def report(self) -> Dict[str, Any]:
+        """Phases in the order they first ran, with their statistics."""
+        return {
+                "phases": {
+                    name: {k: round(v, 3) for k, v in stats.items()}
+                    for name, stats in self.phases.items()
+                    },
+                "total_ms": round(sum(s["total_ms"] for s in
+                                      self.phases.values()), 3),
+                }
+
+    def write(self, directory: str | None = None) -> str:
+        """
+        Write the JSON report and the captures of every phase.
+
+        Args:
+            directory (str | None): Destination, DIRECTORY by default.
+
+        Returns:
+            str: Path of the JSON report.
+        """
+        import json
+
+        directory = directory or self.DIRECTORY
+        os.makedirs(directory, exist_ok=True)
+        report = self.report()
+        files: List[str] = []
+        for name, profile in self.profiles.items():
+            path = os.path.join(directory, f"{name}.prof")
+            profile.dump_stats(path)
+            files.append(path)
+        for name, lines in self.allocations.items():
+            path = os.path.join(directory, f"{name}.tracemalloc.txt")
+            with open(path, "w") as f:
+                f.write("\n".join(lines) + "\n")
+            files.append(path)
+        report["files"] = files
+        path = os.path.join(directory, "profile.json")
+        with open(path, "w") as f:
+            json.dump(report, f, indent=1)
+        return path
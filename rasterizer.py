@@ -0,0 +1,482 @@
+#!/usr/bin/env python3
+# File: rasterizer.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/06 09:31:55
+# Updated: 2026/02/06 09:31:55
+
+"""
+Headless rasterizer exporting mazes as PPM or PNG images.
+
+The image is built from the wall grid with NumPy broadcasting and the
+drawing rules of MazeRenderer, without MLX or a display.
+
+Usage: python3 rasterizer.py maze_file image.(png|ppm) [options]
+"""
+
+import argparse
+import os
+import struct
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing.shared_memory import SharedMemory
+from typing import Any, BinaryIO, Iterator, List, Optional, Tuple
+
+import numpy as np
+
+from maze_generator import MazeGenerator
+from tile_set import TileSet
+
+# color indexes of the lookup table
+BG, WALL, PATH, ENTRY, EXIT = range(5)
+
+
+def rasterize_band(task: Tuple[Any, ...]) -> None:
+    """
+    Rasterize maze rows of a shared wall grid into a shared framebuffer.
+
+    Runs in a worker process: the grid and the framebuffer are mapped
+    from shared memory or from the memory-mapped image, nothing is
+    copied between processes.
+
+    Args:
+        task (tuple): Drawing settings, name of the grid block, target
+            framebuffer and maze rows of the band.
+    """
+    settings, grid_name, target, row_start, row_end = task
+    rows, cols, entry, exit, cell_size, thick, palette, show_path = settings
+    grid = SharedMemory(name=grid_name)
+    walls = np.ndarray((rows, cols), dtype=np.uint8, buffer=grid.buf)
+    path_mask = np.ndarray((rows, cols), dtype=bool, buffer=grid.buf,
+                           offset=rows * cols)
+    rasterizer = Rasterizer(walls, entry, exit, path_mask, cell_size,
+                            thick, palette, show_path)
+    shape = (rasterizer.height, rasterizer.width, 3)
+
+    kind, name, offset = target
+    framebuffer: Optional[SharedMemory] = None
+    if kind == "shm":
+        framebuffer = SharedMemory(name=name)
+        image = np.ndarray(shape, dtype=np.uint8, buffer=framebuffer.buf)
+    else:
+        image = np.memmap(name, dtype=np.uint8, mode="r+", offset=offset,
+                          shape=shape)
+    rasterizer.rasterize_rows(row_start, row_end,
+                              image[row_start * cell_size:row_end * cell_size])
+
+    # views must be released before the blocks can be closed
+    del rasterizer, walls, path_mask, image
+    grid.close()
+    if framebuffer is not None:
+        framebuffer.close()
+
+
+class Rasterizer:
+    """
+    Build RGB images of a maze with NumPy.
+
+    The image is produced in horizontal bands of maze rows, so that it
+    can be written into a memory-mapped file instead of RAM.
+    """
+
+    def __init__(self, walls: np.ndarray, entry: Tuple[int, int],
+                 exit: Tuple[int, int], path_mask: Optional[np.ndarray] = None,
+                 cell_size: int = 30, wall_thickness: Optional[int] = None,
+                 palette: int = 0, show_path: bool = False) -> None:
+        """
+        Prepare the drawing of a wall grid.
+
+        Args:
+            walls (np.ndarray): Wall nibble of every cell, (rows, cols).
+            entry (tuple): Entry coordinates (x, y).
+            exit (tuple): Exit coordinates (x, y).
+            path_mask (np.ndarray | None): True on the solution cells.
+            cell_size (int): Size of a cell in pixels.
+            wall_thickness (int | None): Thickness of the walls in pixels,
+                cell_size // 10 (at least 1) by default.
+            palette (int): Index of the palette in TileSet.PALETTES.
+            show_path (bool): Whether to draw the solution path.
+        """
+        self.rows: int = walls.shape[0]
+        self.cols: int = walls.shape[1]
+        self.walls: np.ndarray = walls
+        self.path_mask: np.ndarray = (
+                np.zeros(walls.shape, dtype=bool) if path_mask is None
+                else path_mask
+                )
+        self.entry: Tuple[int, int] = entry
+        self.exit: Tuple[int, int] = exit
+        self.cell_size: int = cell_size
+        self.wall_thickness: int = (
+                max(1, cell_size // 10) if wall_thickness is None
+                else wall_thickness
+                )
+        self.palette: int = palette % len(TileSet.PALETTES)
+        self.show_path: bool = show_path
+        self.width: int = self.cols * cell_size
+        self.height: int = self.rows * cell_size
+
+        colors = TileSet.PALETTES[self.palette]
+        self.lut: np.ndarray = np.array(
+                [self.rgb(c) for c in (TileSet.BACKGROUND, colors["wall"],
+                                       colors["path"], TileSet.ENTRY_COLOR,
+                                       TileSet.EXIT_COLOR)],
+                dtype=np.uint8
+                )
+
+    @classmethod
+    def from_content(cls, content: List[str], entry: Tuple[int, int],
+                     exit: Tuple[int, int], path: str = "",
+                     **kwargs: Any) -> "Rasterizer":
+        """
+        Create a rasterizer from the hex rows of a maze.
+
+        Args:
+            content (List[str]): Hex rows of the maze.
+            entry (tuple): Entry coordinates (x, y).
+            exit (tuple): Exit coordinates (x, y).
+            path (str): Solution path as N/S/E/W directions.
+            **kwargs: Drawing options passed to the constructor.
+        """
+        # wall grid: one nibble per cell
+        walls = np.array(
+                [[int(c, 16) for c in line] for line in content],
+                dtype=np.uint8
+                ).reshape(len(content), len(content[0]) if content else 0)
+
+        # solution cells, without the exit like MazeRenderer does
+        path_mask = np.zeros(walls.shape, dtype=bool)
+        x, y = entry
+        for direction in path[:-1]:
+            ox, oy = MazeGenerator.offset[direction]
+            x, y = x + ox, y + oy
+            path_mask[y, x] = True
+        return cls(walls, entry, exit, path_mask, **kwargs)
+
+    @staticmethod
+    def rgb(color: int) -> Tuple[int, int, int]:
+        """Split a 0xRRGGBB color into its components."""
+        return ((color >> 16) & 0xFF, (color >> 8) & 0xFF, color & 0xFF)
+
+    @classmethod
+    def from_maze(cls, maze: MazeGenerator,
+                  **kwargs: Any) -> "Rasterizer":
+        """
+        Create a rasterizer from a generated maze.
+
+        Args:
+            maze (MazeGenerator): The generated maze.
+            **kwargs: Drawing options passed to the constructor.
+        """
+        content = [line for line in maze.hex_repr.split("\n") if line]
+        return cls.from_content(content, maze.entry, maze.exit, maze.path,
+                                **kwargs)
+
+    @classmethod
+    def from_file(cls, file: str, **kwargs: Any) -> "Rasterizer":
+        """
+        Create a rasterizer from a maze output file.
+
+        Args:
+            file (str): File written by MazeGenerator.export_to_txt.
+            **kwargs: Drawing options passed to the constructor.
+        """
+        with open(file, "r") as f:
+            blocks = f.read().split("\n\n", 1)
+        content = [line.strip() for line in blocks[0].split("\n")
+                   if line.strip()]
+        extra = blocks[1].split("\n") if len(blocks) > 1 else []
+        entry = tuple(int(v) for v in extra[0].split(","))
+        exit = tuple(int(v) for v in extra[1].split(","))
+        path = extra[2].strip() if len(extra) > 2 else ""
+        return cls.from_content(content, entry, exit,  # type: ignore
+                                path, **kwargs)
+
+    def color_indexes(self, row_start: int, row_end: int) -> np.ndarray:
+        """
+        Compute the lookup-table index of every pixel of maze rows.
+
+        Args:
+            row_start (int): First maze row of the band.
+            row_end (int): Maze row after the last one of the band.
+
+        Returns:
+            np.ndarray: Indexes of shape (band rows, cell, cols, cell).
+        """
+        size = self.cell_size
+        thick = self.wall_thickness
+        nib = self.walls[row_start:row_end]
+        full = nib == 0xF
+        local = np.arange(size)
+
+        # cell fill: 42 blocks are walls, path cells when displayed
+        fill = np.where(full, WALL, BG).astype(np.uint8)
+        if self.show_path:
+            path = self.path_mask[row_start:row_end] & ~full
+            fill[path] = PATH
+        idx = np.broadcast_to(
+                fill[:, None, :, None], (len(nib), size, self.cols, size)
+                ).copy()
+
+        # walls are painted over the fill, following the nibble bits
+        def bit(mask: int) -> np.ndarray:
+            return np.asarray(((nib & mask) != 0) & ~full)
+
+        top = (local < thick)[None, :, None, None]
+        bottom = (local >= size - thick)[None, :, None, None]
+        left = (local < thick)[None, None, None, :]
+        right = (local >= size - thick)[None, None, None, :]
+        wall = ((bit(1)[:, None, :, None] & top)
+                | (bit(4)[:, None, :, None] & bottom)
+                | (bit(8)[:, None, :, None] & left)
+                | (bit(2)[:, None, :, None] & right))
+        idx[wall] = WALL
+
+        # entry and exit squares, drawn last
+        fraction = size // 3
+        square = slice(fraction, 2 * fraction)
+        for (x, y), marker in ((self.entry, ENTRY), (self.exit, EXIT)):
+            if row_start <= y < row_end:
+                idx[y - row_start, square, x, square] = marker
+        return idx
+
+    def rasterize_rows(self, row_start: int, row_end: int,
+                       out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Rasterize a band of maze rows into RGB pixels.
+
+        Args:
+            row_start (int): First maze row of the band.
+            row_end (int): Maze row after the last one of the band.
+            out (np.ndarray | None): Array of shape (pixel rows, width, 3)
+                receiving the band, allocated when not given.
+
+        Returns:
+            np.ndarray: The RGB pixels of the band.
+        """
+        idx = self.color_indexes(row_start, row_end)
+        shape = ((row_end - row_start) * self.cell_size, self.width)
+        if out is None:
+            return np.asarray(self.lut[idx.reshape(shape)])
+        np.take(self.lut, idx.reshape(shape), axis=0, out=out)
+        return out
+
+    def band_size(self, max_pixels: int = 1 << 24) -> int:
+        """Number of maze rows rasterized at once to bound the memory."""
+        row_pixels = max(1, self.width * self.cell_size)
+        return max(1, min(self.rows, max_pixels // row_pixels))
+
+    def rasterize(self, out: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Rasterize the whole maze.
+
+        Args:
+            out (np.ndarray | None): Array of shape (height, width, 3),
+                a memory-mapped file for instance.
+
+        Returns:
+            np.ndarray: The RGB image.
+        """
+        if out is None:
+            out = np.empty((self.height, self.width, 3), dtype=np.uint8)
+        step = self.band_size()
+        size = self.cell_size
+        for row in range(0, self.rows, step):
+            end = min(self.rows, row + step)
+            self.rasterize_rows(row, end, out[row * size:end * size])
+        return out
+
+    def bands(self, workers: int) -> List[Tuple[int, int]]:
+        """Split the maze rows into a few bands per worker."""
+        count = min(self.rows, 4 * workers) or 1
+        bounds = [self.rows * k // count for k in range(count + 1)]
+        return [(a, b) for a, b in zip(bounds, bounds[1:]) if a < b]
+
+    def rasterize_parallel(self, target: Tuple[str, str, int],
+                           workers: int) -> None:
+        """
+        Rasterize the maze with one process per band of rows.
+
+        The wall grid is copied once into shared memory, then every
+        worker draws its bands straight into the target framebuffer.
+
+        Args:
+            target (tuple): ("shm", block name, 0) for a shared memory
+                framebuffer or ("file", path, offset) for a memory-mapped
+                image file.
+            workers (int): Number of worker processes.
+        """
+        size = self.rows * self.cols
+        grid = SharedMemory(create=True, size=max(1, 2 * size))
+        try:
+            walls = np.ndarray(self.walls.shape, dtype=np.uint8,
+                               buffer=grid.buf)
+            path_mask = np.ndarray(self.walls.shape, dtype=bool,
+                                   buffer=grid.buf, offset=size)
+            walls[:] = self.walls
+            path_mask[:] = self.path_mask
+            del walls, path_mask
+            settings = (self.rows, self.cols, self.entry, self.exit,
+                        self.cell_size, self.wall_thickness, self.palette,
+                        self.show_path)
+            tasks = [(settings, grid.name, target, a, b)
+                     for a, b in self.bands(workers)]
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                list(executor.map(rasterize_band, tasks))
+        finally:
+            grid.close()
+            grid.unlink()
+
+    @contextmanager
+    def shared_image(self, workers: Optional[int] = None
+                     ) -> Iterator[np.ndarray]:
+        """
+        Rasterize the maze in parallel into a shared memory framebuffer.
+
+        The image is only valid inside the with block, the framebuffer
+        is released when it ends.
+
+        Args:
+            workers (int | None): Number of worker processes, one per
+                CPU by default.
+
+        Yields:
+            np.ndarray: The RGB image backed by shared memory.
+        """
+        workers = workers or os.cpu_count() or 1
+        framebuffer = SharedMemory(create=True,
+                                   size=max(1, self.height * self.width * 3))
+        try:
+            self.rasterize_parallel(("shm", framebuffer.name, 0), workers)
+            image = np.ndarray((self.height, self.width, 3), dtype=np.uint8,
+                               buffer=framebuffer.buf)
+            yield image
+            del image
+        finally:
+            framebuffer.close()
+            framebuffer.unlink()
+
+    def ppm_header(self) -> bytes:
+        """Header of a binary PPM file of the image size."""
+        return f"P6\n{self.width} {self.height}\n255\n".encode()
+
+    def write_ppm(self, file: str, memmap: bool = False,
+                  workers: int = 1) -> None:
+        """
+        Write the image as a binary PPM file.
+
+        Args:
+            file (str): Path of the image file.
+            memmap (bool): Rasterize straight into the memory-mapped
+                file instead of building the image in RAM.
+            workers (int): Number of processes rasterizing bands.
+        """
+        header = self.ppm_header()
+        if memmap:
+            with open(file, "wb") as f:
+                f.write(header)
+                f.truncate(len(header) + self.height * self.width * 3)
+            if workers > 1:
+                self.rasterize_parallel(("file", file, len(header)), workers)
+                return
+            mapped = np.memmap(file, dtype=np.uint8, mode="r+",
+                               offset=len(header),
+                               shape=(self.height, self.width, 3))
+            self.rasterize(mapped)
+            mapped.flush()
+            del mapped
+            return
+        if workers > 1:
+            with self.shared_image(workers) as image, open(file, "wb") as f:
+                f.write(header)
+                f.write(image.data)
+            return
+        with open(file, "wb") as f:
+            f.write(header)
+            step = self.band_size()
+            for row in range(0, self.rows, step):
+                band = self.rasterize_rows(row, min(self.rows, row + step))
+                f.write(band.tobytes())
+
+    @staticmethod
+    def png_chunk(f: BinaryIO, kind: bytes, data: bytes) -> None:
+        """Write one PNG chunk with its length and checksum."""
+        f.write(struct.pack(">I", len(data)))
+        f.write(kind + data)
+        f.write(struct.pack(">I", zlib.crc32(kind + data) & 0xFFFFFFFF))
+
+    def write_png(self, file: str, level: int = 6,
+                  image: Optional[np.ndarray] = None,
+                  workers: int = 1) -> None:
+        """
+        Write the image as a PNG file, compressing band by band.
+
+        Args:
+            file (str): Path of the image file.
+            level (int): zlib compression level.
+            image (np.ndarray | None): Already rasterized image, the
+                bands are rasterized on the fly when not given.
+            workers (int): Number of processes rasterizing bands into a
+                shared framebuffer before compressing it.
+        """
+        if image is None and workers > 1:
+            with self.shared_image(workers) as shared:
+                self.write_png(file, level, shared)
+            return
+        compressor = zlib.compressobj(level)
+        size = self.cell_size
+        step = self.band_size()
+        with open(file, "wb") as f:
+            f.write(b"\x89PNG\r\n\x1a\n")
+            self.png_chunk(f, b"IHDR", struct.pack(
+                ">IIBBBBB", self.width, self.height, 8, 2, 0, 0, 0))
+            for row in range(0, self.rows, step):
+                end = min(self.rows, row + step)
+                if image is None:
+                    band = self.rasterize_rows(row, end)
+                else:
+                    band = image[row * size:end * size]
+                # every scanline starts with filter type 0 (None)
+                lines = np.zeros((len(band), self.width * 3 + 1),
+                                 dtype=np.uint8)
+                lines[:, 1:] = band.reshape(len(band), -1)
+                data = compressor.compress(lines.tobytes())
+                if data:
+                    self.png_chunk(f, b"IDAT", data)
+            self.png_chunk(f, b"IDAT", compressor.flush())
+            self.png_chunk(f, b"IEND", b"")
+
+
+def main() -> None:
+    """Export a maze output file as an image."""
+    parser = argparse.ArgumentParser(description="Export a maze as an image")
+    parser.add_argument("maze_file", help="file written by a_maze_ing.py")
+    parser.add_argument("image", help="output image, .png or .ppm")
+    parser.add_argument("--cell-size", type=int, default=30)
+    parser.add_argument("--wall-thickness", type=int, default=None)
+    parser.add_argument("--palette", type=int, default=0)
+    parser.add_argument("--path", action="store_true",
+                        help="draw the solution path")
+    parser.add_argument("--memmap", action="store_true",
+                        help="rasterize PPM images into a memory-mapped file")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="processes rasterizing bands of rows")
+    args = parser.parse_args()
+
+    rasterizer = Rasterizer.from_file(
+            args.maze_file, cell_size=args.cell_size,
+            wall_thickness=args.wall_thickness, palette=args.palette,
+            show_path=args.path
+            )
+    if args.image.lower().endswith(".ppm"):
+        rasterizer.write_ppm(args.image, memmap=args.memmap,
+                             workers=args.workers)
+    else:
+        rasterizer.write_png(args.image, workers=args.workers)
+    print(f"{rasterizer.width}x{rasterizer.height} image written "
+          f"to {args.image}")
+
+
+if __name__ == "__main__":
+    main()
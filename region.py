@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# File: region.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/22 10:41:05
+# Updated: 2026/02/22 10:41:05
+
+"""
+Re-carve a rectangle of a generated maze in place.
+
+The passages inside the region split its cells in pieces: cells joined
+without leaving the region. Two pieces may be joined through the rest
+of the maze, which cannot be known without walking all of it, so each
+piece is re-carved on its own as a new spanning tree of the same
+cells. Every pair of cells stays joined and the number of passages is
+unchanged, so a perfect maze stays perfect, and the work only depends
+on the area of the region.
+
+The solution path only changes where it runs inside the region: each
+of those runs stays in one piece and is replaced by the new path
+between its ends. The output file is patched in place, the region
+columns of its hex rows and the lines after them.
+"""
+
+from collections import deque
+from typing import TYPE_CHECKING, Dict, List, Set, Tuple
+
+from cell import Cell
+
+if TYPE_CHECKING:
+    from maze_generator import MazeGenerator
+
+
+def region_cells(maze: "MazeGenerator", x: int, y: int, width: int,
+                 height: int) -> List[Cell]:
+    """
+    Valid cells of a rectangle.
+
+    Raises:
+        ValueError: If the rectangle is empty or leaves the maze.
+    """
+    if width < 1 or height < 1 or x < 0 or y < 0 \
+            or x + width > maze.cols or y + height > maze.rows:
+        raise ValueError(f"region {x},{y} {width}x{height} is outside the "
+                         f"{maze.cols}x{maze.rows} maze")
+    return [maze.grid[cy][cx] for cy in range(y, y + height)
+            for cx in range(x, x + width) if not maze.grid[cy][cx]._is_42]
+
+
+def inner_neighbors(cell: Cell, cells: Set[Cell]) -> List[Tuple[str, Cell]]:
+    """Directions and neighbors of a cell inside the region."""
+    found: List[Tuple[str, Cell]] = []
+    for direction in cell.OFFSET:
+        neighbor = cell.get_neighbor(direction)
+        if neighbor is not None and neighbor in cells:
+            found.append((direction, neighbor))
+    return found
+
+
+def pieces(cells: List[Cell]) -> List[List[Cell]]:
+    """Split the region in the groups of cells its passages join."""
+    inside = set(cells)
+    seen: Set[Cell] = set()
+    groups: List[List[Cell]] = []
+    for start in cells:
+        if start in seen:
+            continue
+        seen.add(start)
+        group = [start]
+        stack = [start]
+        while stack:
+            cell = stack.pop()
+            for direction, neighbor in inner_neighbors(cell, inside):
+                if neighbor not in seen and not cell.walls[direction]:
+                    seen.add(neighbor)
+                    group.append(neighbor)
+                    stack.append(neighbor)
+        groups.append(group)
+    return groups
+
+
+def carve_piece(maze: "MazeGenerator", piece: List[Cell]) -> None:
+    """
+    Carve a spanning tree of a piece, its inner walls all standing.
+
+    DFS keeps its long corridors, every other algorithm uses Wilson's
+    loop-erased walks, uniform like WILSON and POPPING.
+    """
+    inside = set(piece)
+    rng = maze.rng
+    if maze.algorithm == "DFS":
+        current = rng.choice(piece)
+        done = {current}
+        stack = [current]
+        while stack:
+            current = stack[-1]
+            options = [(d, n) for d, n in inner_neighbors(current, inside)
+                       if n not in done]
+            if not options:
+                stack.pop()
+                continue
+            direction, neighbor = rng.choice(options)
+            current.set_walls(direction)
+            done.add(neighbor)
+            stack.append(neighbor)
+        return
+
+    done = {rng.choice(piece)}
+    order = list(piece)
+    rng.shuffle(order)
+    for start in order:
+        # the last exit of every cell erases the loops of the walk
+        exits: Dict[Cell, Tuple[str, Cell]] = {}
+        cell = start
+        while cell not in done:
+            exits[cell] = rng.choice(inner_neighbors(cell, inside))
+            cell = exits[cell][1]
+        cell = start
+        while cell not in done:
+            done.add(cell)
+            direction, cell = exits[cell]
+            cell.set_walls(Cell.OPPOSITE[direction])
+
+
+def route_in_piece(start: Cell, end: Cell, inside: Set[Cell]) -> str:
+    """Directions from start to end without leaving the region."""
+    # direction of the step into every cell reached
+    came: Dict[Cell, str] = {start: ""}
+    queue = deque([start])
+    while queue and end not in came:
+        cell = queue.popleft()
+        for direction, neighbor in inner_neighbors(cell, inside):
+            if not cell.walls[direction] and neighbor not in came:
+                came[neighbor] = direction
+                queue.append(neighbor)
+    steps: List[str] = []
+    cell = end
+    while cell is not start:
+        direction = came[cell]
+        steps.append(direction)
+        previous = cell.get_neighbor(Cell.OPPOSITE[direction])
+        assert previous is not None
+        cell = previous
+    return "".join(reversed(steps))
+
+
+def splice_path(maze: "MazeGenerator", inside: Set[Cell]) -> None:
+    """Replace the runs of the solution path inside the region."""
+    assert maze.entry_cell is not None
+    route: List[Cell] = [maze.entry_cell]
+    for direction in maze.path:
+        neighbor = route[-1].get_neighbor(direction)
+        assert neighbor is not None
+        route.append(neighbor)
+    path: List[str] = []
+    i = 0
+    while i < len(route) - 1:
+        j = i
+        while j < len(route) - 1 and route[j] in inside \
+                and route[j + 1] in inside:
+            j += 1
+        if j > i:
+            path.append(route_in_piece(route[i], route[j], inside))
+            i = j
+        else:
+            path.append(maze.path[i])
+            i += 1
+    maze.path = "".join(path)
+
+
+def patch_output(maze: "MazeGenerator", x: int, y: int, width: int,
+                 height: int) -> None:
+    """
+    Rewrite the region of the output file and the lines after the maze.
+
+    The file is written whole when missing or of another size.
+    """
+    row = maze.cols + 1
+    try:
+        with open(maze.output_file, "r+b") as f:
+            f.seek(0, 2)
+            if f.tell() < maze.rows * row + 1:
+                raise FileNotFoundError(maze.output_file)
+            for cy in range(y, y + height):
+                f.seek(cy * row + x)
+                f.write("".join(maze.grid[cy][cx].hex_repr
+                                for cx in range(x, x + width)).encode())
+            f.seek(maze.rows * row + 1)
+            ex, ey = maze.entry
+            xx, xy = maze.exit
+            f.write(f"{ex},{ey}\n{xx},{xy}\n{maze.path}\n".encode())
+            f.truncate()
+    except FileNotFoundError:
+        maze.export_to_txt()
+    except OSError as e:
+        maze.log(f"Error writing file: {e}")
+
+
+def regenerate_region(maze: "MazeGenerator", x: int, y: int, width: int,
+                      height: int) -> int:
+    """
+    Tear down the passages of a region and carve them again.
+
+    Imperfect mazes, whose shortest path may move anywhere once a loop
+    changes, or walls set by set_wall, go through walls_changed. A
+    perfect maze splices its path, and a solver tracking it only solves
+    again when next used.
+
+    Args:
+        maze (MazeGenerator): A generated and solved maze.
+        x (int): Column of the top left cell of the region.
+        y (int): Row of the top left cell of the region.
+        width (int): Width of the region.
+        height (int): Height of the region.
+
+    Returns:
+        int: The number of pieces carved.
+    """
+    cells = region_cells(maze, x, y, width, height)
+    inside = set(cells)
+    groups = pieces(cells)
+    for cell in cells:
+        for direction, _ in inner_neighbors(cell, inside):
+            cell.walls[direction] = 1
+    for group in groups:
+        carve_piece(maze, group)
+    if maze.perfect and not maze.edited:
+        splice_path(maze, inside)
+        if maze.solver is not None:
+            maze.solver.defer((cell.coord[1] * maze.cols + cell.coord[0],
+                               maze.wall_bits(cell)) for cell in cells)
+    else:
+        maze.walls_changed(cells)
+    if maze.metrics is not None:
+        maze.metrics.count("region_cells", len(cells))
+        maze.metrics.count("region_pieces", len(groups))
+    return len(groups)
@@ -0,0 +1,166 @@
+#!/usr/bin/env python3
+# File: rng.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/18 09:41:36
+# Updated: 2026/02/18 09:41:36
+
+import itertools
+import os
+import random
+import struct
+from typing import (Any, Dict, Iterator, List, MutableSequence, Sequence,
+                    TypeVar)
+
+T = TypeVar("T")
+
+
+def numpy_seed(seed: int | None) -> int | None:
+    """
+    Seed accepted by the NumPy bit generators.
+
+    They reject negative seeds, which SEED allows: those wrap to 64
+    bits, -1 gives the maze of 2**64 - 1. Other seeds are unchanged.
+    """
+    if seed is not None and seed < 0:
+        return seed & (2**64 - 1)
+    return seed
+
+
+def pcg64_generator(seed: int | None) -> Any:
+    """
+    NumPy Generator on a PCG64 stream, random when seed is None.
+
+    Used by RNG=PCG64 and by ALGORITHM=POPPING, which draws its arrows
+    in bulk from NumPy whatever the RNG setting.
+    """
+    import numpy
+
+    return numpy.random.Generator(numpy.random.PCG64(numpy_seed(seed)))
+
+
+class BufferedRng:
+    """
+    Random stream drawing 32-bit words in bulk.
+
+    The generators draw one index per step; random.choice pays a few
+    Python calls for each of them, here an index is a word taken from
+    blocks chained in C, multiplied and shifted. Only getrandbits of a
+    Mersenne Twister seeded with an int is used, whose output does not
+    change between Python versions, so a seed gives the same maze on
+    any interpreter.
+    """
+
+    NAME: str = "FAST"
+    BLOCK: int = 4096
+
+    def __init__(self, seed: int | None = None) -> None:
+        """
+        Create a stream.
+
+        Args:
+            seed (int | None): Seed of the stream, random when None.
+        """
+        self.source: random.Random = random.Random()
+        self.words: Iterator[int] = iter(())
+        self.seed(seed)
+
+    def seed(self, seed: int | None = None) -> None:
+        """Restart the stream from a seed, random when None."""
+        if seed is None:
+            seed = int.from_bytes(os.urandom(8), "little")
+        self.source.seed(seed)
+        self.restart()
+
+    def restart(self) -> None:
+        """Drop the words drawn ahead, blocks are drawn when needed."""
+        self.words = itertools.chain.from_iterable(iter(self.block, None))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        """
+        State sent to another process, without the words drawn ahead.
+
+        Mazes generated in a process pool are pickled with their stream,
+        the copy goes on from the next block.
+        """
+        state = self.__dict__.copy()
+        del state["words"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        """Rebuild a pickled stream."""
+        self.__dict__.update(state)
+        self.restart()
+
+    def block(self) -> Sequence[int]:
+        """Draw the next block of words."""
+        bits = self.source.getrandbits(32 * self.BLOCK)
+        return struct.unpack(f"<{self.BLOCK}I",
+                             bits.to_bytes(4 * self.BLOCK, "little"))
+
+    def below(self, n: int) -> int:
+        """
+        Draw an index.
+
+        Args:
+            n (int): Number of choices, at most 2**32.
+
+        Returns:
+            int: An index in range(n).
+        """
+        return (next(self.words) * n) >> 32
+
+    def choice(self, seq: Sequence[T]) -> T:
+        """Pick an item of a non empty sequence."""
+        return seq[(next(self.words) * len(seq)) >> 32]
+
+    def shuffle(self, seq: MutableSequence[T]) -> None:
+        """Shuffle a sequence in place (Fisher-Yates)."""
+        words = self.words
+        for i in range(len(seq) - 1, 0, -1):
+            j = (next(words) * (i + 1)) >> 32
+            seq[i], seq[j] = seq[j], seq[i]
+
+
+class NumpyRng(BufferedRng):
+    """
+    Buffered stream filled by a NumPy PCG64 generator.
+
+    NumPy keeps the output of its bit generators stable across
+    releases, so seeded mazes stay reproducible.
+    """
+
+    NAME: str = "PCG64"
+
+    def seed(self, seed: int | None = None) -> None:
+        """Restart the stream from a seed, random when None."""
+        self.generator = pcg64_generator(seed)
+        self.restart()
+
+    def block(self) -> Sequence[int]:
+        """Draw the next block of words."""
+        words: List[int] = self.generator.integers(
+                0, 1 << 32, size=self.BLOCK, dtype="uint32").tolist()
+        return words
+
+
+RNGS: List[str] = ["LEGACY", BufferedRng.NAME, NumpyRng.NAME]
+
+
+def make_rng(name: str = "LEGACY") -> random.Random | BufferedRng:
+    """
+    Create the random stream of a maze.
+
+    Args:
+        name (str): LEGACY for random.Random, which seeded mazes used so
+            far, FAST for the buffered stream or PCG64 for the NumPy one.
+
+    Returns:
+        random.Random | BufferedRng: An unseeded stream, seeded by
+        generate_maze.
+    """
+    if name == NumpyRng.NAME:
+        return NumpyRng()
+    if name == BufferedRng.NAME:
+        return BufferedRng()
+    return random.Random()
@@ -0,0 +1,277 @@
+#!/usr/bin/env python3
+# File: svg_exporter.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/10 14:22:07
+# Updated: 2026/02/10 14:22:07
+
+"""
+Streaming SVG export of mazes.
+
+Walls are read row by row from the hex grid and merged into long
+segments: runs of north walls along a row, runs of west walls down a
+column. The whole wall set is a single <path> and the solution a single
+<polyline>, written to disk as they are found, with O(width) memory.
+
+Usage: python3 svg_exporter.py maze_file image.svg [options]
+"""
+
+import argparse
+import re
+from typing import Iterable, Iterator, List, Optional, TextIO, Tuple
+
+from maze_generator import MazeGenerator
+from tile_set import TileSet
+
+
+class SvgExporter:
+    """
+    Write mazes as SVG images with merged wall segments.
+
+    Coordinates are in cells: the viewBox is the maze grid and the
+    image is scaled to cell_size pixels per cell, which keeps every
+    number of the output a small integer.
+    """
+
+    # Hex digits having the matching wall drawn (F is a full 42 block)
+    NORTH: str = TileSet.NORTH + "F"
+    WEST: str = TileSet.WEST + "F"
+    EAST: str = TileSet.EAST + "F"
+    SOUTH: str = TileSet.SOUTH + "F"
+    # space reserved for the size attributes, known at the end only
+    HEADER_SIZE: int = 256
+    RUN = re.compile("1+")
+
+    def __init__(self, cell_size: int = 30,
+                 wall_thickness: Optional[int] = None, palette: int = 0,
+                 show_path: bool = True) -> None:
+        """
+        Set the drawing options.
+
+        Args:
+            cell_size (int): Size of a cell in pixels.
+            wall_thickness (int | None): Thickness of the walls in pixels,
+                cell_size // 10 (at least 1) by default.
+            palette (int): Index of the palette in TileSet.PALETTES.
+            show_path (bool): Whether to draw the solution path.
+        """
+        self.cell_size: int = cell_size
+        self.wall_thickness: int = (
+                max(1, cell_size // 10) if wall_thickness is None
+                else wall_thickness
+                )
+        self.colors = TileSet.PALETTES[palette % len(TileSet.PALETTES)]
+        self.show_path: bool = show_path
+        self.tables = {
+                name: str.maketrans({c: "1" if c in digits else "0"
+                                     for c in TileSet.NIBBLES})
+                for name, digits in (("N", self.NORTH), ("W", self.WEST),
+                                     ("E", self.EAST), ("S", self.SOUTH),
+                                     ("F", "F"))
+                }
+
+    @staticmethod
+    def color(color: int) -> str:
+        """Format a 0xRRGGBB color for SVG."""
+        return f"#{color:06x}"
+
+    def runs(self, row: str, side: str) -> Iterator[Tuple[int, int]]:
+        """
+        Find the runs of cells of a row having a wall on one side.
+
+        Args:
+            row (str): Hex digits of the row.
+            side (str): N, S, W, E or F for 42 blocks.
+
+        Yields:
+            tuple: Start column and length of every run.
+        """
+        for match in self.RUN.finditer(row.translate(self.tables[side])):
+            yield match.start(), match.end() - match.start()
+
+    def header(self, cols: int, rows: int) -> str:
+        """Opening tag, padded to HEADER_SIZE characters."""
+        size = self.cell_size
+        text = (
+                '<svg xmlns="http://www.w3.org/2000/svg" '
+                f'width="{cols * size}" height="{rows * size}" '
+                f'viewBox="0 0 {cols} {rows}"'
+                )
+        return text.ljust(self.HEADER_SIZE - 2) + ">\n"
+
+    def style(self) -> str:
+        """Styles of the walls, the path and the 42 blocks."""
+        thick = self.wall_thickness / self.cell_size
+        return (
+                "<style>"
+                f".w{{stroke:{self.color(self.colors['wall'])};"
+                f"stroke-width:{thick:g};stroke-linecap:square;fill:none}}"
+                f".p{{stroke:{self.color(self.colors['path'])};"
+                "stroke-width:0.6;stroke-linejoin:round;fill:none}"
+                f".f{{fill:{self.color(self.colors['wall'])}}}"
+                "</style>\n"
+                f'<rect width="100%" height="100%" '
+                f'fill="{self.color(TileSet.BACKGROUND)}"/>\n'
+                )
+
+    def write(self, out: TextIO, lines: Iterable[str]) -> Tuple[int, int]:
+        """
+        Stream a maze from the lines of its output file into SVG.
+
+        Wall segments are emitted while the rows are read: a horizontal
+        run as soon as its row is read, a vertical run when the column
+        stops having a west wall. Only the start of the open vertical
+        runs is kept, one per column boundary.
+
+        Args:
+            out (TextIO): Seekable file receiving the image.
+            lines (Iterable[str]): Lines of the maze file: hex rows, a
+                blank line, the entry, the exit and the path.
+
+        Returns:
+            tuple: Size of the maze (cols, rows).
+        """
+        start = out.tell()
+        out.write(" " * self.HEADER_SIZE)
+        out.write(self.style())
+        blocks: List[str] = []
+        out.write('<path class="w" d="')
+        it = iter(lines)
+        open_runs: List[Optional[int]] = []
+        cols = rows = 0
+        last = ""
+        for line in it:
+            row = line.strip()
+            if not row:
+                break
+            if not open_runs:
+                cols = len(row)
+                open_runs = [None] * (cols + 1)
+            y = rows
+            segments = [f"M{x} {y}h{n}" for x, n in self.runs(row, "N")]
+            blocks.extend(f'<rect class="f" x="{x}" y="{y}" '
+                          f'width="{n}" height="1"/>\n'
+                          for x, n in self.runs(row, "F"))
+
+            # vertical runs: west walls, plus the east wall of the row
+            bits = row.translate(self.tables["W"])
+            bits += "1" if row[-1] in self.EAST else "0"
+            for x, bit in enumerate(bits):
+                top = open_runs[x]
+                if bit == "1":
+                    if top is None:
+                        open_runs[x] = y
+                elif top is not None:
+                    segments.append(f"M{x} {top}v{y - top}")
+                    open_runs[x] = None
+            out.write("".join(segments) + "\n")
+            last = row
+            rows += 1
+
+        segments = [f"M{x} {rows}h{n}" for x, n in self.runs(last, "S")]
+        segments.extend(f"M{x} {top}v{rows - top}"
+                        for x, top in enumerate(open_runs) if top is not None)
+        out.write("".join(segments) + '"/>\n')
+        # 42 blocks are drawn over the walls, like the renderers do
+        out.writelines(blocks)
+
+        extra = [line.strip() for line, _ in zip(it, range(3))]
+        if len(extra) >= 2:
+            entry = tuple(int(v) for v in extra[0].split(","))
+            exit = tuple(int(v) for v in extra[1].split(","))
+            path = extra[2] if len(extra) > 2 else ""
+            if self.show_path and path:
+                self.write_path(out, entry, path)  # type: ignore
+            for (x, y), color in ((entry, TileSet.ENTRY_COLOR),
+                                  (exit, TileSet.EXIT_COLOR)):
+                out.write(f'<rect x="{x + .35:g}" y="{y + .35:g}" '
+                          'width="0.3" height="0.3" '
+                          f'fill="{self.color(color)}"/>\n')
+        out.write("</svg>\n")
+
+        # the size is only known now: fill the reserved header
+        end = out.tell()
+        out.seek(start)
+        out.write(self.header(cols, rows))
+        out.seek(end)
+        return cols, rows
+
+    def write_path(self, out: TextIO, entry: Tuple[int, int],
+                   path: str) -> None:
+        """
+        Write the solution as one polyline through the cell centers.
+
+        Only the turns are written: collinear moves are merged.
+
+        Args:
+            out (TextIO): File receiving the image.
+            entry (tuple): Entry coordinates (x, y).
+            path (str): Solution path as N/S/E/W directions.
+        """
+        x, y = entry
+        out.write(f'<polyline class="p" points="{x + .5:g},{y + .5:g}')
+        for k, direction in enumerate(path):
+            ox, oy = MazeGenerator.offset[direction]
+            x, y = x + ox, y + oy
+            if k + 1 == len(path) or path[k + 1] != direction:
+                out.write(f" {x + .5:g},{y + .5:g}")
+        out.write('"/>\n')
+
+    def export_file(self, maze_file: str, svg_file: str) -> Tuple[int, int]:
+        """
+        Export a maze output file as an SVG image.
+
+        Args:
+            maze_file (str): File written by MazeGenerator.export_to_txt.
+            svg_file (str): Path of the image file.
+
+        Returns:
+            tuple: Size of the maze (cols, rows).
+        """
+        with open(maze_file, "r") as f, open(svg_file, "w") as out:
+            return self.write(out, f)
+
+    def export_maze(self, maze: MazeGenerator,
+                    svg_file: str) -> Tuple[int, int]:
+        """
+        Export a generated maze as an SVG image.
+
+        Args:
+            maze (MazeGenerator): The generated maze.
+            svg_file (str): Path of the image file.
+
+        Returns:
+            tuple: Size of the maze (cols, rows).
+        """
+        def lines() -> Iterator[str]:
+            for row in maze.grid:
+                yield "".join(cell.hex_repr for cell in row)
+            yield ""
+            yield "{},{}".format(*maze.entry)
+            yield "{},{}".format(*maze.exit)
+            yield maze.path
+
+        with open(svg_file, "w") as out:
+            return self.write(out, lines())
+
+
+def main() -> None:
+    """Export a maze output file as an SVG image."""
+    parser = argparse.ArgumentParser(description="Export a maze as SVG")
+    parser.add_argument("maze_file", help="file written by a_maze_ing.py")
+    parser.add_argument("image", help="output image, .svg")
+    parser.add_argument("--cell-size", type=int, default=30)
+    parser.add_argument("--wall-thickness", type=int, default=None)
+    parser.add_argument("--palette", type=int, default=0)
+    parser.add_argument("--no-path", action="store_true",
+                        help="do not draw the solution path")
+    args = parser.parse_args()
+
+    exporter = SvgExporter(args.cell_size, args.wall_thickness,
+                           args.palette, not args.no_path)
+    cols, rows = exporter.export_file(args.maze_file, args.image)
+    print(f"{cols}x{rows} maze written to {args.image}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,139 @@
+#!/usr/bin/env python3
+# File: tile_set.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/02 10:12:31
+# Updated: 2026/02/02 10:12:31
+
+from typing import Dict, List, Optional, Tuple
+
+
+class TileSet:
+    """
+    Pre-rendered BGRA sprites for every wall nibble of a maze cell.
+
+    A tile is stored as a list of byte strings, one per pixel row, so
+    that a renderer can copy it into an image buffer row by row with
+    memoryview slice assignment instead of writing pixels one by one.
+    """
+
+    # Hex digits having the matching wall drawn (F is a full 42 block)
+    NORTH: str = "13579BD"
+    SOUTH: str = "4567CDE"
+    EAST: str = "2367ABE"
+    WEST: str = "89ABCDE"
+    NIBBLES: str = "0123456789ABCDEF"
+
+    # Colors shared by every renderer drawing pixels
+    BACKGROUND: int = 0x1A1A1A
+    ENTRY_COLOR: int = 0x00FFFF
+    EXIT_COLOR: int = 0xFFFF00
+    PALETTES: List[Dict[str, int]] = [
+            {"wall": 0x00CC00, "path": 0x106050},  # green
+            {"wall": 0x00ECFF, "path": 0x156055},  # cyan
+            {"wall": 0xFF15F0, "path": 0x850065},  # pink
+            {"wall": 0xFF7F50, "path": 0x852520},  # orange
+            ]
+    PALETTE_NAMES: List[str] = ["green", "cyan", "pink", "orange"]
+
+    def __init__(self, cell_size: int, wall_thickness: int) -> None:
+        """
+        Initialize an empty tile set for the given geometry.
+
+        Args:
+            cell_size (int): Size of a cell in pixels.
+            wall_thickness (int): Thickness of the walls in pixels.
+        """
+        self.cell_size: int = cell_size
+        self.wall_thickness: int = wall_thickness
+        self.tiles: Dict[Tuple[str, int, int, Optional[int]],
+                         List[bytes]] = {}
+
+    @staticmethod
+    def pixel(color: int) -> bytes:
+        """
+        Convert a 0xRRGGBB color into a BGRA pixel.
+
+        Args:
+            color (int): Color to convert.
+
+        Returns:
+            bytes: The 4 bytes of the pixel in image buffer order.
+        """
+        return bytes((color & 0xFF, (color >> 8) & 0xFF,
+                      (color >> 16) & 0xFF, 255))
+
+    def render(self, nibble: str, fill: int, wall: int,
+               marker: Optional[int] = None) -> List[bytes]:
+        """
+        Render one tile following the drawing rules of MazeRenderer.
+
+        The cell is filled first, then its walls are painted on top
+        and finally the entry/exit marker is drawn in the middle.
+
+        Args:
+            nibble (str): Hex digit describing the walls of the cell.
+            fill (int): Background color of the cell.
+            wall (int): Color of the walls.
+            marker (int | None): Color of the entry/exit square if any.
+
+        Returns:
+            List[bytes]: One byte string per pixel row.
+        """
+        size: int = self.cell_size
+        thick: int = self.wall_thickness
+        fill_px: bytes = self.pixel(fill)
+        wall_px: bytes = self.pixel(wall)
+
+        # start from the background, then paint walls over it
+        pixels: List[List[bytes]] = [[fill_px] * size for _ in range(size)]
+        for y in range(size):
+            if (nibble in self.NORTH and y < thick) or \
+                    (nibble in self.SOUTH and y >= size - thick):
+                pixels[y] = [wall_px] * size
+                continue
+            if nibble in self.WEST:
+                pixels[y][:thick] = [wall_px] * thick
+            if nibble in self.EAST:
+                pixels[y][size - thick:] = [wall_px] * thick
+
+        # entry/exit square, drawn over everything else
+        if marker is not None:
+            fraction: int = size // 3
+            marker_px: bytes = self.pixel(marker)
+            for y in range(fraction, 2 * fraction):
+                pixels[y][fraction:2 * fraction] = [marker_px] * fraction
+        return [b"".join(row) for row in pixels]
+
+    def get(self, nibble: str, fill: int, wall: int,
+            marker: Optional[int] = None) -> List[bytes]:
+        """
+        Return a tile, rendering and caching it on first use.
+
+        Args:
+            nibble (str): Hex digit describing the walls of the cell.
+            fill (int): Background color of the cell.
+            wall (int): Color of the walls.
+            marker (int | None): Color of the entry/exit square if any.
+
+        Returns:
+            List[bytes]: One byte string per pixel row.
+        """
+        key = (nibble, fill, wall, marker)
+        tile = self.tiles.get(key)
+        if tile is None:
+            tile = self.render(nibble, fill, wall, marker)
+            self.tiles[key] = tile
+        return tile
+
+    def prerender(self, wall: int, fills: List[int]) -> None:
+        """
+        Render the 16 wall nibbles for a palette in one go.
+
+        Args:
+            wall (int): Color of the walls.
+            fills (List[int]): Background colors to render (path, bg...).
+        """
+        for fill in fills:
+            for nibble in self.NIBBLES:
+                self.get(nibble, fill, wall)
@@ -0,0 +1,328 @@
+#!/usr/bin/env python3
+# File: viewport.py
+# Author: ebabun <ebabun@student.42belgium.be>
+# Author: mmeurer <mmeurer@student.42belgium.be>
+# Created: 2026/02/09 11:05:18
+# Updated: 2026/02/09 11:05:18
+
+from collections import OrderedDict
+from typing import Dict, List, Optional, Set, Tuple
+from tile_set import TileSet
+
+
+class Viewport:
+    """
+    Zoomable and pannable view on a maze too large for the screen.
+
+    Zoom levels either draw every visible cell at full detail with the
+    nibble tiles, or draw a mipmap of wall densities where one pixel
+    covers a square block of cells. Frames are composed from square
+    screen tiles that are cached, so that the cost of a frame depends
+    on the window size and not on the maze size.
+    """
+
+    TILE: int = 128
+    # pixels per cell of the detailed levels, dividing TILE
+    DETAIL_SIZES: List[int] = [32, 16, 8, 4]
+    CACHE_TILES: int = 512
+    MARKER: int = 5
+    # density code of the path, above the wall densities
+    MAX_DENSITY: int = 250
+    PATH: int = 251
+
+    def __init__(self, content: List[str], entry: Tuple[int, int],
+                 exit: Tuple[int, int], path_cells: Set[Tuple[int, int]],
+                 width: int, height: int) -> None:
+        """
+        Start with the whole maze visible.
+
+        Args:
+            content (List[str]): Hex rows of the maze.
+            entry (tuple): Entry coordinates (x, y).
+            exit (tuple): Exit coordinates (x, y).
+            path_cells (set): Cells of the solution path.
+            width (int): Width of the view in pixels.
+            height (int): Height of the view in pixels.
+        """
+        self.content: List[str] = content
+        self.rows: int = len(content)
+        self.cols: int = len(content[0]) if content else 0
+        self.entry: Tuple[int, int] = entry
+        self.exit: Tuple[int, int] = exit
+        self.path_cells: Set[Tuple[int, int]] = path_cells
+        self.width: int = width
+        self.height: int = height
+
+        # zoom levels: ("detail", pixels per cell) then ("mip", m)
+        # where a pixel covers 2**m x 2**m cells
+        self.levels: List[Tuple[str, int]] = [
+                ("detail", size) for size in self.DETAIL_SIZES
+                ]
+        m = 0
+        while True:
+            self.levels.append(("mip", m))
+            w, h = self.level_size(len(self.levels) - 1)
+            if w <= width and h <= height:
+                break
+            m += 1
+        self.level: int = len(self.levels) - 1
+        for idx, _ in enumerate(self.levels):
+            w, h = self.level_size(idx)
+            if w <= width and h <= height:
+                self.level = idx
+                break
+        self.x: int = 0
+        self.y: int = 0
+
+        self.tile_sets: Dict[int, TileSet] = {}
+        self.mips: List[List[bytes]] = []
+        self.mip_marks: Dict[int, Dict[Tuple[int, int],
+                                       List[Tuple[int, int]]]] = {}
+        self.tables: Dict[Tuple[int, Optional[int]], List[bytes]] = {}
+        self.tiles: OrderedDict[tuple, bytes] = OrderedDict()
+
+    def level_size(self, level: int) -> Tuple[int, int]:
+        """Size in pixels of the whole maze at a zoom level."""
+        kind, value = self.levels[level]
+        if kind == "detail":
+            return self.cols * value, self.rows * value
+        block = 1 << value
+        return (-(-self.cols // block), -(-self.rows // block))
+
+    def cells_per_pixel(self, level: int) -> float:
+        """Number of cells covered by one pixel along an axis."""
+        kind, value = self.levels[level]
+        if kind == "detail":
+            return 1 / value
+        return float(1 << value)
+
+    def clamp(self) -> None:
+        """Keep the view inside the maze."""
+        w, h = self.level_size(self.level)
+        self.x = max(0, min(self.x, w - self.width))
+        self.y = max(0, min(self.y, h - self.height))
+
+    def pan(self, dx: float, dy: float) -> None:
+        """
+        Move the view by a fraction of its size.
+
+        Args:
+            dx (float): Horizontal move, 1.0 being the view width.
+            dy (float): Vertical move, 1.0 being the view height.
+        """
+        self.x += int(dx * self.width)
+        self.y += int(dy * self.height)
+        self.clamp()
+
+    def zoom(self, step: int) -> bool:
+        """
+        Zoom in (negative step) or out, keeping the view center.
+
+        Args:
+            step (int): Number of levels to move by.
+
+        Returns:
+            bool: True if the zoom level changed.
+        """
+        level = max(0, min(len(self.levels) - 1, self.level + step))
+        if level == self.level:
+            return False
+        # center of the view, in cells
+        old = self.cells_per_pixel(self.level)
+        cx = (self.x + self.width / 2) * old
+        cy = (self.y + self.height / 2) * old
+        self.level = level
+        new = self.cells_per_pixel(level)
+        self.x = int(cx / new - self.width / 2)
+        self.y = int(cy / new - self.height / 2)
+        self.clamp()
+        return True
+
+    def get_mip(self, m: int) -> List[bytes]:
+        """
+        Return the wall densities of mipmap level m, one row per bytes.
+
+        Level 0 has one density per cell, from the number of walls of
+        its nibble. Each next level averages 2x2 blocks of the previous
+        one. Levels are computed once, on first use.
+        """
+        if not self.mips:
+            scale = self.MAX_DENSITY // 4
+            table = bytearray(256)
+            for nibble in TileSet.NIBBLES:
+                table[ord(nibble)] = bin(int(nibble, 16)).count("1") * scale
+            table[ord("F")] = self.MAX_DENSITY
+            self.mips.append([line.encode().translate(table)
+                              for line in self.content])
+        while len(self.mips) <= m:
+            prev = self.mips[-1]
+            level: List[bytes] = []
+            for k in range(0, len(prev), 2):
+                a = prev[k]
+                b = prev[k + 1] if k + 1 < len(prev) else a
+                if len(a) % 2:
+                    a, b = a + a[-1:], b + b[-1:]
+                level.append(bytes(
+                    (w + x + y + z) >> 2
+                    for w, x, y, z in zip(a[::2], a[1::2], b[::2], b[1::2])
+                    ))
+            self.mips.append(level)
+        return self.mips[m]
+
+    def get_marks(self, m: int) -> Dict[Tuple[int, int],
+                                        List[Tuple[int, int]]]:
+        """Pixels of mipmap level m covering the path, by screen tile."""
+        if m not in self.mip_marks:
+            marks: Dict[Tuple[int, int], List[Tuple[int, int]]] = {}
+            for x, y in {(x >> m, y >> m) for x, y in self.path_cells}:
+                key = (x // self.TILE, y // self.TILE)
+                marks.setdefault(key, []).append((x, y))
+            self.mip_marks[m] = marks
+        return self.mip_marks[m]
+
+    def get_tables(self, wall: int, path: Optional[int]) -> List[bytes]:
+        """
+        Translation tables turning densities into each pixel channel.
+
+        Densities blend the background into the wall color, the PATH
+        code gives the path color.
+        """
+        key = (wall, path)
+        if key not in self.tables:
+            tables = [bytearray(256) for _ in range(4)]
+            colors = {self.PATH: TileSet.BACKGROUND if path is None else path}
+            bg = TileSet.pixel(TileSet.BACKGROUND)
+            fg = TileSet.pixel(wall)
+            for d in range(256):
+                if d in colors:
+                    px = TileSet.pixel(colors[d])
+                else:
+                    t = min(d, self.MAX_DENSITY) / self.MAX_DENSITY
+                    px = bytes(int(b + (f - b) * t) for b, f in zip(bg, fg))
+                for c in range(4):
+                    tables[c][d] = px[c]
+            self.tables[key] = [bytes(table) for table in tables]
+        return self.tables[key]
+
+    def render_detail(self, size: int, tx: int, ty: int, wall: int,
+                      path: Optional[int]) -> bytes:
+        """Render a screen tile of a detailed level with the cell tiles."""
+        tile_set = self.tile_sets.get(size)
+        if tile_set is None:
+            tile_set = TileSet(size, max(1, size // 10))
+            self.tile_sets[size] = tile_set
+        per_tile = self.TILE // size
+        blank = tile_set.get("0", TileSet.BACKGROUND, TileSet.BACKGROUND)
+        rows: List[bytes] = []
+        for i in range(ty * per_tile, (ty + 1) * per_tile):
+            line = self.content[i] if i < self.rows else ""
+            cells: List[List[bytes]] = []
+            for j in range(tx * per_tile, (tx + 1) * per_tile):
+                if j >= len(line):
+                    cells.append(blank)
+                    continue
+                cell = line[j]
+                fill = TileSet.BACKGROUND
+                if cell == "F":
+                    fill = wall
+                elif path is not None and (j, i) in self.path_cells:
+                    fill = path
+                marker: Optional[int] = None
+                if (j, i) == self.entry:
+                    marker = TileSet.ENTRY_COLOR
+                elif (j, i) == self.exit:
+                    marker = TileSet.EXIT_COLOR
+                cells.append(tile_set.get(cell, fill, wall, marker))
+            for r in range(size):
+                rows.append(b"".join(t[r] for t in cells))
+        return b"".join(rows)
+
+    def render_mip(self, m: int, tx: int, ty: int, wall: int,
+                   path: Optional[int]) -> bytes:
+        """Render a screen tile of a mipmap level from the densities."""
+        size = self.TILE
+        tables = self.get_tables(wall, path)
+        mip = self.get_mip(m)
+        x0 = tx * size
+        rows: List[bytearray] = []
+        for y in range(ty * size, (ty + 1) * size):
+            row = bytearray(mip[y][x0:x0 + size] if y < len(mip) else b"")
+            row.extend(bytes(size - len(row)))
+            rows.append(row)
+        if path is not None:
+            for x, y in self.get_marks(m).get((tx, ty), []):
+                rows[y - ty * size][x - x0] = self.PATH
+
+        buf = bytearray(size * size * 4)
+        for r, row in enumerate(rows):
+            start = r * size * 4
+            for c in range(4):
+                buf[start + c:start + size * 4:4] = row.translate(tables[c])
+
+        # entry and exit squares, visible whatever the zoom
+        for (cx, cy), color in ((self.entry, TileSet.ENTRY_COLOR),
+                                (self.exit, TileSet.EXIT_COLOR)):
+            px = TileSet.pixel(color)
+            half = self.MARKER // 2
+            for y in range((cy >> m) - half, (cy >> m) + half + 1):
+                if not ty * size <= y < (ty + 1) * size:
+                    continue
+                left = max(x0, (cx >> m) - half)
+                right = min(x0 + size, (cx >> m) + half + 1)
+                if left < right:
+                    start = ((y - ty * size) * size + left - x0) * 4
+                    buf[start:start + (right - left) * 4] = px * (right - left)
+        return bytes(buf)
+
+    def get_tile(self, tx: int, ty: int, wall: int,
+                 path: Optional[int]) -> bytes:
+        """Return a screen tile of the current level, cached as LRU."""
+        key = (self.level, tx, ty, wall, path)
+        tile = self.tiles.get(key)
+        if tile is not None:
+            self.tiles.move_to_end(key)
+            return tile
+        kind, value = self.levels[self.level]
+        if kind == "detail":
+            tile = self.render_detail(value, tx, ty, wall, path)
+        else:
+            tile = self.render_mip(value, tx, ty, wall, path)
+        self.tiles[key] = tile
+        if len(self.tiles) > self.CACHE_TILES:
+            self.tiles.popitem(last=False)
+        return tile
+
+    def draw(self, data: memoryview, size_line: int, wall: int,
+             path: Optional[int]) -> None:
+        """
+        Compose the visible part of the maze into an image buffer.
+
+        Args:
+            data (memoryview): Image buffer, 4 bytes per pixel.
+            size_line (int): Number of bytes per image row.
+            wall (int): Color of the walls.
+            path (int | None): Color of the solution, None to hide it.
+        """
+        size = self.TILE
+        row_len = size * 4
+        first_tx = self.x // size
+        last_tx = (self.x + self.width - 1) // size
+        last_ty = (self.y + self.height - 1) // size
+        for ty in range(self.y // size, last_ty + 1):
+            tiles = [self.get_tile(tx, ty, wall, path)
+                     for tx in range(first_tx, last_tx + 1)]
+            top = max(self.y, ty * size)
+            bottom = min(self.y + self.height, (ty + 1) * size)
+            for y in range(top, bottom):
+                offset = (y - self.y) * size_line
+                src_row = (y - ty * size) * row_len
+                # first tile may start left of the view
+                skip = (self.x - first_tx * size) * 4
+                remaining = self.width * 4
+                for tile in tiles:
+                    n = min(row_len - skip, remaining)
+                    start = src_row + skip
+                    data[offset:offset + n] = tile[start:start + n]
+                    offset += n
+                    remaining -= n
+                    skip = 0